@@ -0,0 +1,92 @@
+# api/json_stream.py
+# Incremental reader for large raw API payloads
+
+import json
+import re
+from typing import Any, Iterator, List, TextIO
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+# Characters that may follow an array element
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def iter_array_items(fp: TextIO, key: str, chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Yield the elements of the JSON array stored under `key` one at a time.
+
+    Only a read chunk plus the element currently being decoded are held in
+    memory, so files of any size are streamed with flat memory use. The first
+    occurrence of `"key": [` (or `"key": null`) in the document is used, which
+    matches the `{"events": [...]}` shape TheSportsDB returns.
+    """
+    key_re = re.compile(r'"%s"\s*:\s*(\[|null)' % re.escape(key))
+    buffer = ""
+    eof = False
+
+    def read_more() -> bool:
+        nonlocal buffer, eof
+        data = fp.read(chunk_size)
+        if not data:
+            eof = True
+            return False
+        buffer += data
+        return True
+
+    # Locate the start of the array, keeping a short tail in case the key spans chunks
+    while True:
+        match = key_re.search(buffer)
+        if match:
+            if match.group(1) == "null":
+                return
+            buffer = buffer[match.end():]
+            break
+        if not read_more():
+            return
+        buffer = buffer[-(chunk_size + len(key) + 16):]
+
+    pos = 0
+    while True:
+        # Skip separators between elements
+        while True:
+            while pos < len(buffer) and (buffer[pos] in _WHITESPACE or buffer[pos] == ","):
+                pos += 1
+            if pos < len(buffer) or not read_more():
+                break
+        if pos >= len(buffer):
+            raise ValueError(f"Unexpected end of file inside '{key}' array")
+        if buffer[pos] == "]":
+            return
+
+        try:
+            item, end = _DECODER.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            buffer = buffer[pos:]
+            pos = 0
+            read_more()
+            continue
+        # A number cut at the chunk boundary ("4500." | "25") decodes as a shorter value;
+        # only accept an element once a delimiter follows it or the file has ended
+        if not eof and (end >= len(buffer) or buffer[end] not in _DELIMITERS):
+            buffer = buffer[pos:]
+            pos = 0
+            read_more()
+            continue
+
+        yield item
+        buffer = buffer[end:]
+        pos = 0
+
+
+def iter_batches(items: Iterator[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Group an iterator into lists of at most `batch_size` items."""
+    batch: List[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
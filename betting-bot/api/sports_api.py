@@ -4,30 +4,43 @@
 import logging
 import aiohttp
 import asyncio
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 import json
+import hashlib
 import os
 from dotenv import load_dotenv
-import thesportsdb  # For thesportsdb API
 import aiosqlite  # For database operations
 
+try:
+    from .thesportsdb_client import TheSportsDBClient
+    from .rate_limiter import TokenBucket
+    from .json_stream import iter_array_items, iter_batches
+    from ..config.api_settings import (
+        API_RETRY_ATTEMPTS, API_RETRY_DELAY, THESPORTSDB_RATE_LIMIT, THESPORTSDB_RATE_BURST
+    )
+except ImportError:
+    from api.thesportsdb_client import TheSportsDBClient
+    from api.rate_limiter import TokenBucket
+    from api.json_stream import iter_array_items, iter_batches
+    from config.api_settings import (
+        API_RETRY_ATTEMPTS, API_RETRY_DELAY, THESPORTSDB_RATE_LIMIT, THESPORTSDB_RATE_BURST
+    )
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-# Log successful import of thesportsdb
-logger.info("Successfully imported thesportsdb module")
-
 class SportsAPI:
     def __init__(self, db_path: str = "data/betting.db"):
         self.session: Optional[aiohttp.ClientSession] = None
         self.api_key = os.getenv('API_KEY')
         self.db_path = db_path
-        # Set TheSportsDB API key
+        self.client: Optional[TheSportsDBClient] = None
+        self.rate_limiter = TokenBucket(THESPORTSDB_RATE_LIMIT, THESPORTSDB_RATE_BURST)
+        self._content_hash_ready = False
         if self.api_key:
-            os.environ["THESPORTSDB_API_KEY"] = self.api_key
             logger.info("TheSportsDB API key set successfully")
         else:
             logger.warning("No API_KEY found in .env; using default TheSportsDB free API")
@@ -36,6 +49,7 @@ class SportsAPI:
         """Initialize the API client session."""
         if not self.session:
             self.session = aiohttp.ClientSession()
+            self.client = TheSportsDBClient(self.session, self.api_key, rate_limiter=self.rate_limiter)
         logger.info("SportsAPI session started")
 
     async def close(self):
@@ -43,6 +57,7 @@ class SportsAPI:
         if self.session:
             await self.session.close()
             self.session = None
+            self.client = None
         logger.info("SportsAPI session closed")
 
     async def get_live_fixtures(self, league: str) -> List[Dict]:
@@ -54,8 +69,9 @@ class SportsAPI:
                 logger.error(f"Unknown league: {league}")
                 return []
 
-            # Fetch upcoming events using thesportsdb
-            events_data = thesportsdb.events.nextLeagueEvents(league_id)
+            # Fetch upcoming events from TheSportsDB
+            await self.start()
+            events_data = await self.client.next_league_events(league_id)
             if not events_data or "events" not in events_data:
                 logger.error(f"No events found for league {league} (ID: {league_id})")
                 return []
@@ -77,8 +93,65 @@ class SportsAPI:
             logger.error(f"Error getting live fixtures: {str(e)}")
             return []
 
-    async def fetch_and_save_daily_games(self):
-        """Fetch scheduled games for all leagues and save raw JSON."""
+    async def _fetch_league_events(self, league: str, league_id: str) -> Optional[Dict]:
+        """
+        Fetch upcoming events for one league, retrying failed requests with
+        exponential backoff (API_RETRY_DELAY, doubled per attempt).
+        Returns the raw payload, or None if every attempt failed.
+        """
+        attempts = max(1, API_RETRY_ATTEMPTS)
+        for attempt in range(1, attempts + 1):
+            events_data = await self.client.next_league_events(league_id)
+            if events_data is not None:
+                return events_data
+            if attempt < attempts:
+                delay = API_RETRY_DELAY * (2 ** (attempt - 1))
+                logger.warning(
+                    f"Fetch for {league} (ID: {league_id}) failed (attempt {attempt}/{attempts}); "
+                    f"retrying in {delay}s"
+                )
+                await asyncio.sleep(delay)
+        logger.error(f"Giving up on {league} (ID: {league_id}) after {attempts} attempts")
+        return None
+
+    def _write_raw_events(self, file_path: str, events_data: Dict) -> bool:
+        """
+        Write a league's raw events payload to disk (run in a worker thread).
+        Returns False without touching the file if the existing snapshot is identical.
+        """
+        payload = json.dumps(events_data, indent=2)
+        if os.path.exists(file_path):
+            with open(file_path, "r") as f:
+                if f.read() == payload:
+                    return False
+        with open(file_path, "w") as f:
+            f.write(payload)
+        return True
+
+    async def _save_league_events(
+        self, league: str, league_id: str, events_data: Optional[Dict],
+        raw_data_dir: str, current_date: str
+    ) -> Optional[str]:
+        """Persist one league's payload and return the file path, or None if nothing was saved."""
+        if not events_data or "events" not in events_data:
+            logger.warning(f"No events found for league {league} (ID: {league_id})")
+            return None
+
+        file_path = os.path.join(raw_data_dir, f"{current_date}_{league}.json")
+        if await asyncio.to_thread(self._write_raw_events, file_path, events_data):
+            logger.info(f"Saved raw JSON for {league} to {file_path}")
+        else:
+            logger.info(f"Raw JSON for {league} unchanged, kept {file_path}")
+        return file_path
+
+    async def fetch_and_save_daily_games(self, concurrent: bool = True):
+        """
+        Fetch scheduled games for all leagues and save raw JSON.
+
+        With `concurrent=True` all leagues are requested in parallel (bounded by the
+        client's semaphore and token-bucket rate limiter) and each file is written as
+        soon as its league returns. `concurrent=False` keeps the one-league-at-a-time loop.
+        """
         try:
             # Ensure API session is started
             await self.start()
@@ -91,28 +164,37 @@ class SportsAPI:
             current_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
             saved_files = []
 
-            # Iterate through all supported leagues
+            leagues = []
             for league, league_id in self._get_league_mappings().items():
                 if not league_id:
                     logger.info(f"Skipping unsupported league: {league}")
                     continue
+                leagues.append((league, league_id))
 
+            async def fetch_and_save(league: str, league_id: str) -> Optional[str]:
                 try:
-                    # Fetch upcoming events
-                    events_data = thesportsdb.events.nextLeagueEvents(league_id)
-                    if not events_data or "events" not in events_data:
-                        logger.warning(f"No events found for league {league} (ID: {league_id})")
-                        continue
-
-                    # Save raw JSON
-                    file_path = os.path.join(raw_data_dir, f"{current_date}_{league}.json")
-                    with open(file_path, "w") as f:
-                        json.dump(events_data, f, indent=2)
-                    saved_files.append(file_path)
-                    logger.info(f"Saved raw JSON for {league} to {file_path}")
-
+                    events_data = await self._fetch_league_events(league, league_id)
+                    return await self._save_league_events(
+                        league, league_id, events_data, raw_data_dir, current_date
+                    )
                 except Exception as e:
                     logger.error(f"Error fetching games for {league}: {str(e)}")
+                    return None
+
+            if concurrent:
+                started = asyncio.get_running_loop().time()
+                tasks = [asyncio.create_task(fetch_and_save(league, league_id)) for league, league_id in leagues]
+                for finished in asyncio.as_completed(tasks):
+                    file_path = await finished
+                    if file_path:
+                        saved_files.append(file_path)
+                elapsed = asyncio.get_running_loop().time() - started
+                logger.info(f"Fetched {len(leagues)} leagues concurrently in {elapsed:.1f}s ({len(saved_files)} saved)")
+            else:
+                for league, league_id in leagues:
+                    file_path = await fetch_and_save(league, league_id)
+                    if file_path:
+                        saved_files.append(file_path)
 
             return saved_files
 
@@ -120,8 +202,170 @@ class SportsAPI:
             logger.error(f"Error in fetch_and_save_daily_games: {str(e)}")
             return []
 
-    async def process_raw_games_to_db(self, json_file_path: str):
-        """Process raw JSON game data and insert into api_games table."""
+    _API_GAMES_UPSERT = """
+        INSERT INTO api_games (
+            id, sport, league_id, league_name, home_team_id, away_team_id,
+            start_time, end_time, status, score, venue, referee, content_hash
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            sport=excluded.sport,
+            league_id=excluded.league_id,
+            league_name=excluded.league_name,
+            home_team_id=excluded.home_team_id,
+            away_team_id=excluded.away_team_id,
+            start_time=excluded.start_time,
+            end_time=excluded.end_time,
+            status=excluded.status,
+            score=excluded.score,
+            venue=excluded.venue,
+            referee=excluded.referee,
+            content_hash=excluded.content_hash,
+            updated_at=CURRENT_TIMESTAMP
+    """
+
+    # Stay well under SQLite's bound-parameter limit for "id IN (...)" lookups
+    _ID_LOOKUP_CHUNK = 500
+    # Events parsed and written per batch while streaming a raw games file
+    _INGEST_BATCH_SIZE = 500
+
+    def _event_to_game_row(
+        self, event: Dict, sport: str, league_id: str, league_name: str
+    ) -> Optional[tuple]:
+        """
+        Validate and map one TheSportsDB event to an api_games row tuple
+        (column order of _API_GAMES_UPSERT). Returns None if the event must be skipped.
+        """
+        # Map thesportsdb fields to api_games schema
+        game_data = {
+            "id": int(event.get("idEvent", 0)) or None,
+            "sport": sport,
+            "league_id": int(league_id) if league_id else None,
+            "league_name": league_name,
+            "home_team_id": int(event.get("idHomeTeam", 0)) or None,
+            "away_team_id": int(event.get("idAwayTeam", 0)) or None,
+            "start_time": event.get("dateEvent", None),
+            "end_time": None,  # Not available in nextLeagueEvents
+            "status": "scheduled",
+            "score": None,
+            "venue": event.get("strVenue", None),
+            "referee": None,
+        }
+
+        # Validate and format start_time
+        if game_data["start_time"]:
+            try:
+                # Convert dateEvent (YYYY-MM-DD) to timestamp
+                dt = datetime.strptime(game_data["start_time"], "%Y-%m-%d")
+                game_data["start_time"] = dt.replace(tzinfo=timezone.utc).isoformat()
+            except ValueError:
+                logger.warning(f"Invalid start_time for event {game_data['id']}: {game_data['start_time']}")
+                game_data["start_time"] = None
+
+        # Skip if critical fields are missing
+        if not game_data["id"] or not game_data["sport"]:
+            logger.warning(f"Skipping event with missing id or sport: {event}")
+            return None
+
+        return (
+            game_data["id"],
+            game_data["sport"],
+            game_data["league_id"],
+            game_data["league_name"],
+            game_data["home_team_id"],
+            game_data["away_team_id"],
+            game_data["start_time"],
+            game_data["end_time"],
+            game_data["status"],
+            game_data["score"],
+            game_data["venue"],
+            game_data["referee"],
+        )
+
+    @staticmethod
+    def _game_row_hash(row: tuple) -> str:
+        """Stable content hash of an api_games row (all mapped columns)."""
+        payload = json.dumps(row, separators=(",", ":"), default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def _ensure_content_hash_column(self, db: aiosqlite.Connection):
+        """Add api_games.content_hash if an older database lacks it."""
+        if self._content_hash_ready:
+            return
+        async with db.execute("PRAGMA table_info(api_games)") as cursor:
+            columns = {row[1] for row in await cursor.fetchall()}
+        if "content_hash" not in columns:
+            logger.info("Adding column 'content_hash' to table 'api_games'...")
+            await db.execute("ALTER TABLE api_games ADD COLUMN content_hash TEXT NULL")
+        self._content_hash_ready = True
+
+    async def _existing_game_hashes(self, db: aiosqlite.Connection, game_ids: List[int]) -> Dict[int, Optional[str]]:
+        """Return {id: content_hash} for the `game_ids` that already exist in api_games."""
+        existing = {}
+        for offset in range(0, len(game_ids), self._ID_LOOKUP_CHUNK):
+            chunk = game_ids[offset:offset + self._ID_LOOKUP_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            async with db.execute(
+                f"SELECT id, content_hash FROM api_games WHERE id IN ({placeholders})", chunk
+            ) as cursor:
+                existing.update({row[0]: row[1] for row in await cursor.fetchall()})
+        return existing
+
+    async def _write_game_rows(self, db: aiosqlite.Connection, rows: List[tuple]) -> Tuple[int, int, int]:
+        """
+        Upsert a batch of api_games rows with executemany (no commit), skipping rows
+        whose content hash matches the stored one.
+        Returns (inserted, updated, unchanged) counts.
+        """
+        if not rows:
+            return 0, 0, 0
+        # Last occurrence of a duplicated id wins, matching sequential upserts
+        rows_by_id = {row[0]: row for row in rows}
+        existing = await self._existing_game_hashes(db, list(rows_by_id))
+
+        inserted = updated = unchanged = 0
+        changed_rows = []
+        for game_id, row in rows_by_id.items():
+            content_hash = self._game_row_hash(row)
+            if game_id not in existing:
+                inserted += 1
+            elif existing[game_id] == content_hash:
+                unchanged += 1
+                continue
+            else:
+                updated += 1
+            changed_rows.append(row + (content_hash,))
+
+        if changed_rows:
+            await db.executemany(self._API_GAMES_UPSERT, changed_rows)
+        return inserted, updated, unchanged
+
+    def _iter_game_rows(
+        self, events, counts: Dict[str, int], league: str,
+        sport: str, league_id: str, league_name: str
+    ):
+        """Map streamed events to api_games rows, counting skipped events as they go."""
+        for event in events:
+            try:
+                row = self._event_to_game_row(event, sport, league_id, league_name)
+            except Exception as e:
+                logger.error(f"Error processing event {event.get('idEvent', 'unknown')} for {league}: {str(e)}")
+                row = None
+            if row is None:
+                counts["skipped"] += 1
+            else:
+                yield row
+
+    async def process_raw_games_to_db(self, json_file_path: str) -> Dict[str, int]:
+        """
+        Process raw JSON game data and insert into api_games table.
+
+        Events are streamed from the file, validated and transformed in one pass,
+        and written with executemany in batches of _INGEST_BATCH_SIZE, so memory
+        stays flat regardless of file size. All batches share one transaction.
+        Events whose content hash matches api_games.content_hash are not rewritten.
+        Returns the per-file counts of inserted, updated, unchanged and skipped events.
+        """
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0}
         try:
             # Extract league from file name
             file_name = os.path.basename(json_file_path)
@@ -129,104 +373,45 @@ class SportsAPI:
             league_id = self._get_sport_from_league(league)
             if not league_id:
                 logger.error(f"Unknown league in file: {league}")
-                return
-
-            # Load raw JSON
-            with open(json_file_path, "r") as f:
-                events_data = json.load(f)
-
-            if (
-                not events_data
-                or "events" not in events_data
-                or not events_data["events"]
-            ):
-                logger.warning(f"No events in JSON file or 'events' is null/empty: {json_file_path}")
-                return
+                return counts
 
             # Map league to sport
             league_info = self._get_league_info(league)
             sport = league_info.get("sport", "Unknown")
             league_name = league_info.get("name", league)
 
-            # Connect to database
-            async with aiosqlite.connect(self.db_path) as db:
-                for event in events_data["events"]:
+            # Connect to database and write everything in one transaction
+            with open(json_file_path, "r") as f:
+                rows = self._iter_game_rows(
+                    iter_array_items(f, "events"), counts, league, sport, league_id, league_name
+                )
+                async with aiosqlite.connect(self.db_path) as db:
                     try:
-                        # Map thesportsdb fields to api_games schema
-                        game_data = {
-                            "id": int(event.get("idEvent", 0)) or None,
-                            "sport": sport,
-                            "league_id": int(league_id) if league_id else None,
-                            "league_name": league_name,
-                            "home_team_id": int(event.get("idHomeTeam", 0)) or None,
-                            "away_team_id": int(event.get("idAwayTeam", 0)) or None,
-                            "start_time": event.get("dateEvent", None),
-                            "end_time": None,  # Not available in nextLeagueEvents
-                            "status": "scheduled",
-                            "score": None,
-                            "venue": event.get("strVenue", None),
-                            "referee": None,
-                        }
-
-                        # Validate and format start_time
-                        if game_data["start_time"]:
-                            try:
-                                # Convert dateEvent (YYYY-MM-DD) to timestamp
-                                dt = datetime.strptime(game_data["start_time"], "%Y-%m-%d")
-                                game_data["start_time"] = dt.replace(tzinfo=timezone.utc).isoformat()
-                            except ValueError:
-                                logger.warning(f"Invalid start_time for event {game_data['id']}: {game_data['start_time']}")
-                                game_data["start_time"] = None
-
-                        # Skip if critical fields are missing
-                        if not game_data["id"] or not game_data["sport"]:
-                            logger.warning(f"Skipping event with missing id or sport: {event}")
-                            continue
-
-                        # Insert into api_games table
-                        await db.execute(
-                            """
-                            INSERT INTO api_games (
-                                id, sport, league_id, league_name, home_team_id, away_team_id,
-                                start_time, end_time, status, score, venue, referee
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            ON CONFLICT(id) DO UPDATE SET
-                                sport=excluded.sport,
-                                league_id=excluded.league_id,
-                                league_name=excluded.league_name,
-                                home_team_id=excluded.home_team_id,
-                                away_team_id=excluded.away_team_id,
-                                start_time=excluded.start_time,
-                                end_time=excluded.end_time,
-                                status=excluded.status,
-                                score=excluded.score,
-                                venue=excluded.venue,
-                                referee=excluded.referee,
-                                updated_at=CURRENT_TIMESTAMP
-                            """,
-                            (
-                                game_data["id"],
-                                game_data["sport"],
-                                game_data["league_id"],
-                                game_data["league_name"],
-                                game_data["home_team_id"],
-                                game_data["away_team_id"],
-                                game_data["start_time"],
-                                game_data["end_time"],
-                                game_data["status"],
-                                game_data["score"],
-                                game_data["venue"],
-                                game_data["referee"],
-                            )
-                        )
+                        await self._ensure_content_hash_column(db)
+                        for batch in iter_batches(rows, self._INGEST_BATCH_SIZE):
+                            inserted, updated, unchanged = await self._write_game_rows(db, batch)
+                            counts["inserted"] += inserted
+                            counts["updated"] += updated
+                            counts["unchanged"] += unchanged
                         await db.commit()
-                        logger.debug(f"Inserted/updated game {game_data['id']} for {league}")
+                    except Exception:
+                        await db.rollback()
+                        raise
+
+            if not any(counts.values()):
+                logger.warning(f"No events in JSON file or 'events' is null/empty: {json_file_path}")
+                return counts
 
-                    except Exception as e:
-                        logger.error(f"Error processing event {event.get('idEvent', 'unknown')} for {league}: {str(e)}")
+            logger.info(
+                f"Ingested {json_file_path}: {counts['inserted']} inserted, "
+                f"{counts['updated']} updated, {counts['unchanged']} unchanged (not rewritten), "
+                f"{counts['skipped']} skipped"
+            )
 
         except Exception as e:
+            counts["inserted"] = counts["updated"] = counts["unchanged"] = 0
             logger.error(f"Error processing JSON file {json_file_path}: {str(e)}")
+        return counts
 
     async def run_daily_fetch(self):
         """Run daily game fetch at 03:00 AM UTC."""
@@ -0,0 +1,108 @@
+# api/thesportsdb_client.py
+# Non-blocking client for the TheSportsDB endpoints used by the bot
+
+import logging
+import asyncio
+import os
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+try:
+    from .rate_limiter import TokenBucket
+    from ..config.api_settings import (
+        API_TIMEOUT, THESPORTSDB_BASE_URL, THESPORTSDB_MAX_CONCURRENCY
+    )
+except ImportError:
+    from api.rate_limiter import TokenBucket
+    from config.api_settings import (
+        API_TIMEOUT, THESPORTSDB_BASE_URL, THESPORTSDB_MAX_CONCURRENCY
+    )
+
+logger = logging.getLogger(__name__)
+
+# Public test key documented by TheSportsDB for the free tier
+DEFAULT_FREE_API_KEY = "3"
+
+
+class TheSportsDBClient:
+    """
+    Async replacement for the synchronous `thesportsdb` package.
+
+    Requests are issued on a shared aiohttp.ClientSession (normally the one opened
+    by SportsAPI.start()) and concurrent fan-out is bounded by a semaphore. An optional
+    TokenBucket caps the request rate across all callers sharing the client.
+    Every endpoint returns the decoded JSON payload, or None on any error, mirroring
+    how the callers previously treated exceptions from `thesportsdb`.
+    """
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        api_key: Optional[str] = None,
+        max_concurrency: int = THESPORTSDB_MAX_CONCURRENCY,
+        rate_limiter: Optional[TokenBucket] = None
+    ):
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self._owns_session = session is None
+        self.api_key = api_key or os.getenv('API_KEY') or DEFAULT_FREE_API_KEY
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+
+    async def start(self):
+        """Open a private session if none was supplied."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
+
+    async def close(self):
+        """Close the session only if this client created it."""
+        if self._owns_session and self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def _get_json(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
+        """GET `{base}/{key}/{endpoint}` and return the JSON body, or None on failure."""
+        if self.session is None or self.session.closed:
+            await self.start()
+        url = f"{THESPORTSDB_BASE_URL}/{self.api_key}/{endpoint}"
+        async with self._semaphore:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire()
+            try:
+                async with self.session.get(url, params=params, timeout=self._timeout) as response:
+                    if response.status != 200:
+                        logger.error(f"TheSportsDB {endpoint} returned HTTP {response.status} (params: {params})")
+                        return None
+                    # TheSportsDB sometimes serves JSON as text/html
+                    return await response.json(content_type=None)
+            except asyncio.TimeoutError:
+                logger.error(f"TheSportsDB {endpoint} timed out after {API_TIMEOUT}s (params: {params})")
+            except (aiohttp.ClientError, ValueError) as e:
+                logger.error(f"TheSportsDB {endpoint} request failed (params: {params}): {e}")
+        return None
+
+    async def next_league_events(self, league_id: str) -> Optional[Dict]:
+        """Upcoming events for a league (`eventsnextleague.php`)."""
+        return await self._get_json("eventsnextleague.php", {"id": league_id})
+
+    async def event_info(self, event_id: str) -> Optional[Dict]:
+        """Details for a single event (`lookupevent.php`)."""
+        return await self._get_json("lookupevent.php", {"id": event_id})
+
+    async def league_season_table(self, league_id: str, season: str) -> Optional[Dict]:
+        """Standings table for a league season (`lookuptable.php`)."""
+        return await self._get_json("lookuptable.php", {"l": league_id, "s": season})
+
+    async def league_teams(self, league_id: str) -> Optional[Dict]:
+        """All teams in a league (`lookup_all_teams.php`)."""
+        return await self._get_json("lookup_all_teams.php", {"id": league_id})
+
+    async def league_info(self, league_id: str) -> Optional[Dict]:
+        """League metadata including badge URLs (`lookupleague.php`)."""
+        return await self._get_json("lookupleague.php", {"id": league_id})
+
+    async def search_players(self, player_name: str) -> Optional[Dict]:
+        """Players matching a name (`searchplayers.php`)."""
+        return await self._get_json("searchplayers.php", {"p": player_name})
@@ -603,10 +603,7 @@ class AdminCog(commands.Cog):
         logger.info(f"Setup command initiated by {interaction.user} in guild {interaction.guild_id}")
         try:
             await interaction.response.defer(ephemeral=True)
-            existing_settings = await self.bot.db_manager.fetch_one(
-                "SELECT * FROM guild_settings WHERE guild_id = %s",
-                interaction.guild_id
-            )
+            existing_settings = await self.bot.admin_service.get_guild_settings(interaction.guild_id)
             if existing_settings:
                 view = discord.ui.View(timeout=300)
                 # Use instance methods for callbacks, passing context
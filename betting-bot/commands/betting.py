@@ -28,21 +28,18 @@ async def is_allowed_command_channel(interaction: Interaction) -> bool:
             except discord.HTTPException: pass # Ignore if followup fails (e.g. original interaction deleted)
         return False
 
-    if not hasattr(interaction.client, 'db_manager') or not interaction.client.db_manager: # type: ignore
-        logger.error("Database manager not found on bot client for command channel check.")
-        msg = "Bot configuration error (DBM). Cannot verify command channel."
+    if not hasattr(interaction.client, 'admin_service') or not interaction.client.admin_service: # type: ignore
+        logger.error("Admin service not found on bot client for command channel check.")
+        msg = "Bot configuration error (ADM). Cannot verify command channel."
         if not interaction.response.is_done(): await interaction.response.send_message(msg, ephemeral=True)
         else: 
             try: await interaction.followup.send(msg, ephemeral=True)
             except discord.HTTPException: pass
         return False
     
-    db_manager = interaction.client.db_manager # type: ignore
+    admin_service = interaction.client.admin_service # type: ignore
 
-    settings = await db_manager.fetch_one(
-        "SELECT command_channel_1, command_channel_2 FROM guild_settings WHERE guild_id = %s",
-        (interaction.guild_id,)
-    )
+    settings = await admin_service.get_guild_settings(interaction.guild_id)
 
     if not settings:
         msg = "Command channels are not configured for this server. Please ask an admin to set them up using `/setup` or a relevant admin command."
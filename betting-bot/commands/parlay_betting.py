@@ -14,7 +14,7 @@ import os
 import json 
 from discord.ext import commands
 from utils.errors import BetServiceError, ValidationError, GameNotFoundError
-from utils.image_generator import BetSlipGenerator
+from utils.image_generator import BetSlipGenerator, slip_filename
 from config.asset_paths import get_sport_category_for_path
 
 logger = logging.getLogger(__name__)
@@ -172,15 +172,9 @@ class BetDetailsModal(Modal):
             team_logo_path = None
             try:
                 league = self.view_ref.current_leg_construction_details.get('league', 'UNKNOWN')
-                logo_image = bet_slip_gen._load_team_logo(team_value, league)
-                if logo_image:
-                    normalized_team_name = bet_slip_gen._normalize_team_name(team_value)
-                    sport = get_sport_category_for_path(league.upper()) or 'OTHER_SPORTS'
-                    team_dir = os.path.join(bet_slip_gen.LEAGUE_TEAM_BASE_DIR, sport, league.upper())
-                    team_logo_path = os.path.join(team_dir, f"{normalized_team_name}.png")
-                    if not os.path.exists(team_logo_path):
-                        team_logo_path = bet_slip_gen.DEFAULT_LOGO_PATH
-                    logo_image.close()
+                team_logo_path = bet_slip_gen._team_logo_path(team_value, league)
+                if not team_logo_path or not os.path.exists(team_logo_path):
+                    team_logo_path = bet_slip_gen.DEFAULT_LOGO_PATH
             except Exception as e:
                 logger.warning(f"Failed to load team logo for {team_value} in league {league}: {e}")
                 team_logo_path = bet_slip_gen.DEFAULT_LOGO_PATH
@@ -399,7 +393,7 @@ class ParlayBetWorkflowView(View):
 
     async def get_bet_slip_generator(self) -> BetSlipGenerator:
         if self.bet_slip_generator is None:
-            self.bet_slip_generator = await self.bot.get_bet_slip_generator(self.original_interaction.guild_id)
+            self.bet_slip_generator = await self.bot.get_bet_slip_generator()
         return self.bet_slip_generator
 
     def _format_odds_with_sign(self, odds: Optional[Union[float, int]]) -> str:
@@ -588,10 +582,7 @@ class ParlayBetWorkflowView(View):
                 if not self.bet_details.get("total_odds_str"):
                     await self.edit_message_for_current_leg(interaction, content="❌ Total parlay odds not set. Please restart.", view=None); self.stop(); return
 
-                guild_settings = await self.bot.db_manager.fetch_one(
-                    "SELECT embed_channel_1, embed_channel_2 FROM guild_settings WHERE guild_id = %s",
-                    (self.original_interaction.guild_id,)
-                )
+                guild_settings = await self.bot.admin_service.get_guild_settings(self.original_interaction.guild_id)
                 configured_channel_objects = []
                 if guild_settings:
                     ids_to_check = filter(None, [guild_settings.get('embed_channel_1'), guild_settings.get('embed_channel_2')])
@@ -617,7 +608,7 @@ class ParlayBetWorkflowView(View):
                 file_to_send = None
                 if self.preview_image_bytes:
                     self.preview_image_bytes.seek(0)
-                    file_to_send = File(self.preview_image_bytes, filename=f"parlay_preview_s{self.current_step}.png")
+                    file_to_send = File(self.preview_image_bytes, filename=slip_filename(f"parlay_preview_s{self.current_step}"))
 
                 self.add_item(ConfirmButton(self))
                 content = "**Confirm Your Parlay**\n\n" + self._generate_parlay_summary_text()
@@ -710,7 +701,7 @@ class ParlayBetWorkflowView(View):
 
             team_logo_paths = [leg.get('team_logo_path', bet_slip_gen.DEFAULT_LOGO_PATH) for leg in legs]
 
-            bet_slip_image = await bet_slip_gen.generate_bet_slip(
+            slip_bytes = await bet_slip_gen.generate_bet_slip_bytes(
                 home_team="Multi-Game" if not is_sgp else legs[0].get('home_team', legs[0].get('team', 'Team A')),
                 away_team="Parlay" if not is_sgp else legs[0].get('away_team', legs[0].get('opponent', 'Team B')),
                 league=header_league,
@@ -721,15 +712,14 @@ class ParlayBetWorkflowView(View):
                 bet_type="parlay",
                 parlay_legs=legs,
                 is_same_game=is_sgp,
-                team_logo_paths=team_logo_paths
+                team_logo_paths=team_logo_paths,
+                guild_id=self.original_interaction.guild_id
             )
 
-            if bet_slip_image:
+            if slip_bytes:
                 if self.preview_image_bytes:
                     self.preview_image_bytes.close()
-                self.preview_image_bytes = io.BytesIO()
-                bet_slip_image.save(self.preview_image_bytes, format='PNG')
-                self.preview_image_bytes.seek(0)
+                self.preview_image_bytes = io.BytesIO(slip_bytes)
                 logger.debug(f"Parlay slip preview updated for bet {self.bet_details.get('bet_serial')} with units {units}.")
             else:
                 logger.warning(f"Failed to regen parlay preview for bet {self.bet_details.get('bet_serial')}.")
@@ -781,14 +771,14 @@ class ParlayBetWorkflowView(View):
             discord_file_to_send = None
             if self.preview_image_bytes:
                 self.preview_image_bytes.seek(0)
-                discord_file_to_send = File(self.preview_image_bytes, filename=f"parlay_slip_{bet_serial}.png")
+                discord_file_to_send = File(self.preview_image_bytes, filename=slip_filename(f"parlay_slip_{bet_serial}"))
             else:
                 logger.warning(f"Parlay {bet_serial}: No preview image available at submit. Attempting to regenerate.")
                 bet_slip_gen = await self.get_bet_slip_generator()
                 legs = details.get('legs', [])
                 is_sgp = len(set(leg.get("game_id") for leg in legs if leg.get("game_id"))) == 1 and len(legs) > 1
                 team_logo_paths = [leg.get('team_logo_path', bet_slip_gen.DEFAULT_LOGO_PATH) for leg in legs]
-                bet_slip_image = await bet_slip_gen.generate_bet_slip(
+                slip_bytes = await bet_slip_gen.generate_bet_slip_bytes(
                     home_team="Multi-Game" if not is_sgp else legs[0].get('home_team', legs[0].get('team', 'Team A')),
                     away_team="Parlay" if not is_sgp else legs[0].get('away_team', legs[0].get('opponent', 'Team B')),
                     league="Parlay" if not is_sgp else legs[0].get('league', 'SGP'),
@@ -799,14 +789,11 @@ class ParlayBetWorkflowView(View):
                     bet_type="parlay",
                     parlay_legs=legs,
                     is_same_game=is_sgp,
-                    team_logo_paths=team_logo_paths
+                    team_logo_paths=team_logo_paths,
+                    guild_id=self.original_interaction.guild_id
                 )
-                if bet_slip_image:
-                    temp_bytes = io.BytesIO()
-                    bet_slip_image.save(temp_bytes, format='PNG')
-                    temp_bytes.seek(0)
-                    discord_file_to_send = File(temp_bytes, filename=f"parlay_slip_{bet_serial}.png")
-                    temp_bytes.close()
+                if slip_bytes:
+                    discord_file_to_send = File(io.BytesIO(slip_bytes), filename=slip_filename(f"parlay_slip_{bet_serial}"))
 
             capper_data = await self.bot.db_manager.fetch_one(
                 "SELECT display_name, image_path FROM cappers WHERE guild_id = %s AND user_id = %s",
@@ -28,7 +28,7 @@ from utils.errors import (
     ValidationError,
     GameNotFoundError,
 )
-from utils.image_generator import BetSlipGenerator
+from utils.image_generator import BetSlipGenerator, slip_filename
 from utils.modals import StraightBetDetailsModal # Import the modal
 from config.leagues import LEAGUE_CONFIG
 
@@ -317,7 +317,7 @@ class BetDetailsModal(Modal):
                 current_units = float(self.view.bet_details.get("units", 1.0))
                 try:
                     bet_slip_generator = await self.view.get_bet_slip_generator()
-                    bet_slip_image = await bet_slip_generator.generate_bet_slip(
+                    slip_bytes = await bet_slip_generator.generate_bet_slip_bytes(
                         home_team=self.view.home_team,
                         away_team=self.view.away_team,
                         league=self.view.league,
@@ -326,12 +326,11 @@ class BetDetailsModal(Modal):
                         units=current_units,
                         bet_id=self.view.bet_id,
                         timestamp=datetime.now(timezone.utc),
-                        bet_type=self.view.bet_details.get("line_type", "straight")
+                        bet_type=self.view.bet_details.get("line_type", "straight"),
+                        guild_id=self.view.original_interaction.guild_id
                     )
-                    if bet_slip_image:
-                        self.view.preview_image_bytes = io.BytesIO()
-                        bet_slip_image.save(self.view.preview_image_bytes, format='PNG')
-                        self.view.preview_image_bytes.seek(0)
+                    if slip_bytes:
+                        self.view.preview_image_bytes = io.BytesIO(slip_bytes)
                         logger.debug(f"Bet slip image (re)generated from modal for bet {self.view.bet_id}")
                     else:
                         logger.warning(f"Failed to generate bet slip image from modal for bet {self.view.bet_id}.")
@@ -483,7 +482,7 @@ class StraightBetWorkflowView(View):
 
     async def get_bet_slip_generator(self) -> BetSlipGenerator:
         if self.bet_slip_generator is None:
-            self.bet_slip_generator = await self.bot.get_bet_slip_generator(self.original_interaction.guild_id)
+            self.bet_slip_generator = await self.bot.get_bet_slip_generator()
         return self.bet_slip_generator
 
     async def start_flow(self, interaction_that_triggered_workflow_start: Interaction):
@@ -651,10 +650,7 @@ class StraightBetWorkflowView(View):
                     return
 
                 logger.debug(f"Fetching guild settings for guild_id: {interaction.guild_id} for channel selection.")
-                guild_settings = await self.bot.db_manager.fetch_one(
-                    "SELECT embed_channel_1, embed_channel_2 FROM guild_settings WHERE guild_id = %s",
-                    (interaction.guild_id,)
-                )
+                guild_settings = await self.bot.admin_service.get_guild_settings(interaction.guild_id)
 
                 configured_channel_objects = []
                 if guild_settings:
@@ -714,7 +710,7 @@ class StraightBetWorkflowView(View):
             file_to_send = None
             if self.current_step >= 5 and self.preview_image_bytes:
                 self.preview_image_bytes.seek(0)
-                file_to_send = File(self.preview_image_bytes, filename=f"bet_preview_s{self.current_step}.png")
+                file_to_send = File(self.preview_image_bytes, filename=slip_filename(f"bet_preview_s{self.current_step}"))
 
             await self.edit_message(content=content, view=self, file=file_to_send)
 
@@ -766,7 +762,7 @@ class StraightBetWorkflowView(View):
             final_discord_file = None
             if self.preview_image_bytes:
                 self.preview_image_bytes.seek(0)
-                final_discord_file = discord.File(self.preview_image_bytes, filename=f"bet_slip_{bet_serial}.png")
+                final_discord_file = discord.File(self.preview_image_bytes, filename=slip_filename(f"bet_slip_{bet_serial}"))
             else:
                 logger.warning(f"Preview image bytes not available for bet {bet_serial} at submission. Attempting regeneration.")
                 bet_slip_gen = await self.get_bet_slip_generator()
@@ -781,7 +777,7 @@ class StraightBetWorkflowView(View):
                 if not all([home_team_for_regen, league_for_regen, line_for_regen, odds_for_regen is not None]):
                     logger.error(f"Cannot regenerate image for bet {bet_serial}: Missing crucial details.")
                 else:
-                    regen_image = await bet_slip_gen.generate_bet_slip(
+                    regen_bytes = await bet_slip_gen.generate_bet_slip_bytes(
                         home_team=home_team_for_regen,
                         away_team=away_team_for_regen,
                         league=league_for_regen,
@@ -790,13 +786,12 @@ class StraightBetWorkflowView(View):
                         units=units_for_regen,
                         bet_id=str(bet_serial),
                         timestamp=datetime.now(timezone.utc),
-                        bet_type=bet_type_for_regen
+                        bet_type=bet_type_for_regen,
+                        guild_id=self.original_interaction.guild_id
                     )
-                    if regen_image:
-                        temp_io = io.BytesIO()
-                        regen_image.save(temp_io, "PNG")
-                        temp_io.seek(0)
-                        final_discord_file = discord.File(temp_io, filename=f"bet_slip_{bet_serial}.png")
+                    if regen_bytes:
+                        temp_io = io.BytesIO(regen_bytes)
+                        final_discord_file = discord.File(temp_io, filename=slip_filename(f"bet_slip_{bet_serial}"))
                     else:
                         logger.error(f"Critical failure to regenerate image for bet {bet_serial}. Posting without image.")
 
@@ -819,10 +814,7 @@ class StraightBetWorkflowView(View):
                         logger.warning(f"Capper avatar path '{custom_avatar_url}' for user {interaction.user.id} is not a direct URL. Using Discord avatar.")
 
             # Fetch member_role from guild_settings
-            guild_settings = await self.bot.db_manager.fetch_one(
-                "SELECT member_role FROM guild_settings WHERE guild_id = %s",
-                (interaction.guild_id,)
-            )
+            guild_settings = await self.bot.admin_service.get_guild_settings(interaction.guild_id)
             
             member_role_mention = ""
             if guild_settings and guild_settings.get('member_role'):
@@ -922,7 +914,7 @@ class StraightBetWorkflowView(View):
                     return
 
                 generator = await self.get_bet_slip_generator()
-                bet_slip_image = await generator.generate_bet_slip(
+                slip_bytes = await generator.generate_bet_slip_bytes(
                     home_team=home_team_for_regen,
                     away_team=away_team_for_regen,
                     league=league_for_regen,
@@ -931,15 +923,14 @@ class StraightBetWorkflowView(View):
                     units=float(units),
                     bet_id=bet_id_for_regen,
                     timestamp=datetime.now(timezone.utc),
-                    bet_type=bet_type_for_regen
+                    bet_type=bet_type_for_regen,
+                    guild_id=self.original_interaction.guild_id
                 )
 
-                if bet_slip_image:
+                if slip_bytes:
                     if self.preview_image_bytes:
                         self.preview_image_bytes.close()
-                    self.preview_image_bytes = io.BytesIO()
-                    bet_slip_image.save(self.preview_image_bytes, format='PNG')
-                    self.preview_image_bytes.seek(0)
+                    self.preview_image_bytes = io.BytesIO(slip_bytes)
                     logger.debug(f"Bet slip preview image updated for bet {current_bet_serial} with units {units}.")
                 else:
                     logger.warning(f"Failed to regenerate bet slip preview for bet {current_bet_serial} (units {units}).")
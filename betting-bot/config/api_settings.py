@@ -32,4 +32,10 @@ API_KEY = os.getenv('API_KEY')
 # API Timeouts and Retries
 API_TIMEOUT = int(os.getenv('API_TIMEOUT', '30'))
 API_RETRY_ATTEMPTS = int(os.getenv('API_RETRY_ATTEMPTS', '3'))
-API_RETRY_DELAY = int(os.getenv('API_RETRY_DELAY', '5')) 
\ No newline at end of file
+API_RETRY_DELAY = int(os.getenv('API_RETRY_DELAY', '5')) 
+
+# TheSportsDB
+THESPORTSDB_BASE_URL = os.getenv('THESPORTSDB_BASE_URL', 'https://www.thesportsdb.com/api/v1/json')
+THESPORTSDB_MAX_CONCURRENCY = int(os.getenv('THESPORTSDB_MAX_CONCURRENCY', '4'))
+THESPORTSDB_RATE_LIMIT = float(os.getenv('THESPORTSDB_RATE_LIMIT', '1.5'))  # requests per second
+THESPORTSDB_RATE_BURST = int(os.getenv('THESPORTSDB_RATE_BURST', '10'))
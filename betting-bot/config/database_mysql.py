@@ -21,6 +21,9 @@ MYSQL_DB = os.getenv('MYSQL_DB')
 MYSQL_POOL_MIN_SIZE = int(os.getenv('MYSQL_POOL_MIN_SIZE', '1'))
 MYSQL_POOL_MAX_SIZE = int(os.getenv('MYSQL_POOL_MAX_SIZE', '10'))
 
+# Optional: Rows per multi-row INSERT statement for bulk writes
+MYSQL_BULK_CHUNK_SIZE = int(os.getenv('MYSQL_BULK_CHUNK_SIZE', '500'))
+
 # Basic check for essential config
 required_vars = {
     'MYSQL_HOST': MYSQL_HOST,
@@ -25,6 +25,35 @@ GAME_CACHE_TTL = 300  # 5 minutes in seconds
 LEAGUE_CACHE_TTL = 86400  # 24 hours in seconds
 TEAM_CACHE_TTL = 86400  # 24 hours in seconds
 USER_CACHE_TTL = 86400 # 24 hours in seconds
+GAME_READ_COALESCE_TTL = 5  # seconds identical game reads share one result
+LEADERBOARD_CACHE_TTL = 300  # seconds summed leaderboard windows are reused (dropped early when a bet resolves)
+
+# Live Score Polling
+LIVE_POLL_ACTIVE_INTERVAL = 20  # seconds between polls while scores are changing
+LIVE_POLL_BREAK_INTERVAL = 90  # seconds between polls during intermissions / quiet spells
+LIVE_POLL_DISCOVERY_INTERVAL = 60  # seconds between scans for leagues with live games
+LIVE_POLL_MAX_CONCURRENCY = 5  # leagues polled in parallel
+
+# Live Game Update Notifications
+GAME_UPDATE_DEBOUNCE = 10  # seconds changes to one game are coalesced before notifying
+GAME_UPDATE_QUEUE_SIZE = 1000  # channels waiting for delivery before updates are dropped
+GAME_UPDATE_DELIVERY_WORKERS = 4  # channels sent to concurrently
+GAME_UPDATE_DELIVERY_TIMEOUT = 15  # seconds before a channel send is abandoned
+
+# Bet Slip Rendering
+SLIP_RENDER_WORKERS = 2  # threads/processes drawing slips
+SLIP_RENDER_USE_PROCESSES = False  # True: ProcessPoolExecutor, False: ThreadPoolExecutor
+SLIP_RENDER_MAX_PENDING = 16  # renders queued or running before new ones are rejected
+SLIP_RENDER_TIMEOUT = 15  # seconds to wait for a slip before giving up
+LOGO_CACHE_MAX_ENTRIES = 512  # decoded + resized logo variants kept in memory per process
+LOGO_VARIANT_CACHE_DIR = 'data/cache/logo_variants'  # pre-resized PNGs on disk; None disables
+SLIP_BACKGROUND_CACHE_SIZE = 64  # prepared (faded, cover-fit) guild backgrounds kept in memory
+SLIP_BACKGROUND_HEIGHT_BUCKET = 160  # parlay slip heights are rounded up to this step when preparing backgrounds
+SLIP_GUILD_STATE_CACHE_SIZE = 1000  # guilds whose resolved background path is remembered (LRU)
+SLIP_STATIC_LAYER_CACHE_SIZE = 32  # rendered static slip layers (background, header, teams) kept in memory
+SLIP_IMAGE_FORMAT = 'PNG'  # 'PNG', 'WEBP' or 'JPEG'
+SLIP_PNG_COMPRESS_LEVEL = 6  # 0 (fastest) - 9 (smallest)
+SLIP_IMAGE_QUALITY = 85  # WEBP/JPEG quality, 1-100
 
 # Betting Rules
 MIN_ODDS = -1000
@@ -35,6 +64,8 @@ ALLOWED_LEAGUES = ['NBA', 'NFL', 'MLB', 'NHL', 'MLS', 'Other']
 # Voice Channel Configuration
 VOICE_CHANNEL_CHECK_INTERVAL = 300  # 5 minutes in seconds
 VOICE_CHANNEL_GRACE_PERIOD = 3600  # 1 hour in seconds
+VOICE_RENAME_LIMIT = 2  # channel renames Discord allows per window
+VOICE_RENAME_WINDOW = 600  # seconds; the rename rate-limit window per channel
 
 # Analytics Configuration
 ANALYTICS_UPDATE_INTERVAL = 3600  # 1 hour in seconds
@@ -1,5 +1,16 @@
 """Configuration for team name mappings."""
 
+import importlib.util
+import logging
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from config.asset_paths import get_sport_category_for_path
+from config.ncaa_conflicts import NCAA_CONFLICTS
+
+logger = logging.getLogger(__name__)
+
 # Team name mappings for logo file naming
 TEAM_MAPPINGS = {
     # NFL Teams (already provided, verified)
@@ -1098,25 +1109,173 @@ TEAM_MAPPINGS = {
     "Virginia State Trojans": "virginia_state_trojans", "Virginia State": "virginia_state_trojans", "VSU": "virginia_state_trojans", # Baseball, Basketball (M/W), Volleyball (W), Football; No Soccer   
 }
 
-def normalize_team_name(team_name: str) -> str:
+class TeamResolution(NamedTuple):
+    """Result of resolve_team()."""
+    identifier: str  # logo file stem, e.g. "atlanta_hawks"
+    league: Optional[str]  # league/sport label the name was resolved for, if known
+    ambiguous: bool  # the alias maps to more than one team
+    candidates: Tuple[Tuple[str, Tuple[str, ...]], ...]  # (identifier, leagues) for every match
+
+
+_LEAGUE_DICTIONARIES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "league_dictionaries")
+_PUNCTUATION_RE = re.compile(r"[.,'’`()\-]+")
+_WHITESPACE_RE = re.compile(r"[\s_]+")
+
+# alias key -> {identifier: set of league labels}, in priority order (TEAM_MAPPINGS first)
+_team_index: Optional[Dict[str, Dict[str, Set[str]]]] = None
+_mapped_alias_keys: Optional[Set[str]] = None
+
+
+def _alias_key(name: str) -> str:
+    """Case-folded, punctuation-insensitive form of a team name or alias."""
+    key = name.casefold().replace("&", " and ")
+    key = _PUNCTUATION_RE.sub(" ", key)
+    return _WHITESPACE_RE.sub(" ", key).strip()
+
+
+def _fallback_identifier(team_name: str) -> str:
+    # If no mapping, derive the identifier from the name itself
+    return team_name.lower().replace(" ", "_").replace(".", "").replace("&", "and")
+
+
+def _load_league_aliases() -> List[Tuple[str, Dict[str, str]]]:
+    """(league label, {alias: full team name}) from utils/league_dictionaries/*.py team modules."""
+    aliases = []
+    if not os.path.isdir(_LEAGUE_DICTIONARIES_DIR):
+        return aliases
+    for filename in sorted(os.listdir(_LEAGUE_DICTIONARIES_DIR)):
+        if not filename.endswith(".py"):
+            continue
+        label = filename[:-3].upper()
+        try:
+            spec = importlib.util.spec_from_file_location(f"_league_dictionary_{filename[:-3]}", os.path.join(_LEAGUE_DICTIONARIES_DIR, filename))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception as e:
+            logger.warning(f"Could not load league dictionary {filename}: {e}")
+            continue
+        # Darts/tennis modules map tournaments, not teams
+        if not hasattr(module, "TEAM_FULL_NAMES"):
+            continue
+        merged: Dict[str, str] = {}
+        for attr in dir(module):
+            if attr.endswith("_ABBREVIATIONS") or attr == "TEAM_FULL_NAMES":
+                merged.update(getattr(module, attr))
+        aliases.append((label, merged))
+    return aliases
+
+
+def _build_team_index() -> Dict[str, Dict[str, Set[str]]]:
+    index: Dict[str, Dict[str, Set[str]]] = {}
+
+    def add(alias: str, identifier: str, league: Optional[str] = None):
+        entry = index.setdefault(_alias_key(alias), {})
+        leagues = entry.setdefault(identifier, set())
+        if league:
+            leagues.add(league)
+
+    # TEAM_MAPPINGS first: the first key in dict order wins case-insensitive matches
+    for alias, identifier in TEAM_MAPPINGS.items():
+        key = _alias_key(alias)
+        if key not in index:
+            add(alias, identifier)
+
+    def identifier_for(full_name: str) -> str:
+        if full_name in TEAM_MAPPINGS:
+            return TEAM_MAPPINGS[full_name]
+        mapped = index.get(_alias_key(full_name))
+        return next(iter(mapped)) if mapped else _fallback_identifier(full_name)
+
+    for label, aliases in _load_league_aliases():
+        for alias, full_name in aliases.items():
+            identifier = identifier_for(full_name)
+            add(alias, identifier, label)
+            add(full_name, identifier, label)
+
+    for nickname, teams in NCAA_CONFLICTS.items():
+        for team in teams:
+            add(nickname, team["identifier"], "NCAA")
+            add(team["name"], team["identifier"], "NCAA")
+
+    logger.debug(f"Built team name index with {len(index)} aliases.")
+    return index
+
+
+def _get_team_index() -> Dict[str, Dict[str, Set[str]]]:
+    global _team_index
+    if _team_index is None:
+        _team_index = _build_team_index()
+    return _team_index
+
+
+def _get_mapped_alias_keys() -> Set[str]:
+    global _mapped_alias_keys
+    if _mapped_alias_keys is None:
+        _mapped_alias_keys = {_alias_key(alias) for alias in TEAM_MAPPINGS}
+    return _mapped_alias_keys
+
+
+def _league_matches(labels: Set[str], league: str, sport: Optional[str]) -> bool:
+    return league in labels or (sport is not None and sport in labels) or ("NCAA" in labels and league.startswith("NCAA"))
+
+
+def resolve_team(team_name: str, league: Optional[str] = None) -> TeamResolution:
+    """
+    Resolve a team name or alias to its logo identifier with one dict lookup.
+
+    Aliases come from TEAM_MAPPINGS, the utils/league_dictionaries abbreviation
+    and full-name tables and NCAA_CONFLICTS. When an alias belongs to several
+    teams, `league` (e.g. "NBA", "NCAAF") picks between them, even if the name is
+    a TEAM_MAPPINGS key: teams labelled with exactly that league are tried first,
+    then teams of its sport category. If that leaves no single team the
+    TEAM_MAPPINGS entry wins, and if there is none the name is normalized as-is.
+    """
+    candidates = _get_team_index().get(_alias_key(team_name))
+    if not candidates:
+        return TeamResolution(_fallback_identifier(team_name), None, False, ())
+
+    league_key = league.upper().replace(" ", "_") if league else None
+    sport = get_sport_category_for_path(league_key) if league_key else None
+    ambiguous = len(candidates) > 1
+    summary = tuple((identifier, tuple(sorted(leagues))) for identifier, leagues in candidates.items())
+
+    chosen = None
+    if ambiguous and league_key:
+        # An exact league label outranks a sport-category match ("NBA" over "BASKETBALL")
+        matching = [identifier for identifier, leagues in candidates.items() if league_key in leagues]
+        if not matching:
+            matching = [identifier for identifier, leagues in candidates.items() if _league_matches(leagues, league_key, sport)]
+        if len(matching) == 1:
+            chosen = matching[0]
+        elif TEAM_MAPPINGS.get(team_name) in matching:
+            chosen = TEAM_MAPPINGS[team_name]
+    if chosen is None:
+        if team_name in TEAM_MAPPINGS:
+            chosen = TEAM_MAPPINGS[team_name]
+        elif not ambiguous:
+            chosen = next(iter(candidates))
+        elif _alias_key(team_name) in _get_mapped_alias_keys():
+            # The first candidate is the TEAM_MAPPINGS entry when the alias has one
+            chosen = next(iter(candidates))
+    if chosen is None:
+        logger.debug(f"Team name '{team_name}' is ambiguous ({summary}) and league '{league}' does not disambiguate it.")
+        return TeamResolution(_fallback_identifier(team_name), None, True, summary)
+
+    leagues = candidates.get(chosen, set())
+    if league_key and _league_matches(leagues, league_key, sport):
+        resolved_league = league_key
+    elif len(leagues) == 1:
+        resolved_league = next(iter(leagues))
+    else:
+        resolved_league = None
+    if ambiguous:
+        logger.debug(f"Ambiguous team name '{team_name}' resolved to '{chosen}' (league: {resolved_league}); candidates: {summary}")
+    return TeamResolution(chosen, resolved_league, ambiguous, summary)
+
+
+def normalize_team_name(team_name: str, league: Optional[str] = None) -> str:
     """Normalize team name to match logo file naming convention."""
-    # First check if we have a direct mapping (case-sensitive for keys)
-    if team_name in TEAM_MAPPINGS:
+    # Direct mapping (case-sensitive for keys) skips the index unless a league may disambiguate
+    if not league and team_name in TEAM_MAPPINGS:
         return TEAM_MAPPINGS[team_name]
-    
-    # Try a case-insensitive check for common shorter names if not found directly
-    # For example, if data gives "Mercedes" but mapping has "Mercedes-AMG Petronas" as the preferred long key.
-    # This part can be expanded.
-    for key, value in TEAM_MAPPINGS.items():
-        if key.lower() == team_name.lower():
-            return value
-        # Check if team_name is a substring of a key (e.g. data "Ferrari", key "Scuderia Ferrari")
-        # or if a key is a substring of team_name (e.g. data "Haas F1 Team", key "Haas")
-        # This needs careful thought to avoid wrong matches.
-        # For simplicity, direct match or simple normalization is safer unless you have very specific partial match rules.
-
-    # If no direct mapping, try to normalize the name
-    normalized = team_name.lower().replace(" ", "_").replace(".", "").replace("&", "and")
-    # Further specific replacements can be added here if needed for common patterns
-    # e.g. normalized = normalized.replace("fc", "").replace("cf", "") if these are often omitted in filenames
-    return normalized
+    return resolve_team(team_name, league).identifier
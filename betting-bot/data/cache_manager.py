@@ -1,16 +1,55 @@
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import asyncio
 import json
 import os
-from datetime import datetime, timedelta
+import time
+
+try:
+    from ..config.settings import CACHE_DIR, CACHE_MAX_SIZE
+except ImportError:
+    from config.settings import CACHE_DIR, CACHE_MAX_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Operations queued for the disk writer
+_OP_SET = 'set'
+_OP_DELETE = 'delete'
+
+
 class CacheManager:
-    def __init__(self, cache_dir: str = 'data/cache'):
+    """
+    Two-tier async cache.
+
+    The memory tier is an LRU bounded to `max_entries` whose expiries are
+    time.monotonic() floats. The optional disk tier is read through a worker
+    thread on memory misses and written behind by a background task, so no file
+    I/O ever runs on the event loop. Repeated writes to the same key before the
+    writer catches up are coalesced into one file write.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_entries: int = CACHE_MAX_SIZE, persist: bool = True):
         self.cache_dir = cache_dir
-        self._ensure_cache_directory()
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
+        self.max_entries = max(1, max_entries)
+        self.persist = persist
+        if self.persist:
+            self._ensure_cache_directory()
+        # key -> (value, monotonic expiry or None)
+        self.memory_cache: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        # key -> (op, payload) awaiting the disk writer; newest op per key wins
+        self._pending: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Held around each file write and around clear(), so a write that is already
+        # running cannot land after clear() has removed the files
+        self._disk_lock: Optional[asyncio.Lock] = None
+
+    def _get_disk_lock(self) -> asyncio.Lock:
+        # Created on first use so it belongs to the running event loop
+        if self._disk_lock is None:
+            self._disk_lock = asyncio.Lock()
+        return self._disk_lock
 
     def _ensure_cache_directory(self):
         """Ensure the cache directory exists."""
@@ -20,80 +59,163 @@ class CacheManager:
         """Get the file path for a cache key."""
         return os.path.join(self.cache_dir, f"{key}.json")
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set a value in the cache with optional TTL."""
-        cache_data = {
-            'value': value,
-            'expires_at': (datetime.now() + timedelta(seconds=ttl)).isoformat() if ttl else None
-        }
-        
-        # Store in memory
-        self.memory_cache[key] = cache_data
-        
-        # Store in file
-        try:
-            with open(self._get_cache_path(key), 'w') as f:
-                json.dump(cache_data, f)
-        except Exception as e:
-            logger.error(f"Error writing to cache file: {str(e)}")
+    async def connect(self) -> None:
+        """Start the write-behind task for the disk tier."""
+        if not self.persist or (self._writer_task and not self._writer_task.done()):
+            return
+        self._write_queue = asyncio.Queue()
+        for key in self._pending:
+            self._write_queue.put_nowait(key)
+        self._writer_task = asyncio.create_task(self._disk_writer())
+
+    async def close(self) -> None:
+        """Flush pending disk writes and stop the writer task."""
+        if self._writer_task:
+            await self._write_queue.join()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+            self._write_queue = None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set a value in the cache with optional TTL (seconds)."""
+        expires_at = time.monotonic() + ttl if ttl else None
+        self.memory_cache[key] = (value, expires_at)
+        self.memory_cache.move_to_end(key)
+        while len(self.memory_cache) > self.max_entries:
+            self.memory_cache.popitem(last=False)
 
-    def get(self, key: str) -> Optional[Any]:
+        if self.persist:
+            # Disk entries use wall-clock expiry so they survive restarts
+            payload = {'value': value, 'expires_at': time.time() + ttl if ttl else None}
+            await self._enqueue(key, _OP_SET, payload)
+
+    async def get(self, key: str) -> Optional[Any]:
         """Get a value from the cache."""
         # Check memory cache first
-        if key in self.memory_cache:
-            cache_data = self.memory_cache[key]
-            if self._is_valid(cache_data):
-                return cache_data['value']
-            else:
-                del self.memory_cache[key]
-
-        # Check file cache
-        try:
-            with open(self._get_cache_path(key), 'r') as f:
-                cache_data = json.load(f)
-                if self._is_valid(cache_data):
-                    # Update memory cache
-                    self.memory_cache[key] = cache_data
-                    return cache_data['value']
-        except FileNotFoundError:
-            return None
-        except Exception as e:
-            logger.error(f"Error reading from cache file: {str(e)}")
+        entry = self.memory_cache.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or time.monotonic() < expires_at:
+                self.memory_cache.move_to_end(key)
+                return value
+            del self.memory_cache[key]
+
+        if not self.persist:
             return None
 
-    def delete(self, key: str) -> None:
+        # A queued write or delete is newer than whatever is on disk
+        pending = self._pending.get(key)
+        if pending is not None:
+            op, cache_data = pending
+            if op == _OP_DELETE:
+                return None
+        else:
+            try:
+                cache_data = await asyncio.to_thread(self._read_file, key)
+            except Exception as e:
+                logger.error(f"Error reading from cache file: {str(e)}")
+                return None
+            if cache_data is None:
+                return None
+
+        wall_expiry = cache_data.get('expires_at')
+        if isinstance(wall_expiry, str):
+            return None  # Legacy ISO-string entry; treat as expired
+        if wall_expiry is not None:
+            remaining = wall_expiry - time.time()
+            if remaining <= 0:
+                return None
+            mono_expiry = time.monotonic() + remaining
+        else:
+            mono_expiry = None
+
+        # Promote back into the memory tier
+        self.memory_cache[key] = (cache_data['value'], mono_expiry)
+        self.memory_cache.move_to_end(key)
+        while len(self.memory_cache) > self.max_entries:
+            self.memory_cache.popitem(last=False)
+        return cache_data['value']
+
+    async def delete(self, key: str) -> None:
         """Delete a value from the cache."""
         # Remove from memory
         self.memory_cache.pop(key, None)
-        
-        # Remove from file
+        if self.persist:
+            await self._enqueue(key, _OP_DELETE, None)
+
+    async def clear(self) -> None:
+        """Clear all cached data."""
+        # Clear memory cache and drop writes that have not reached disk yet
+        self.memory_cache.clear()
+        self._pending.clear()
+        if not self.persist:
+            return
+
+        # Clear file cache once any in-flight write has finished
+        async with self._get_disk_lock():
+            try:
+                await asyncio.to_thread(self._clear_files)
+            except Exception as e:
+                logger.error(f"Error clearing cache: {str(e)}")
+
+    async def _enqueue(self, key: str, op: str, payload: Optional[Dict[str, Any]]) -> None:
+        """Record the latest disk operation for a key and wake the writer."""
+        if self._writer_task is None or self._writer_task.done():
+            await self.connect()
+        already_queued = key in self._pending
+        self._pending[key] = (op, payload)
+        if not already_queued:
+            self._write_queue.put_nowait(key)
+
+    async def _disk_writer(self) -> None:
+        """Background task applying queued disk operations in a worker thread."""
+        while True:
+            key = await self._write_queue.get()
+            try:
+                async with self._get_disk_lock():
+                    pending = self._pending.pop(key, None)
+                    if pending is None:
+                        continue  # Superseded by clear()
+                    op, payload = pending
+                    if op == _OP_SET:
+                        await asyncio.to_thread(self._write_file, key, payload)
+                    else:
+                        await asyncio.to_thread(self._remove_file, key)
+            except Exception as e:
+                logger.error(f"Error writing to cache file: {str(e)}")
+            finally:
+                self._write_queue.task_done()
+
+    def _read_file(self, key: str) -> Optional[Dict[str, Any]]:
         try:
-            os.remove(self._get_cache_path(key))
+            with open(self._get_cache_path(key), 'r') as f:
+                return json.load(f)
         except FileNotFoundError:
-            pass
-        except Exception as e:
-            logger.error(f"Error deleting cache file: {str(e)}")
-
-    def _is_valid(self, cache_data: Dict[str, Any]) -> bool:
-        """Check if cached data is still valid."""
-        if cache_data['expires_at'] is None:
-            return True
-            
+            return None
+
+    def _write_file(self, key: str, payload: Dict[str, Any]) -> None:
         try:
-            expires_at = datetime.fromisoformat(cache_data['expires_at'])
-            return datetime.now() < expires_at
-        except Exception:
-            return False
+            data = json.dumps(payload)
+        except (TypeError, ValueError):
+            # Not JSON-serializable: keep it memory-only
+            logger.debug(f"Cache value for '{key}' is not JSON-serializable; skipping disk tier.")
+            return
+        tmp_path = self._get_cache_path(key) + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, self._get_cache_path(key))
 
-    def clear(self) -> None:
-        """Clear all cached data."""
-        # Clear memory cache
-        self.memory_cache.clear()
-        
-        # Clear file cache
+    def _remove_file(self, key: str) -> None:
         try:
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    os.remove(os.path.join(self.cache_dir, filename))
-        except Exception as e:
-            logger.error(f"Error clearing cache: {str(e)}") 
\ No newline at end of file
+            os.remove(self._get_cache_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _clear_files(self) -> None:
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('.json'):
+                os.remove(os.path.join(self.cache_dir, filename))
@@ -2,18 +2,20 @@
 
 import aiomysql
 import logging
-from typing import Optional, List, Dict, Any, Union, Tuple # Added Tuple
+import re
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Union, Tuple, Iterable, Sequence, AsyncIterator
 import os
 
 try:
     from ..config.database_mysql import (
         MYSQL_HOST, MYSQL_PORT, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB,
-        MYSQL_POOL_MIN_SIZE, MYSQL_POOL_MAX_SIZE
+        MYSQL_POOL_MIN_SIZE, MYSQL_POOL_MAX_SIZE, MYSQL_BULK_CHUNK_SIZE
     )
 except ImportError:
     from config.database_mysql import (
         MYSQL_HOST, MYSQL_PORT, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DB,
-        MYSQL_POOL_MIN_SIZE, MYSQL_POOL_MAX_SIZE
+        MYSQL_POOL_MIN_SIZE, MYSQL_POOL_MAX_SIZE, MYSQL_BULK_CHUNK_SIZE
     )
 
 if not MYSQL_DB:
@@ -21,6 +23,82 @@ if not MYSQL_DB:
 
 logger = logging.getLogger(__name__)
 
+_VALUES_CLAUSE_RE = re.compile(r"\bVALUES\s*\(", re.IGNORECASE)
+
+
+def _split_values_clause(query: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split an INSERT query around its first VALUES row template.
+    Returns (head, row_template, tail) or None if the query has no VALUES clause.
+    Nested parentheses (e.g. UTC_TIMESTAMP()) inside the row template are kept intact.
+    """
+    match = _VALUES_CLAUSE_RE.search(query)
+    if not match:
+        return None
+    start = match.end() - 1
+    depth = 0
+    for idx in range(start, len(query)):
+        if query[idx] == '(':
+            depth += 1
+        elif query[idx] == ')':
+            depth -= 1
+            if depth == 0:
+                return query[:start], query[start:idx + 1], query[idx + 1:]
+    return None
+
+
+def _flatten_args(args: tuple) -> tuple:
+    """Flatten a single tuple/list argument into positional query args."""
+    return tuple(args[0]) if len(args) == 1 and isinstance(args[0], (tuple, list)) else args
+
+
+class Transaction:
+    """
+    Query interface bound to one pooled connection inside an explicit transaction.
+    Obtained from DatabaseManager.transaction(); errors are raised rather than
+    swallowed so the surrounding context manager can roll back.
+    """
+
+    def __init__(self, conn: aiomysql.Connection):
+        self._conn = conn
+
+    async def execute(self, query: str, *args) -> Tuple[Optional[int], Optional[int]]:
+        """Execute INSERT, UPDATE, DELETE. Returns (rowcount, lastrowid) without committing."""
+        flat_args = _flatten_args(args)
+        logger.debug(f"Executing DB Query (tx): {query} Args: {flat_args}")
+        last_id = None
+        async with self._conn.cursor() as cursor:
+            rowcount = await cursor.execute(query, flat_args)
+            if rowcount is not None and rowcount > 0 and query.strip().upper().startswith("INSERT"):
+                last_id = cursor.lastrowid
+        return rowcount, last_id
+
+    async def fetch_one(self, query: str, *args) -> Optional[Dict[str, Any]]:
+        """Fetch one row as a dictionary."""
+        flat_args = _flatten_args(args)
+        logger.debug(f"Fetching One DB Query (tx): {query} Args: {flat_args}")
+        async with self._conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, flat_args)
+            return await cursor.fetchone()
+
+    async def fetch_all(self, query: str, *args) -> List[Dict[str, Any]]:
+        """Fetch all rows as a list of dictionaries."""
+        flat_args = _flatten_args(args)
+        logger.debug(f"Fetching All DB Query (tx): {query} Args: {flat_args}")
+        async with self._conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, flat_args)
+            return await cursor.fetchall()
+
+    async def fetchval(self, query: str, *args) -> Optional[Any]:
+        """Fetch a single value from the first row."""
+        flat_args = _flatten_args(args)
+        logger.debug(f"Fetching Value DB Query (tx): {query} Args: {flat_args}")
+        async with self._conn.cursor(aiomysql.Cursor) as cursor:
+            await cursor.execute(query, flat_args)
+            row = await cursor.fetchone()
+            return row[0] if row else None
+
+
 class DatabaseManager:
     """Manages the connection pool and executes queries against the MySQL DB."""
 
@@ -86,6 +164,32 @@ class DatabaseManager:
             except Exception as e:
                 logger.error(f"Error closing MySQL pool: {e}")
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Transaction]:
+        """
+        Run several statements atomically on one pooled connection.
+        Usage: `async with db.transaction() as tx: await tx.execute(...)`.
+        Commits once when the block exits, rolls back and re-raises on any exception.
+        """
+        pool = await self.connect()
+        if not pool:
+            logger.error("Cannot start transaction: DB pool unavailable.")
+            raise ConnectionError("DB pool unavailable.")
+
+        async with pool.acquire() as conn:
+            await conn.begin()
+            try:
+                yield Transaction(conn)
+            except BaseException:
+                try:
+                    await conn.rollback()
+                    logger.debug("Transaction rolled back.")
+                except Exception as rb_err:
+                    logger.error(f"Error rolling back transaction: {rb_err}")
+                raise
+            else:
+                await conn.commit()
+
     async def execute(self, query: str, *args) -> Tuple[Optional[int], Optional[int]]:
         """
         Execute INSERT, UPDATE, DELETE.
@@ -118,6 +222,58 @@ class DatabaseManager:
             # Return None for both in case of error
             return None, None
 
+    async def execute_many(
+        self,
+        query: str,
+        params: Iterable[Sequence[Any]],
+        chunk_size: int = MYSQL_BULK_CHUNK_SIZE
+    ) -> List[Optional[int]]:
+        """
+        Execute a single-row INSERT (optionally with ON DUPLICATE KEY UPDATE) for many rows.
+        Rows are grouped into multi-row INSERT statements of up to `chunk_size` rows,
+        all run on one pooled connection with one commit per chunk.
+        Returns the rowcount of each chunk in order; a failed chunk is rolled back and
+        reported as None. Queries without a VALUES clause fall back to cursor.executemany.
+        """
+        pool = await self.connect()
+        if not pool:
+            logger.error("Cannot execute_many: DB pool unavailable.")
+            raise ConnectionError("DB pool unavailable.")
+
+        rows = [tuple(row) for row in params]
+        if not rows:
+            return []
+        chunk_size = max(1, chunk_size)
+        parts = _split_values_clause(query)
+
+        logger.debug(f"Executing bulk DB Query: {query} Rows: {len(rows)} Chunk size: {chunk_size}")
+        chunk_rowcounts: List[Optional[int]] = []
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                for offset in range(0, len(rows), chunk_size):
+                    chunk = rows[offset:offset + chunk_size]
+                    try:
+                        if parts:
+                            head, row_template, tail = parts
+                            statement = head + ", ".join([row_template] * len(chunk)) + tail
+                            flat_args = tuple(value for row in chunk for value in row)
+                            rowcount = await cursor.execute(statement, flat_args)
+                        else:
+                            rowcount = await cursor.executemany(query, chunk)
+                        await conn.commit()
+                        chunk_rowcounts.append(rowcount)
+                    except Exception as e:
+                        logger.error(
+                            f"Error executing bulk chunk at row {offset} ({len(chunk)} rows): {query}. Error: {e}",
+                            exc_info=True
+                        )
+                        try:
+                            await conn.rollback()
+                        except Exception as rb_err:
+                            logger.error(f"Error rolling back failed bulk chunk: {rb_err}")
+                        chunk_rowcounts.append(None)
+        return chunk_rowcounts
+
     async def fetch_one(self, query: str, *args) -> Optional[Dict[str, Any]]:
         """Fetch one row as a dictionary."""
         pool = await self.connect()
@@ -379,6 +535,46 @@ class DatabaseManager:
                          # Optionally, could add a check here to see if the FK exists already if the table existed
 
 
+                    # --- Capper Stats Table (materialized from bets + unit_records) ---
+                    if not await self.table_exists(conn, 'capper_stats'):
+                        await cursor.execute('''
+                            CREATE TABLE capper_stats (
+                                guild_id BIGINT NOT NULL,
+                                user_id BIGINT NOT NULL,
+                                league VARCHAR(50) NOT NULL DEFAULT '',
+                                bet_type VARCHAR(50) NOT NULL DEFAULT '',
+                                wins INT NOT NULL DEFAULT 0,
+                                losses INT NOT NULL DEFAULT 0,
+                                pushes INT NOT NULL DEFAULT 0,
+                                units_risked DECIMAL(15, 2) NOT NULL DEFAULT 0 COMMENT 'Sum of stakes of resolved bets',
+                                net_units DECIMAL(15, 2) NOT NULL DEFAULT 0 COMMENT 'Sum of unit_records results',
+                                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                                PRIMARY KEY (guild_id, user_id, league, bet_type)
+                            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+                        ''')
+                        logger.info("Table 'capper_stats' created.")
+                    else:
+                        logger.info("Table 'capper_stats' already exists.")
+
+                    # --- Capper Daily Stats Table (per-day buckets for leaderboards) ---
+                    if not await self.table_exists(conn, 'capper_daily_stats'):
+                        await cursor.execute('''
+                            CREATE TABLE capper_daily_stats (
+                                guild_id BIGINT NOT NULL,
+                                day DATE NOT NULL COMMENT 'UTC day the bets resolved',
+                                user_id BIGINT NOT NULL,
+                                wins INT NOT NULL DEFAULT 0,
+                                losses INT NOT NULL DEFAULT 0,
+                                pushes INT NOT NULL DEFAULT 0,
+                                units_risked DECIMAL(15, 2) NOT NULL DEFAULT 0,
+                                net_units DECIMAL(15, 2) NOT NULL DEFAULT 0,
+                                PRIMARY KEY (guild_id, day, user_id)
+                            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+                        ''')
+                        logger.info("Table 'capper_daily_stats' created.")
+                    else:
+                        logger.info("Table 'capper_daily_stats' already exists.")
+
                     # --- Guild Settings Table ---
                     if not await self.table_exists(conn, 'guild_settings'):
                         await cursor.execute('''
@@ -406,6 +602,8 @@ class DatabaseManager:
                                 total_result_value DECIMAL(15, 2) DEFAULT 0.0, # Unused? Calculated from records
                                 min_units DECIMAL(15, 2) DEFAULT 0.1,
                                 max_units DECIMAL(15, 2) DEFAULT 10.0,
+                                live_updates_channel_id BIGINT NULL COMMENT 'Live game updates channel (NULL = off)',
+                                live_updates_leagues TEXT NULL COMMENT 'Comma-separated league ids for live updates (NULL = all)',
                                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
                             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -415,6 +613,8 @@ class DatabaseManager:
                         logger.info("Table 'guild_settings' already exists.")
                         await self._check_and_add_column(cursor, 'guild_settings', 'voice_channel_id', "BIGINT NULL COMMENT 'Monthly VC'")
                         await self._check_and_add_column(cursor, 'guild_settings', 'yearly_channel_id', "BIGINT NULL COMMENT 'Yearly VC'")
+                        await self._check_and_add_column(cursor, 'guild_settings', 'live_updates_channel_id', "BIGINT NULL COMMENT 'Live game updates channel (NULL = off)'")
+                        await self._check_and_add_column(cursor, 'guild_settings', 'live_updates_leagues', "TEXT NULL COMMENT 'Comma-separated league ids for live updates (NULL = all)'")
 
                     # --- Cappers Table ---
                     if not await self.table_exists(conn, 'cappers'):
@@ -530,6 +730,10 @@ class DatabaseManager:
                                 except Exception as pk_err:
                                     logger.error(f"Failed to rebuild primary key for 'standings': {pk_err}. Manual check needed.")
 
+                    # --- API Games Table (created by the ingest pipeline) ---
+                    if await self.table_exists(conn, 'api_games'):
+                        await self._check_and_add_column(cursor, 'api_games', 'score_fingerprint', "CHAR(16) NULL COMMENT 'Hash of (status, score) last written by the live poller'")
+
                     # --- Game Events Table ---
                     if not await self.table_exists(conn, 'game_events'):
                         await cursor.execute('''
@@ -58,7 +58,10 @@ from services.bet_service import BetService
 from services.user_service import UserService
 from services.voice_service import VoiceService
 from services.data_sync_service import DataSyncService
+from services.api_service import ApiService
+from services.subscription_service import SubscriptionService
 from utils.image_generator import BetSlipGenerator
+from utils.slip_renderer import SlipRenderService
 from commands.sync_cog import setup_sync_cog
 
 # Try to import GameService, handle thesportsdb import error
@@ -136,18 +139,22 @@ class BettingBot(commands.Bot):
         super().__init__(command_prefix=commands.when_mentioned_or("/"), intents=intents)
         self.db_manager = DatabaseManager()
         self.admin_service = AdminService(self, self.db_manager)
+        self.subscription_service = SubscriptionService(self.db_manager, self.admin_service)
         self.analytics_service = AnalyticsService(self, self.db_manager)
         self.bet_service = BetService(self, self.db_manager)
         self.game_service = GameService(self, self.db_manager) if GameService else None
         self.user_service = UserService(self, self.db_manager)
         self.voice_service = VoiceService(self, self.db_manager)
         self.data_sync_service = DataSyncService(self.game_service, self.db_manager) if self.game_service else None
-        self.bet_slip_generators = {}
+        self.slip_renderer = SlipRenderService()
+        # Shared by all guilds; per-guild background state lives in the bounded BACKGROUND_CACHE
+        self.bet_slip_generator = BetSlipGenerator(
+            db_manager=self.db_manager, renderer=self.slip_renderer,
+            guild_settings=self.admin_service.get_guild_settings
+        )
 
-    async def get_bet_slip_generator(self, guild_id: int) -> BetSlipGenerator:
-        if guild_id not in self.bet_slip_generators:
-            self.bet_slip_generators[guild_id] = BetSlipGenerator(guild_id=guild_id)
-        return self.bet_slip_generators[guild_id]
+    async def get_bet_slip_generator(self) -> BetSlipGenerator:
+        return self.bet_slip_generator
 
     async def load_extensions(self):
         commands_dir = os.path.join(BASE_DIR, 'commands')
@@ -217,6 +224,7 @@ class BettingBot(commands.Bot):
             self.bet_service.start(),
             self.user_service.start(),
             self.voice_service.start(),
+            self.slip_renderer.start(),
         ]
         if self.game_service:
             service_starts.append(self.game_service.start())
@@ -299,6 +307,7 @@ class BettingBot(commands.Bot):
                 self.bet_service.stop(),
                 self.user_service.stop(),
                 self.voice_service.stop(),
+                self.slip_renderer.stop(),
             ]
             if self.game_service:
                 stop_tasks.append(self.game_service.stop())
@@ -311,6 +320,7 @@ class BettingBot(commands.Bot):
                     service_name = stop_tasks[i].__self__.__class__.__name__ if hasattr(stop_tasks[i], '__self__') else f"Service {i}"
                     logger.error("Error stopping %s: %s", service_name, result, exc_info=True)
             logger.info("Services stopped.")
+            await ApiService.close()
             if self.db_manager:
                 logger.info("Closing database connection pool...")
                 await self.db_manager.close()
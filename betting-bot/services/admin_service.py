@@ -6,7 +6,9 @@ import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+from utils.background_cache import BACKGROUND_CACHE
 
 logger = logging.getLogger(__name__)
 
@@ -25,13 +27,16 @@ class AdminService:
         """
         self.bot = bot
         self.db_manager = db_manager
+        # guild_id -> guild_settings row (None = no row). Warmed in start(), kept current by
+        # setup_guild/update_guild_settings; other writers call refresh_guild_settings().
+        self._guild_settings: Dict[int, Optional[Dict[str, Any]]] = {}
         logger.info("AdminService initialized")
 
     async def start(self):
         """Start the AdminService and perform any necessary setup."""
         logger.info("Starting AdminService")
         try:
-            # Example: Perform initialization tasks
+            await self.warm_guild_settings()
             logger.info("AdminService started successfully")
         except Exception as e:
             logger.error(f"Failed to start AdminService: {e}", exc_info=True)
@@ -41,6 +46,7 @@ class AdminService:
         """Stop the AdminService and perform any necessary cleanup."""
         logger.info("Stopping AdminService")
         try:
+            self._guild_settings.clear()
             logger.info("AdminService stopped successfully")
         except Exception as e:
             logger.error(f"Failed to stop AdminService: {e}", exc_info=True)
@@ -149,21 +155,60 @@ class AdminService:
                     settings.get('is_paid', False)
                 )
 
+            # Reload the row so defaults filled in by MySQL are cached too
+            self.invalidate_guild_settings(guild_id)
+            self._sync_update_subscriptions(guild_id, await self.get_guild_settings(guild_id))
+            # Prepared slip backgrounds are keyed on the old path/file; drop them
+            BACKGROUND_CACHE.invalidate(guild_id)
             return True
         except Exception as e:
             logger.error(f"Error setting up guild {guild_id}: {e}")
             return False
 
+    async def warm_guild_settings(self) -> int:
+        """Load every guild_settings row into the cache with one query; returns the row count."""
+        try:
+            rows = await self.db_manager.fetch_all("SELECT * FROM guild_settings")
+        except Exception as e:
+            logger.warning(f"Could not warm guild settings cache: {e}. Settings will be loaded on demand.")
+            return 0
+        self._guild_settings = {int(row['guild_id']): row for row in rows}
+        logger.info(f"Guild settings cache warmed with {len(rows)} guilds.")
+        return len(rows)
+
+    def invalidate_guild_settings(self, guild_id: int):
+        """Drop a guild's cached settings so the next read goes to the database."""
+        self._guild_settings.pop(int(guild_id), None)
+
+    async def refresh_guild_settings(self, guild_id: int) -> Optional[Dict[str, any]]:
+        """Reload a guild's settings after an outside write and apply its channel changes."""
+        self.invalidate_guild_settings(guild_id)
+        settings = await self.get_guild_settings(guild_id)
+        self._sync_update_subscriptions(guild_id, settings)
+        return settings
+
+    def _sync_update_subscriptions(self, guild_id: int, settings: Optional[Dict[str, any]]):
+        """Apply the guild's current live game update settings."""
+        game_service = getattr(self.bot, 'game_service', None)
+        if game_service is not None:
+            game_service.sync_guild_subscriptions(int(guild_id), settings)
+
     async def get_guild_settings(self, guild_id: int) -> Optional[Dict[str, any]]:
-        """Get guild settings."""
+        """Get guild settings (a copy of the cached row, loaded from the database on a miss)."""
+        guild_id = int(guild_id)
+        if guild_id in self._guild_settings:
+            settings = self._guild_settings[guild_id]
+            return dict(settings) if settings is not None else None
         try:
-            return await self.db_manager.fetch_one(
+            settings = await self.db_manager.fetch_one(
                 "SELECT * FROM guild_settings WHERE guild_id = %s",
                 guild_id
             )
         except Exception as e:
             logger.error(f"Error getting guild settings for {guild_id}: {e}")
             return None
+        self._guild_settings[guild_id] = settings
+        return dict(settings) if settings is not None else None
 
     async def update_guild_settings(self, guild_id: int, settings: Dict[str, any]) -> bool:
         """Update specific guild settings."""
@@ -187,6 +232,15 @@ class AdminService:
             """
             
             await self.db_manager.execute(query, *values)
+            cached = self._guild_settings.get(int(guild_id))
+            if cached is not None:
+                cached.update({key: value for key, value in settings.items() if key != 'guild_id'})
+            else:
+                self.invalidate_guild_settings(guild_id)
+            if 'guild_background' in settings:
+                BACKGROUND_CACHE.invalidate(guild_id)
+            if 'live_updates_channel_id' in settings or 'live_updates_leagues' in settings:
+                self._sync_update_subscriptions(guild_id, await self.get_guild_settings(guild_id))
             return True
         except Exception as e:
             logger.error(f"Error updating guild settings for {guild_id}: {e}")
@@ -218,6 +272,7 @@ class AdminCog(commands.Cog):
             """
             params = (interaction.guild_id, True, 0, True, 0)
             await self.bot.db_manager.execute(query, params)
+            await self.admin_service.refresh_guild_settings(interaction.guild_id)
             await interaction.response.send_message("Guild settings initialized successfully!", ephemeral=True)
             logger.debug(f"Guild settings set up for guild {interaction.guild_id}")
         except Exception as e:
@@ -237,12 +292,41 @@ class AdminCog(commands.Cog):
             """
             params = (channel.id, interaction.guild_id)
             await self.bot.db_manager.execute(query, params)
+            await self.admin_service.refresh_guild_settings(interaction.guild_id)
             await interaction.response.send_message(f"Embed channel set to {channel.mention}!", ephemeral=True)
             logger.debug(f"Embed channel set to {channel.id} for guild {interaction.guild_id}")
         except Exception as e:
             logger.error(f"Failed to set embed channel for guild {interaction.guild_id}: {e}", exc_info=True)
             await interaction.response.send_message(f"Failed to set embed channel: {str(e)}", ephemeral=True)
 
+    @app_commands.command(name="setliveupdates", description="Post live game updates to a channel (admin only)")
+    @app_commands.describe(
+        channel="Channel for live scores; leave empty to turn live updates off",
+        leagues="Comma-separated league IDs to follow (default: all leagues)"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def setliveupdates_command(
+        self,
+        interaction: discord.Interaction,
+        channel: Optional[discord.TextChannel] = None,
+        leagues: Optional[str] = None
+    ):
+        """Opt the guild into (or out of) live game update posts."""
+        logger.info(f"Setliveupdates command initiated by {interaction.user} in guild {interaction.guild_id}")
+        try:
+            updated = await self.admin_service.update_guild_settings(interaction.guild_id, {
+                'live_updates_channel_id': channel.id if channel else None,
+                'live_updates_leagues': leagues if channel else None,
+            })
+            if not updated:
+                await interaction.response.send_message("Failed to update live game updates. Run /setup first.", ephemeral=True)
+                return
+            message = f"Live game updates will be posted to {channel.mention}." if channel else "Live game updates turned off."
+            await interaction.response.send_message(message, ephemeral=True)
+        except Exception as e:
+            logger.error(f"Failed to set live updates for guild {interaction.guild_id}: {e}", exc_info=True)
+            await interaction.response.send_message(f"Failed to set live updates: {str(e)}", ephemeral=True)
+
 async def setup(bot):
     """Setup function to register the AdminCog."""
     admin_service = bot.admin_service
@@ -3,126 +3,239 @@
 import discord
 import logging
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 
 try:
     from ..utils.errors import AnalyticsServiceError
+    from ..utils.leaderboard import LeaderboardWindowCache, sum_buckets, top_n, window_start
 except ImportError:
     from utils.errors import AnalyticsServiceError
+    from utils.leaderboard import LeaderboardWindowCache, sum_buckets, top_n, window_start
 
 logger = logging.getLogger(__name__)
 
+RESOLVED_STATUSES = ('won', 'lost', 'push')
+
+# One row per (guild, user, league, bet_type); a resolution adds to its row, a deleted
+# resolved bet is applied again with direction=-1.
+CAPPER_STATS_UPSERT = """
+    INSERT INTO capper_stats (guild_id, user_id, league, bet_type, wins, losses, pushes, units_risked, net_units)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        wins = wins + VALUES(wins),
+        losses = losses + VALUES(losses),
+        pushes = pushes + VALUES(pushes),
+        units_risked = units_risked + VALUES(units_risked),
+        net_units = net_units + VALUES(net_units)
+"""
+
+# Same deltas, bucketed by the UTC day the bet resolved (leaderboard windows sum these)
+CAPPER_DAILY_STATS_UPSERT = """
+    INSERT INTO capper_daily_stats (guild_id, day, user_id, wins, losses, pushes, units_risked, net_units)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        wins = wins + VALUES(wins),
+        losses = losses + VALUES(losses),
+        pushes = pushes + VALUES(pushes),
+        units_risked = units_risked + VALUES(units_risked),
+        net_units = net_units + VALUES(net_units)
+"""
+
+CAPPER_STATS_REBUILD = """
+    INSERT INTO capper_stats (guild_id, user_id, league, bet_type, wins, losses, pushes, units_risked, net_units)
+    SELECT
+        b.guild_id, b.user_id, COALESCE(b.league, ''), COALESCE(b.bet_type, ''),
+        SUM(CASE WHEN b.status = 'won' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN b.status = 'lost' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN b.status = 'push' THEN 1 ELSE 0 END),
+        COALESCE(SUM(b.units), 0),
+        COALESCE(SUM(ur.monthly_result_value), 0)
+    FROM bets b
+    LEFT JOIN unit_records ur ON b.bet_serial = ur.bet_serial
+    WHERE b.status IN ('won', 'lost', 'push') {guild_filter}
+    GROUP BY b.guild_id, b.user_id, COALESCE(b.league, ''), COALESCE(b.bet_type, '')
+"""
+
+CAPPER_DAILY_STATS_REBUILD = """
+    INSERT INTO capper_daily_stats (guild_id, day, user_id, wins, losses, pushes, units_risked, net_units)
+    SELECT
+        b.guild_id, DATE(COALESCE(ur.created_at, b.updated_at)), b.user_id,
+        SUM(CASE WHEN b.status = 'won' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN b.status = 'lost' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN b.status = 'push' THEN 1 ELSE 0 END),
+        COALESCE(SUM(b.units), 0),
+        COALESCE(SUM(ur.monthly_result_value), 0)
+    FROM bets b
+    LEFT JOIN unit_records ur ON b.bet_serial = ur.bet_serial
+    WHERE b.status IN ('won', 'lost', 'push') {guild_filter}
+    GROUP BY b.guild_id, DATE(COALESCE(ur.created_at, b.updated_at)), b.user_id
+"""
+
+
+async def record_capper_result(
+    tx, guild_id: int, user_id: int, league: Optional[str], bet_type: Optional[str],
+    status: str, units: float, result_value: float, resolved_at: Optional[datetime] = None, direction: int = 1
+):
+    """
+    Apply one resolved bet to capper_stats and its capper_daily_stats bucket
+    inside the caller's transaction. Pass direction=-1 to take a previously
+    recorded result back out.
+    """
+    if status not in RESOLVED_STATUSES:
+        return
+    deltas = (
+        direction * (status == 'won'), direction * (status == 'lost'), direction * (status == 'push'),
+        direction * float(units or 0), direction * float(result_value or 0)
+    )
+    await tx.execute(CAPPER_STATS_UPSERT, (guild_id, user_id, league or '', bet_type or '') + deltas)
+    resolved_day = (resolved_at or datetime.now(timezone.utc)).date()
+    await tx.execute(CAPPER_DAILY_STATS_UPSERT, (guild_id, resolved_day, user_id) + deltas)
+
 
 class AnalyticsService:
     def __init__(self, bot, db_manager):
         self.bot = bot
         self.db = db_manager
+        self.leaderboard_cache = LeaderboardWindowCache()
         logger.info("AnalyticsService initialized") # Added log for consistency
 
     async def start(self): # ### ADDED THIS METHOD ###
         """Start the AnalyticsService and perform any necessary setup."""
+        # The stats tables are new on existing installs: backfill them once from bet history
+        try:
+            stats_missing = not await self.db.fetchval("SELECT 1 FROM capper_stats LIMIT 1") or \
+                not await self.db.fetchval("SELECT 1 FROM capper_daily_stats LIMIT 1")
+            if stats_missing and \
+                    await self.db.fetchval("SELECT 1 FROM bets WHERE status IN ('won', 'lost', 'push') LIMIT 1"):
+                logger.info("capper_stats/capper_daily_stats empty; rebuilding them from bet history.")
+                await self.rebuild_capper_stats()
+        except Exception as e:
+            logger.error(f"Could not backfill capper_stats: {e}", exc_info=True)
         logger.info("AnalyticsService started successfully.")
-        # Add any specific startup logic for analytics here if needed
 
     async def stop(self): # ### ADDED THIS METHOD ###
         """Stop the AnalyticsService and perform any necessary cleanup."""
         logger.info("AnalyticsService stopped.")
         # Add any specific cleanup logic here if needed
 
-    async def get_user_stats(self, guild_id: int, user_id: int) -> Dict[str, Any]:
-        # ... (rest of your existing method)
+    async def rebuild_capper_stats(self, guild_id: Optional[int] = None) -> int:
+        """
+        Recompute capper_stats and capper_daily_stats from bets + unit_records,
+        for one guild or all of them. Returns the number of capper_stats rows written.
+        """
         try:
-            stats = await self.db.fetch_one("""
-                SELECT
-                    COUNT(b.bet_serial) as total_bets,
-                    SUM(CASE WHEN b.status = 'won' THEN 1 ELSE 0 END) as wins,
-                    SUM(CASE WHEN b.status = 'lost' THEN 1 ELSE 0 END) as losses,
-                    SUM(CASE WHEN b.status = 'push' THEN 1 ELSE 0 END) as pushes,
-                    COALESCE(SUM(ur.result_value), 0.0) as net_units
-                FROM bets b
-                LEFT JOIN unit_records ur ON b.bet_serial = ur.bet_serial
-                WHERE b.guild_id = %s AND b.user_id = %s
-                AND b.status IN ('won', 'lost', 'push')
-            """, guild_id, user_id)
-
-            if not stats or (stats.get('total_bets') or 0) == 0:
-                return {'total_bets': 0, 'wins': 0, 'losses': 0, 'pushes': 0, 'win_rate': 0.0, 'net_units': 0.0, 'roi': 0.0}
-
-            wins = stats.get('wins') or 0
-            losses = stats.get('losses') or 0
-            total_bets = stats.get('total_bets') or 0
-            net_units = stats.get('net_units') or 0.0
-
-            total_resolved_for_winrate = wins + losses
-            win_rate = (wins / total_resolved_for_winrate * 100) if total_resolved_for_winrate > 0 else 0.0
-
-            # Assuming 'stake' is the column name for units risked in the 'bets' table.
-            # The original query in your files used 'units' for stake, and 'result_value' for payout in unit_records.
-            # For ROI, we need total units risked (staked).
-            total_risked_result = await self.db.fetch_one("""
-                SELECT COALESCE(SUM(units), 0) as total_risked 
-                FROM bets
-                WHERE guild_id = %s AND user_id = %s
-                AND status IN ('won', 'lost', 'push')
-            """, guild_id, user_id)
-            total_risked = total_risked_result.get('total_risked') or 0 if total_risked_result else 0
+            async with self.db.transaction() as tx:
+                if guild_id is None:
+                    await tx.execute("DELETE FROM capper_stats")
+                    await tx.execute("DELETE FROM capper_daily_stats")
+                    rowcount, _ = await tx.execute(CAPPER_STATS_REBUILD.format(guild_filter=""))
+                    await tx.execute(CAPPER_DAILY_STATS_REBUILD.format(guild_filter=""))
+                else:
+                    await tx.execute("DELETE FROM capper_stats WHERE guild_id = %s", (guild_id,))
+                    await tx.execute("DELETE FROM capper_daily_stats WHERE guild_id = %s", (guild_id,))
+                    rowcount, _ = await tx.execute(
+                        CAPPER_STATS_REBUILD.format(guild_filter="AND b.guild_id = %s"), (guild_id,)
+                    )
+                    await tx.execute(
+                        CAPPER_DAILY_STATS_REBUILD.format(guild_filter="AND b.guild_id = %s"), (guild_id,)
+                    )
+            if guild_id is None:
+                self.leaderboard_cache.clear()
+            else:
+                self.leaderboard_cache.invalidate(guild_id)
+            logger.info(f"Rebuilt capper_stats ({'all guilds' if guild_id is None else f'guild {guild_id}'}): {rowcount or 0} rows.")
+            return rowcount or 0
+        except Exception as e:
+            logger.exception(f"Error rebuilding capper stats for {'all guilds' if guild_id is None else f'guild {guild_id}'}: {e}")
+            raise AnalyticsServiceError(f"Failed to rebuild capper stats: {str(e)}")
+
+    @staticmethod
+    def _summarize(stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Turn summed capper_stats columns into the stats dict returned to callers."""
+        stats = stats or {}
+        wins = int(stats.get('wins') or 0)
+        losses = int(stats.get('losses') or 0)
+        pushes = int(stats.get('pushes') or 0)
+        net_units = float(stats.get('net_units') or 0.0)
+        total_risked = float(stats.get('units_risked') or 0.0)
 
-            roi = (net_units / total_risked * 100.0) if total_risked > 0 else 0.0
+        total_resolved_for_winrate = wins + losses
+        win_rate = (wins / total_resolved_for_winrate * 100.0) if total_resolved_for_winrate > 0 else 0.0
+        roi = (net_units / total_risked * 100.0) if total_risked > 0 else 0.0
+        return {
+            'total_bets': wins + losses + pushes, 'wins': wins, 'losses': losses, 'pushes': pushes,
+            'win_rate': win_rate, 'net_units': net_units, 'roi': roi
+        }
 
-            return {
-                'total_bets': total_bets, 'wins': wins, 'losses': losses,
-                'pushes': stats.get('pushes') or 0,
-                'win_rate': win_rate, 'net_units': net_units, 'roi': roi
-            }
+    async def get_user_stats(
+        self, guild_id: int, user_id: int, league: Optional[str] = None, bet_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Resolved-bet totals for one capper, optionally narrowed to a league and/or bet type."""
+        try:
+            query = """
+                SELECT SUM(wins) as wins, SUM(losses) as losses, SUM(pushes) as pushes,
+                       SUM(units_risked) as units_risked, SUM(net_units) as net_units
+                FROM capper_stats
+                WHERE guild_id = %s AND user_id = %s
+            """
+            params: List[Any] = [guild_id, user_id]
+            if league is not None:
+                query += " AND league = %s"
+                params.append(league)
+            if bet_type is not None:
+                query += " AND bet_type = %s"
+                params.append(bet_type)
+            stats = await self.db.fetch_one(query, *params)
+            return self._summarize(stats)
         except Exception as e:
             logger.exception(f"Error getting user stats for user {user_id} in guild {guild_id}: {e}")
             raise AnalyticsServiceError(f"Failed to get user stats: {str(e)}")
 
     async def get_guild_stats(self, guild_id: int) -> Dict[str, Any]:
-        # ... (rest of your existing method)
+        """Resolved-bet totals for a whole guild."""
         try:
             stats = await self.db.fetch_one("""
-                SELECT
-                    COUNT(b.bet_serial) as total_bets,
-                    SUM(CASE WHEN b.status = 'won' THEN 1 ELSE 0 END) as wins,
-                    SUM(CASE WHEN b.status = 'lost' THEN 1 ELSE 0 END) as losses,
-                    SUM(CASE WHEN b.status = 'push' THEN 1 ELSE 0 END) as pushes,
-                    COALESCE(SUM(ur.result_value), 0.0) as net_units,
-                    COUNT(DISTINCT b.user_id) as total_cappers
-                FROM bets b
-                LEFT JOIN unit_records ur ON b.bet_serial = ur.bet_serial
-                WHERE b.guild_id = %s
-                AND b.status IN ('won', 'lost', 'push')
-            """, guild_id)
-
-            if not stats or (stats.get('total_bets') or 0) == 0:
-                return {'total_bets': 0, 'wins': 0, 'losses': 0, 'pushes': 0, 'win_rate': 0.0, 'net_units': 0.0, 'total_cappers': 0, 'roi': 0.0}
-
-            wins = stats.get('wins') or 0
-            losses = stats.get('losses') or 0
-            total_bets = stats.get('total_bets') or 0
-            net_units = stats.get('net_units') or 0.0
-
-            total_resolved_for_winrate = wins + losses
-            win_rate = (wins / total_resolved_for_winrate * 100.0) if total_resolved_for_winrate > 0 else 0.0
-
-            total_risked_result = await self.db.fetch_one("""
-                SELECT COALESCE(SUM(units), 0) as total_risked
-                FROM bets
-                WHERE guild_id = %s AND status IN ('won', 'lost', 'push')
+                SELECT SUM(wins) as wins, SUM(losses) as losses, SUM(pushes) as pushes,
+                       SUM(units_risked) as units_risked, SUM(net_units) as net_units,
+                       COUNT(DISTINCT CASE WHEN wins + losses + pushes > 0 THEN user_id END) as total_cappers
+                FROM capper_stats
+                WHERE guild_id = %s
             """, guild_id)
-            total_risked = total_risked_result.get('total_risked') or 0 if total_risked_result else 0
-            roi = (net_units / total_risked * 100.0) if total_risked > 0 else 0.0
-
-            return {
-                'total_bets': total_bets, 'wins': wins, 'losses': losses,
-                'pushes': stats.get('pushes') or 0, 'win_rate': win_rate,
-                'net_units': net_units, 'total_cappers': stats.get('total_cappers') or 0, 'roi': roi
-            }
+            summary = self._summarize(stats)
+            summary['total_cappers'] = int((stats or {}).get('total_cappers') or 0)
+            return summary
         except Exception as e:
             logger.exception(f"Error getting guild stats for guild {guild_id}: {e}")
             raise AnalyticsServiceError(f"Failed to get guild stats: {str(e)}")
 
+    def invalidate_leaderboards(self, guild_id: int):
+        """Drop cached leaderboard windows for a guild; call after one of its bets resolves or is deleted."""
+        self.leaderboard_cache.invalidate(guild_id)
+
+    async def _get_window_totals(self, guild_id: int, timeframe: str) -> Dict[int, Dict[str, float]]:
+        """Per-user totals for a timeframe, summed in SQL from capper_daily_stats buckets (cached)."""
+        start = window_start(timeframe)
+        totals = self.leaderboard_cache.get(guild_id, timeframe, start)
+        if totals is not None:
+            return totals
+
+        generation = self.leaderboard_cache.begin_load(guild_id)
+        query = """
+            SELECT user_id, SUM(wins) AS wins, SUM(losses) AS losses, SUM(pushes) AS pushes,
+                   SUM(units_risked) AS units_risked, SUM(net_units) AS net_units
+            FROM capper_daily_stats
+            WHERE guild_id = %s
+        """
+        params: List[Any] = [guild_id]
+        if start:
+            query += " AND day >= %s"
+            params.append(start)
+        query += " GROUP BY user_id"
+        rows = await self.db.fetch_all(query, *params)
+        totals = sum_buckets(rows or [])
+        self.leaderboard_cache.store(guild_id, timeframe, start, totals, generation)
+        return totals
+
     async def get_leaderboard(
         self,
         guild_id: int,
@@ -130,92 +243,25 @@ class AnalyticsService:
         limit: int = 10,
         metric: str = 'net_units'
     ) -> List[Dict[str, Any]]:
-        # ... (rest of your existing method)
+        """
+        Top cappers of a guild for 'daily' (today, UTC), 'weekly' (last 7 days),
+        'monthly' (last 30 days), 'yearly' (since 1 January) or 'all_time',
+        ranked by net_units, roi, win_rate or wins.
+        """
         try:
-            now = datetime.now(timezone.utc)
-            start_date = None
-            if timeframe == 'daily':
-                start_date = now - timedelta(days=1)
-            elif timeframe == 'weekly':
-                start_date = now - timedelta(weeks=1)
-            elif timeframe == 'monthly':
-                start_date = now - timedelta(days=30) # Approx month
-            elif timeframe == 'yearly':
-                start_date = datetime(now.year, 1, 1, tzinfo=timezone.utc)
-            # Add 'all_time' if needed, where start_date would be None
-
-            query_parts = [
-                """
-                SELECT
-                    b.user_id,
-                    COALESCE(u.username, CONCAT('User ', b.user_id)) as username,
-                    SUM(CASE WHEN b.status IN ('won', 'lost', 'push') THEN 1 ELSE 0 END) as total_resolved_bets,
-                    SUM(CASE WHEN b.status = 'won' THEN 1 ELSE 0 END) as wins,
-                    SUM(CASE WHEN b.status = 'lost' THEN 1 ELSE 0 END) as losses,
-                    COALESCE(SUM(ur.result_value), 0.0) as net_units,
-                    COALESCE(SUM(CASE WHEN b.status IN ('won', 'lost', 'push') THEN b.units ELSE 0 END), 0) as total_risked 
-                FROM bets b
-                LEFT JOIN unit_records ur ON b.bet_serial = ur.bet_serial
-                LEFT JOIN users u ON b.user_id = u.user_id
-                WHERE b.guild_id = %s AND b.status IN ('won', 'lost', 'push')
-                """
-            ]
-            params: List[Any] = [guild_id]
-
-            if start_date:
-                # Assuming 'created_at' in 'bets' table marks when bet was placed/resolved for timeframe filtering.
-                # If 'unit_records.created_at' is when it was resolved, adjust accordingly.
-                query_parts.append("AND b.updated_at >= %s") # Filter by when bet was last updated (likely resolved time)
-                params.append(start_date)
-
-            query_parts.append("GROUP BY b.user_id, u.username")
-
-            # Construct the main query part
-            main_query = " ".join(query_parts)
-
-            # Define order by logic
-            order_by_clause = ""
-            if metric == 'net_units':
-                order_by_clause = "ORDER BY net_units DESC"
-            elif metric == 'roi':
-                # Ensure total_risked is not zero to avoid division by zero for ROI calculation
-                order_by_clause = "ORDER BY CASE WHEN total_risked > 0 THEN (net_units / total_risked) ELSE -999999 END DESC, net_units DESC"
-            elif metric == 'win_rate':
-                order_by_clause = "ORDER BY CASE WHEN (wins + losses) > 0 THEN (wins * 1.0 / (wins + losses)) ELSE -1 END DESC, wins DESC"
-            elif metric == 'wins':
-                order_by_clause = "ORDER BY wins DESC"
-            else: # Default to net_units
-                order_by_clause = "ORDER BY net_units DESC"
-                logger.warning("Invalid leaderboard metric '%s', defaulting to net_units.", metric)
-
-            final_query = f"""
-                WITH UserAggregatedStats AS (
-                    {main_query}
-                )
-                SELECT
-                    us.user_id,
-                    us.username,
-                    us.total_resolved_bets,
-                    us.wins,
-                    us.losses,
-                    us.net_units,
-                    us.total_risked,
-                    CASE
-                        WHEN (us.wins + us.losses) > 0 THEN (us.wins * 100.0 / (us.wins + us.losses))
-                        ELSE 0.0
-                    END as win_rate,
-                    CASE
-                        WHEN us.total_risked > 0 THEN (us.net_units / us.total_risked * 100.0)
-                        ELSE 0.0
-                    END as roi
-                FROM UserAggregatedStats us
-                WHERE us.total_resolved_bets > 0 
-                {order_by_clause}
-                LIMIT %s
-            """
-            params.append(limit)
+            totals = await self._get_window_totals(guild_id, timeframe)
+            leaderboard_data = top_n(totals, metric, limit)
+            if not leaderboard_data:
+                return []
 
-            leaderboard_data = await self.db.fetch_all(final_query, *params)
+            user_ids = [row['user_id'] for row in leaderboard_data]
+            placeholders = ", ".join(["%s"] * len(user_ids))
+            users = await self.db.fetch_all(
+                f"SELECT user_id, username FROM users WHERE user_id IN ({placeholders})", *user_ids
+            )
+            usernames = {int(user['user_id']): user.get('username') for user in users or []}
+            for row in leaderboard_data:
+                row['username'] = usernames.get(row['user_id']) or f"User {row['user_id']}"
             return leaderboard_data
 
         except Exception as e:
@@ -2,7 +2,7 @@
 # Service module for handling TheSportsDB API calls
 
 from typing import List, Dict, Optional
-import thesportsdb
+from api.thesportsdb_client import TheSportsDBClient
 from config.leagues import LEAGUE_IDS
 from utils.helpers import (
     get_league_teams,
@@ -16,8 +16,35 @@ from utils.helpers import (
 class ApiService:
     """Service for fetching sports data from TheSportsDB API."""
 
-    @staticmethod
-    async def get_upcoming_events(league_key: str) -> List[Dict]:
+    _client: Optional[TheSportsDBClient] = None
+    # True when _client was created here (and so must be closed here)
+    _owns_client = False
+
+    @classmethod
+    def use_client(cls, client: TheSportsDBClient):
+        """Share an existing client (e.g. SportsAPI.client) instead of opening a new session."""
+        cls._client = client
+        cls._owns_client = False
+
+    @classmethod
+    def _get_client(cls) -> TheSportsDBClient:
+        """Return the shared client, creating one with its own session if needed."""
+        if cls._client is None:
+            cls._client = TheSportsDBClient()
+            cls._owns_client = True
+        return cls._client
+
+    @classmethod
+    async def close(cls):
+        """Close the fallback client's session; a shared client is closed by its owner."""
+        client, owns_client = cls._client, cls._owns_client
+        cls._client = None
+        cls._owns_client = False
+        if client is not None and owns_client:
+            await client.close()
+
+    @classmethod
+    async def get_upcoming_events(cls, league_key: str) -> List[Dict]:
         """Fetch upcoming events for a league."""
         league = LEAGUE_IDS.get(league_key, {})
         league_id = league.get("id")
@@ -25,8 +52,8 @@ class ApiService:
 
         if league_id:
             try:
-                events_data = thesportsdb.events.nextLeagueEvents(league_id)
-                if events_data and "events" in events_data:
+                events_data = await cls._get_client().next_league_events(league_id)
+                if events_data and events_data.get("events"):
                     for event in events_data["events"]:
                         home_team = event.get("strHomeTeam", "")
                         away_team = event.get("strAwayTeam", "")
@@ -40,7 +67,7 @@ class ApiService:
                 pass
         elif league_key in ["CFL", "AFL"]:
             # Mock events for unsupported leagues
-            teams = get_league_teams(league_key)
+            teams = await get_league_teams(league_key, cls._get_client())
             if len(teams) >= 2:
                 events.append({
                     "idEvent": f"mock_{league_key}_{teams[0]}_vs_{teams[1]}",
@@ -51,7 +78,7 @@ class ApiService:
                 })
         elif league_key == "Darts":
             # Mock Darts event with players
-            players = get_league_teams(league_key)[:2]  # First two players
+            players = (await get_league_teams(league_key, cls._get_client()))[:2]  # First two players
             if len(players) >= 2 and is_valid_darts_player(players[0]) and is_valid_darts_player(players[1]):
                 events.append({
                     "idEvent": f"mock_Darts_{players[0]}_vs_{players[1]}",
@@ -63,19 +90,19 @@ class ApiService:
 
         return events
 
-    @staticmethod
-    async def get_event_details(event_id: str) -> Optional[Dict]:
+    @classmethod
+    async def get_event_details(cls, event_id: str) -> Optional[Dict]:
         """Fetch details for a specific event."""
         try:
-            event_data = thesportsdb.events.eventInfo(event_id)
-            if event_data and "events" in event_data:
+            event_data = await cls._get_client().event_info(event_id)
+            if event_data and event_data.get("events"):
                 return event_data["events"][0]
         except Exception:
             pass
         return None
 
-    @staticmethod
-    async def get_league_standings(league_key: str, season: str = "2024-2025") -> List[Dict]:
+    @classmethod
+    async def get_league_standings(cls, league_key: str, season: str = "2024-2025") -> List[Dict]:
         """Fetch standings for a league."""
         league = LEAGUE_IDS.get(league_key, {})
         league_id = league.get("id")
@@ -83,17 +110,17 @@ class ApiService:
 
         if league_id:
             try:
-                standings_data = thesportsdb.leagues.leagueSeasonTable(league_id, season)
-                if standings_data and "table" in standings_data:
+                standings_data = await cls._get_client().league_season_table(league_id, season)
+                if standings_data and standings_data.get("table"):
                     standings = standings_data["table"]
             except Exception:
                 pass
         return standings
 
-    @staticmethod
-    async def get_teams(league_key: str) -> List[str]:
+    @classmethod
+    async def get_teams(cls, league_key: str) -> List[str]:
         """Fetch teams for a league."""
-        return get_league_teams(league_key)
+        return await get_league_teams(league_key, cls._get_client())
 
     @staticmethod
     async def get_team_logo(team_name: str, league_key: str) -> Optional[str]:
@@ -105,14 +132,15 @@ class ApiService:
         """Get the file path for a league’s logo."""
         return get_league_logo_path(league_key)
 
-    @staticmethod
-    async def get_player_details(player_name: str, league_key: str) -> Optional[Dict]:
+    @classmethod
+    async def get_player_details(cls, player_name: str, league_key: str) -> Optional[Dict]:
         """Fetch details for a player (e.g., Darts, Tennis, UFC/MMA)."""
         if league_key == "Darts" and is_valid_darts_player(player_name):
             try:
-                player_data = thesportsdb.players.playerInfo(player_name)
-                if player_data and "players" in player_data:
-                    return player_data["players"][0]
+                player_data = await cls._get_client().search_players(player_name)
+                players = (player_data or {}).get("player") or (player_data or {}).get("players")
+                if players:
+                    return players[0]
             except Exception:
                 pass
         return None
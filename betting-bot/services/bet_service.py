@@ -15,9 +15,11 @@ import asyncio
 try:
     from ..utils.errors import BetServiceError, ValidationError
     from ..data.db_manager import DatabaseManager # Added import for type hint if needed elsewhere
+    from .analytics_service import record_capper_result
 except ImportError:
     from utils.errors import BetServiceError, ValidationError
     from data.db_manager import DatabaseManager # Fallback
+    from services.analytics_service import record_capper_result
 
 logger = logging.getLogger(__name__)
 
@@ -382,9 +384,33 @@ class BetService:
             # Use the shared db_manager transaction context if available
             # Assuming CASCADE DELETE handles unit_records and bet_reactions based on schema FKs
 
-            # Delete the bet itself (FKs should handle cascades)
-            bet_query = "DELETE FROM bets WHERE bet_serial = %s"
-            rowcount, _ = await self.db_manager.execute(bet_query, (bet_serial,))
+            async with self.db_manager.transaction() as tx:
+                # A resolved bet is counted in capper_stats; take it back out first
+                resolved = await tx.fetch_one(
+                    """
+                    SELECT b.guild_id, b.user_id, b.league, b.bet_type, b.status, b.units,
+                           ur.monthly_result_value AS result_value,
+                           COALESCE(ur.created_at, b.updated_at) AS resolved_at
+                    FROM bets b
+                    LEFT JOIN unit_records ur ON b.bet_serial = ur.bet_serial
+                    WHERE b.bet_serial = %s
+                    FOR UPDATE
+                    """,
+                    (bet_serial,)
+                )
+                if resolved:
+                    await record_capper_result(
+                        tx, resolved['guild_id'], resolved['user_id'], resolved.get('league'),
+                        resolved.get('bet_type'), resolved['status'], resolved.get('units'),
+                        resolved.get('result_value'), resolved_at=resolved.get('resolved_at'), direction=-1
+                    )
+
+                # Delete the bet itself (FKs should handle cascades)
+                bet_query = "DELETE FROM bets WHERE bet_serial = %s"
+                rowcount, _ = await tx.execute(bet_query, (bet_serial,))
+
+            if resolved and resolved['status'] in ('won', 'lost', 'push') and hasattr(self.bot, 'analytics_service'):
+                self.bot.analytics_service.invalidate_leaderboards(resolved['guild_id'])
 
             if rowcount is not None and rowcount > 0:
                 # Remove from pending reactions cache
@@ -454,7 +480,6 @@ class BetService:
                 bet_serial, payload.user_id, emoji_str, channel_id,
                 message_id, datetime.now(timezone.utc) # Use DB's CURRENT_TIMESTAMP if preferred
             )
-            await self.db_manager.execute(reaction_query, reaction_params)
 
             # --- Handle Bet Resolution (Win/Loss/Push) ---
             resolve_emoji_map = {
@@ -463,109 +488,120 @@ class BetService:
                 '➖': 'push'  # Heavy minus sign (or choose another like 🅿️)
             }
 
-            if emoji_str in resolve_emoji_map:
-                 # Add permission check: only original user or admin can resolve?
-                 # Example:
-                 # if payload.user_id != original_user_id and not payload.member.guild_permissions.administrator:
-                 #      logger.warning(f"User {payload.user_id} tried to resolve bet {bet_serial} placed by {original_user_id}")
-                 #      # Optionally notify user they can't resolve it
-                 #      return
-
-                 new_status = resolve_emoji_map[emoji_str]
-                 logger.info(f"Attempting to resolve bet {bet_serial} as '{new_status}' by user {payload.user_id}")
-
-                 # --- Fetch Bet Details for Calculation ---
-                 bet_query = """
-                    SELECT guild_id, user_id, units, odds, status, bet_details, league, bet_type
-                    FROM bets
-                    WHERE bet_serial = %s
-                 """
-                 bet_data = await self.db_manager.fetch_one(bet_query, (bet_serial,))
-
-                 if not bet_data:
-                      logger.error(f"Cannot resolve bet: Bet {bet_serial} not found in DB.")
-                      return
-                 if bet_data['status'] not in ['pending', 'live']: # Only resolve pending/live bets
-                      logger.warning(f"Bet {bet_serial} cannot be resolved. Current status: {bet_data['status']}")
-                      # Optionally remove the reaction if it's invalid state
-                      # await self.on_raw_reaction_remove(payload) # Be careful of loops
-                      return
-
-                 # --- Update Bet Status ---
-                 status_query = "UPDATE bets SET status = %s, updated_at = %s WHERE bet_serial = %s"
-                 update_time = datetime.now(timezone.utc)
-                 rowcount, _ = await self.db_manager.execute(status_query, (new_status, update_time, bet_serial))
-
-                 if rowcount is None or rowcount == 0:
-                      logger.error(f"Failed to update status for bet {bet_serial} to {new_status}.")
-                      return # Don't proceed if status update failed
-
-                 logger.info(f"Bet {bet_serial} status updated to '{new_status}'.")
-
-                 # --- Calculate Result and Update Unit Records ---
-                 units_staked = bet_data.get('units')
-                 odds = bet_data.get('odds')
-                 result_value = 0.0
-
-                 # Ensure both are float for arithmetic
-                 if units_staked is not None:
-                     units_staked = float(units_staked)
-                 if odds is not None:
-                     odds = float(odds)
-
-                 if new_status == 'won':
-                     if odds is None or units_staked is None:
-                         logger.error(f"Missing odds or units for winning bet {bet_serial}")
-                         return
-                     if odds > 0:
-                         result_value = units_staked * (odds / 100.0)
-                     else: # Negative odds
-                         result_value = units_staked * (100.0 / abs(odds))
-                 elif new_status == 'lost':
-                     if units_staked is None:
-                         logger.error(f"Missing units for losing bet {bet_serial}")
-                         return
-                     result_value = -units_staked
-                 # else: status is 'push', result_value remains 0.0
-
-                 # Ensure we have necessary data
-                 if units_staked is None or odds is None:
-                      logger.error(f"Missing units or odds for bet {bet_serial}. Cannot record result.")
-                      return
-
-                 # --- Update Unit Records Table ---
-                 now = datetime.now(timezone.utc)
-                 year = now.year
-                 month = now.month
-
-                 # Use INSERT ... ON DUPLICATE KEY UPDATE to handle existing records for the bet
-                 unit_query = """
-                     INSERT INTO unit_records (
-                         bet_serial, guild_id, user_id, year, month, units, odds, monthly_result_value, yearly_result_value, created_at
-                     ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                     ON DUPLICATE KEY UPDATE
-                         monthly_result_value = VALUES(monthly_result_value),
-                         yearly_result_value = VALUES(yearly_result_value),
-                         created_at = VALUES(created_at) # Update timestamp on resolve
-                 """
-                 unit_params = (
-                     bet_serial, bet_data['guild_id'], bet_data['user_id'], year, month,
-                     units_staked, odds, result_value, result_value,
-                     update_time # Use the same timestamp as status update
-                 )
-                 await self.db_manager.execute(unit_query, unit_params)
-                 logger.info(f"Unit record updated for bet {bet_serial}. Result Value: {result_value:.2f}")
-
-                 # --- Trigger Voice Channel Update ---
-                 if hasattr(self.bot, 'voice_service') and hasattr(self.bot.voice_service, 'update_on_bet_resolve'):
-                    # Run update in background task to avoid blocking reaction handler
-                    asyncio.create_task(self.bot.voice_service.update_on_bet_resolve(bet_data['guild_id']))
-                    logger.debug(f"Triggered voice channel update for guild {bet_data['guild_id']}")
-
-                 # Optional: Remove message from pending_reactions after resolution?
-                 # Depends if you want further reactions (e.g., comments) tracked.
-                 # if message_id in self.pending_reactions:
-                 #     del self.pending_reactions[message_id]
+            if emoji_str not in resolve_emoji_map:
+                await self.db_manager.execute(reaction_query, reaction_params)
+                return
+
+            # Add permission check: only original user or admin can resolve?
+            # Example:
+            # if payload.user_id != original_user_id and not payload.member.guild_permissions.administrator:
+            #      logger.warning(f"User {payload.user_id} tried to resolve bet {bet_serial} placed by {original_user_id}")
+            #      # Optionally notify user they can't resolve it
+            #      return
+
+            new_status = resolve_emoji_map[emoji_str]
+            logger.info(f"Attempting to resolve bet {bet_serial} as '{new_status}' by user {payload.user_id}")
+
+            # Reaction insert, status update and unit record share one transaction
+            # so a resolution is committed once and either fully applied or not at all.
+            async with self.db_manager.transaction() as tx:
+                await tx.execute(reaction_query, reaction_params)
+
+                # --- Fetch Bet Details for Calculation ---
+                bet_query = """
+                   SELECT guild_id, user_id, units, odds, status, bet_details, league, bet_type
+                   FROM bets
+                   WHERE bet_serial = %s
+                   FOR UPDATE
+                """
+                bet_data = await tx.fetch_one(bet_query, (bet_serial,))
+
+                if not bet_data:
+                     logger.error(f"Cannot resolve bet: Bet {bet_serial} not found in DB.")
+                     return
+                if bet_data['status'] not in ['pending', 'live']: # Only resolve pending/live bets
+                     logger.warning(f"Bet {bet_serial} cannot be resolved. Current status: {bet_data['status']}")
+                     # Optionally remove the reaction if it's invalid state
+                     # await self.on_raw_reaction_remove(payload) # Be careful of loops
+                     return
+
+                # --- Calculate Result ---
+                units_staked = bet_data.get('units')
+                odds = bet_data.get('odds')
+                result_value = 0.0
+
+                # Ensure both are float for arithmetic
+                if units_staked is not None:
+                    units_staked = float(units_staked)
+                if odds is not None:
+                    odds = float(odds)
+
+                # Ensure we have necessary data before touching the bet status
+                if units_staked is None or odds is None:
+                     logger.error(f"Missing units or odds for bet {bet_serial}. Cannot record result.")
+                     return
+
+                if new_status == 'won':
+                    if odds > 0:
+                        result_value = units_staked * (odds / 100.0)
+                    else: # Negative odds
+                        result_value = units_staked * (100.0 / abs(odds))
+                elif new_status == 'lost':
+                    result_value = -units_staked
+                # else: status is 'push', result_value remains 0.0
+
+                # --- Update Bet Status ---
+                status_query = "UPDATE bets SET status = %s, updated_at = %s WHERE bet_serial = %s"
+                update_time = datetime.now(timezone.utc)
+                rowcount, _ = await tx.execute(status_query, (new_status, update_time, bet_serial))
+
+                if rowcount is None or rowcount == 0:
+                     logger.error(f"Failed to update status for bet {bet_serial} to {new_status}.")
+                     return # Don't proceed if status update failed
+
+                # --- Update Unit Records Table ---
+                year = update_time.year
+                month = update_time.month
+
+                # Use INSERT ... ON DUPLICATE KEY UPDATE to handle existing records for the bet
+                unit_query = """
+                    INSERT INTO unit_records (
+                        bet_serial, guild_id, user_id, year, month, units, odds, monthly_result_value, yearly_result_value, created_at
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE
+                        monthly_result_value = VALUES(monthly_result_value),
+                        yearly_result_value = VALUES(yearly_result_value),
+                        created_at = VALUES(created_at) # Update timestamp on resolve
+                """
+                unit_params = (
+                    bet_serial, bet_data['guild_id'], bet_data['user_id'], year, month,
+                    units_staked, odds, result_value, result_value,
+                    update_time # Use the same timestamp as status update
+                )
+                await tx.execute(unit_query, unit_params)
+
+                # --- Update Materialized Capper Stats ---
+                await record_capper_result(
+                    tx, bet_data['guild_id'], bet_data['user_id'], bet_data.get('league'),
+                    bet_data.get('bet_type'), new_status, units_staked, result_value, resolved_at=update_time
+                )
+
+            logger.info(f"Bet {bet_serial} status updated to '{new_status}'.")
+            logger.info(f"Unit record updated for bet {bet_serial}. Result Value: {result_value:.2f}")
+
+            if hasattr(self.bot, 'analytics_service'):
+                self.bot.analytics_service.invalidate_leaderboards(bet_data['guild_id'])
+
+            # --- Trigger Voice Channel Update ---
+            if hasattr(self.bot, 'voice_service') and hasattr(self.bot.voice_service, 'update_on_bet_resolve'):
+               # Run update in background task to avoid blocking reaction handler
+               asyncio.create_task(self.bot.voice_service.update_on_bet_resolve(bet_data['guild_id']))
+               logger.debug(f"Triggered voice channel update for guild {bet_data['guild_id']}")
+
+            # Optional: Remove message from pending_reactions after resolution?
+            # Depends if you want further reactions (e.g., comments) tracked.
+            # if message_id in self.pending_reactions:
+            #     del self.pending_reactions[message_id]
 
         except Exception as e:
             logger.error(f"Failed to handle reaction add for message {message_id}: {e}", exc_info=True)
@@ -13,10 +13,12 @@ try:
     from ..data.cache_manager import CacheManager
     from ..utils.errors import DataSyncError
     from ..config.api_settings import API_ENABLED, API_KEY, API_HOSTS
+    from ..config.database_mysql import MYSQL_BULK_CHUNK_SIZE
 except ImportError:
     from data.cache_manager import CacheManager
     from utils.errors import DataSyncError
     from config.api_settings import API_ENABLED, API_KEY, API_HOSTS
+    from config.database_mysql import MYSQL_BULK_CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +135,21 @@ class DataSyncService:
         except Exception as e:
             logger.exception(f"Error during _sync_all_data: {e}")
 
+    async def _bulk_upsert(self, upsert_query: str, data_tuples: List[tuple], label: str) -> int:
+        """Bulk upsert rows via DatabaseManager.execute_many and return how many rows were written."""
+        chunk_rowcounts = await self.db.execute_many(
+            upsert_query, data_tuples, chunk_size=MYSQL_BULK_CHUNK_SIZE
+        )
+        written = 0
+        for idx, rowcount in enumerate(chunk_rowcounts):
+            start = idx * MYSQL_BULK_CHUNK_SIZE
+            chunk_len = min(MYSQL_BULK_CHUNK_SIZE, len(data_tuples) - start)
+            if rowcount is None:
+                logger.error(f"Failed to upsert {label} rows {start}-{start + chunk_len - 1}")
+            else:
+                written += chunk_len
+        return written
+
     async def _sync_leagues(self, sport: str) -> List[Dict]:
         """Fetch and store/update leagues for a specific sport."""
         logger.debug(f"Syncing leagues for sport: {sport}")
@@ -172,13 +189,7 @@ class DataSyncService:
                      lg['country_flag'], lg['season'], lg['sport'])
                     for lg in processed_leagues
                 ]
-                count = 0
-                for data_tuple in data_tuples:
-                    try:
-                        await self.db.execute(upsert_query, *data_tuple)
-                        count += 1
-                    except Exception as e:
-                        logger.error(f"Error upserting league {data_tuple[0]}: {e}")
+                count = await self._bulk_upsert(upsert_query, data_tuples, f"leagues ({sport})")
                 logger.info(f"Upserted {count}/{len(processed_leagues)} leagues for sport: {sport}")
             return processed_leagues
         except Exception as e:
@@ -249,13 +260,7 @@ class DataSyncService:
                              t['venue_surface'], t['venue_image'], t['sport'])
                             for t in processed_teams
                         ]
-                        count = 0
-                        for data_tuple in data_tuples:
-                            try:
-                                await self.db.execute(upsert_query, *data_tuple)
-                                count += 1
-                            except Exception as e:
-                                logger.error(f"Error upserting team {data_tuple[0]}: {e}")
+                        count = await self._bulk_upsert(upsert_query, data_tuples, f"teams (league {league_id})")
 
                         all_processed_teams.extend(processed_teams)
                         logger.debug(f"Upserted {count}/{len(processed_teams)} teams for league {league_id}")
@@ -372,13 +377,7 @@ class DataSyncService:
                              s['goals_for'], s['goals_against'], s['sport'])
                             for s in processed_standings
                         ]
-                        count = 0
-                        for data_tuple in data_tuples:
-                            try:
-                                await self.db.execute(upsert_query, *data_tuple)
-                                count += 1
-                            except Exception as e:
-                                logger.error(f"Error upserting standing for team {data_tuple[1]} in league {data_tuple[0]}: {e}")
+                        count = await self._bulk_upsert(upsert_query, data_tuples, f"standings (league {league_id})")
 
                         all_processed_standings.extend(processed_standings)
                         logger.debug(f"Upserted {count}/{len(processed_standings)} standing entries for league {league_id}")
@@ -3,12 +3,14 @@
 
 import discord
 from discord import app_commands
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 import logging
 from datetime import datetime, timedelta, timezone
 import json
+import hashlib
 import aiohttp
 import asyncio
+import heapq
 import sys
 import os
 from dotenv import load_dotenv
@@ -22,8 +24,15 @@ from utils.errors import (
     GameServiceError, APIError, GameDataError, LeagueNotFoundError,
     ScheduleError, ConfigurationError
 )
+from config.settings import (
+    GAME_READ_COALESCE_TTL, LIVE_POLL_ACTIVE_INTERVAL, LIVE_POLL_BREAK_INTERVAL,
+    LIVE_POLL_DISCOVERY_INTERVAL, LIVE_POLL_MAX_CONCURRENCY
+)
 from api.sports_api import SportsAPI
+from services.api_service import ApiService
 from data.cache_manager import CacheManager
+from utils.single_flight import SingleFlight
+from utils.game_update_bus import GameUpdateBus
 
 # Load environment variables for RUN_API_FETCH_ON_START
 load_dotenv()
@@ -31,6 +40,22 @@ RUN_API_FETCH_ON_START = os.getenv('RUN_API_FETCH_ON_START', 'false').lower() ==
 
 logger = logging.getLogger(__name__)
 
+
+def _game_fingerprint(status: Optional[str], score: Any) -> str:
+    """
+    Compact fingerprint of a game's (status, score).
+    Scores stored as JSON strings and dicts with different key order hash the
+    same; empty scores ({} / '' / None) are treated as equal.
+    """
+    if isinstance(score, (str, bytes)):
+        try:
+            score = json.loads(score) if score else None
+        except ValueError:
+            pass
+    canonical = json.dumps([status, score or None], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).hexdigest()
+
+
 class GameService:
     def __init__(self, bot, db_manager):
         self.bot = bot
@@ -44,6 +69,16 @@ class GameService:
         self._poll_task: Optional[asyncio.Task] = None
         self.running = False
         self.api_hosts = API_HOSTS
+        # Coalescing for hot read paths: one in-flight query per key plus a short TTL cache
+        self._read_flights = SingleFlight()
+        self._read_cache = CacheManager(persist=False, max_entries=256)
+        self._read_generation = 0
+        # game_id -> fingerprint of the (status, score) last written for live games
+        self._live_fingerprints: Dict[Any, str] = {}
+        # league_id -> ids of its games that have an entry in _live_fingerprints
+        self._live_league_games: Dict[str, set] = {}
+        # Debounced fan-out of live game changes to subscribed guild channels
+        self.update_bus = GameUpdateBus(self._deliver_game_updates)
 
     async def start(self):
         """Initialize the game service's async components."""
@@ -53,10 +88,13 @@ class GameService:
             if hasattr(self.cache, 'connect'):
                 await self.cache.connect()
                 logger.info("GameService CacheManager connected.")
+            await self.update_bus.start()
+            await self.load_update_subscriptions()
 
             if API_ENABLED and self.api:
                 if hasattr(self.api, 'start'):
                     await self.api.start()
+                    ApiService.use_client(self.api.client)
                     logger.info("GameService SportsAPI started.")
                 
                 # Conditional API fetch on start
@@ -82,6 +120,7 @@ class GameService:
                 await self.api.close()
             if hasattr(self.cache, 'close'):
                 await self.cache.close()
+            await self.update_bus.close()
             raise GameServiceError("Failed to start game service")
 
     async def stop(self):
@@ -104,6 +143,7 @@ class GameService:
             except Exception as e:
                 logger.error(f"Error awaiting task cancellation: {e}")
 
+        await self.update_bus.close()
         if self.session:
             await self.session.close()
         self.active_games.clear()
@@ -130,24 +170,17 @@ class GameService:
                     """,
                     'scheduled', now_utc
                 )
-                for game in starting_games:
-                    logger.info(f"Game starting: ID {game['id']} in guild {game.get('guild_id', 'N/A')}")
-                    await self.update_game_status(game.get('guild_id'), game['id'], 'live')
-                    await self.add_game_event(game.get('guild_id'), game['id'], 'game_start', 'Game has started')
-
+                in_play = ", ".join(["%s"] * len(self._IN_PLAY_STATUSES))
                 ending_games = await self.db.fetch_all(
-                    """
-                    SELECT id, score
+                    f"""
+                    SELECT id, league_id, home_team_id, away_team_id, score
                     FROM api_games
-                    WHERE status = %s AND end_time IS NOT NULL AND end_time <= %s
+                    WHERE status IN ({in_play})
+                      AND end_time IS NOT NULL AND end_time <= %s
                     """,
-                    'live', now_utc
+                    *self._IN_PLAY_STATUSES, now_utc
                 )
-                for game in ending_games:
-                    logger.info(f"Game ending: ID {game['id']} in guild {game.get('guild_id', 'N/A')}")
-                    final_score_str = json.dumps(game.get('score', {}))
-                    await self.update_game_status(game.get('guild_id'), game['id'], 'completed', final_score_str)
-                    await self.add_game_event(game.get('guild_id'), game['id'], 'game_end', f"Game has ended. Final Score: {final_score_str}")
+                await self._apply_status_transitions(starting_games, ending_games)
 
                 await asyncio.sleep(60)
             except asyncio.CancelledError:
@@ -157,6 +190,32 @@ class GameService:
                 logger.exception(f"Error in game status update loop: {e}")
                 await asyncio.sleep(120)
 
+    async def _apply_status_transitions(self, starting_games: List[Dict], ending_games: List[Dict]) -> None:
+        """Move all due games to 'live'/'completed' and record their game_events in bulk."""
+        if not starting_games and not ending_games:
+            return
+
+        events = []
+        if starting_games:
+            start_ids = [game['id'] for game in starting_games]
+            await self.bulk_update_game_status(start_ids, 'live')
+            events.extend((None, game_id, 'game_start', 'Game has started') for game_id in start_ids)
+            for game in starting_games:
+                await self._notify_game_updates({**game, 'status': 'live', 'event': 'game_start'})
+            logger.info(f"{len(start_ids)} games starting: {start_ids}")
+
+        if ending_games:
+            end_ids = [game['id'] for game in ending_games]
+            await self.bulk_update_game_status(end_ids, 'completed')
+            for game in ending_games:
+                final_score = game.get('score')
+                final_score_str = final_score if isinstance(final_score, str) else json.dumps(final_score or {})
+                events.append((None, game['id'], 'game_end', f"Game has ended. Final Score: {final_score_str}"))
+                await self._notify_game_updates({**game, 'status': 'completed', 'event': 'game_end'})
+            logger.info(f"{len(end_ids)} games ending: {end_ids}")
+
+        await self.add_game_events(events)
+
     async def _fetch_initial_games(self) -> None:
         """Fetch initial game data from api_games table."""
         if not API_ENABLED or not self.api:
@@ -175,35 +234,64 @@ class GameService:
         except Exception as e:
             logger.exception(f"Error fetching initial games overall: {e}")
 
+    # Statuses reported during a break in play; polled at the relaxed interval
+    _BREAK_STATUSES = {'HT', 'BT', 'BREAK', 'INT', 'INTERMISSION', 'HALFTIME', 'P', 'PAUSED', 'SUSP', 'DELAYED'}
+    # Statuses of a game still in progress: the live poller keeps following these
+    _IN_PLAY_STATUSES = ('live',) + tuple(sorted(_BREAK_STATUSES))
+
+    @classmethod
+    def _is_in_play(cls, status: Any) -> bool:
+        return str(status or '').lower() == 'live' or str(status or '').upper() in cls._BREAK_STATUSES
+
     async def _poll_games(self) -> None:
-        """Poll for live game updates from api_games."""
+        """
+        Poll live leagues on an adaptive schedule.
+
+        A heap keyed by next-due time holds one entry per league with live games.
+        Leagues whose scores are changing are re-polled every LIVE_POLL_ACTIVE_INTERVAL;
+        quiet leagues back off towards LIVE_POLL_BREAK_INTERVAL, leagues in an
+        intermission go straight to it, and leagues with no live games left are dropped
+        until the next discovery scan. Due leagues are polled concurrently, bounded by
+        LIVE_POLL_MAX_CONCURRENCY.
+        """
         if not API_ENABLED or not self.api:
             return
         await self.bot.wait_until_ready()
+        loop = asyncio.get_running_loop()
+        schedule: List[Tuple[float, str]] = []
+        league_state: Dict[str, Dict[str, Any]] = {}
+        semaphore = asyncio.Semaphore(LIVE_POLL_MAX_CONCURRENCY)
+        next_discovery = 0.0
         while self.running:
             try:
-                logger.debug("Polling for live game updates...")
-                live_game_leagues = await self.db.fetch_all(
-                    """
-                    SELECT DISTINCT g.league_id, g.sport
-                    FROM api_games g
-                    WHERE g.status = %s
-                    """,
-                    'live'
-                )
-                if not live_game_leagues:
-                    logger.debug("No leagues with live games found.")
-                    await asyncio.sleep(120)
-                    continue
-
-                for league in live_game_leagues:
-                    league_id = str(league['league_id'])
-                    sport = league['sport']
-                    games = await self.get_league_games(None, league_id, "live", 25)
-                    logger.debug(f"Polled {len(games)} live games for league {league_id} (Sport: {sport})")
-                    await self._process_live_game_updates(league_id, games, sport)
-
-                await asyncio.sleep(60)
+                now = loop.time()
+                if now >= next_discovery:
+                    await self._discover_live_leagues(schedule, league_state, now)
+                    next_discovery = now + LIVE_POLL_DISCOVERY_INTERVAL
+
+                due = []
+                while schedule and schedule[0][0] <= now:
+                    due.append(heapq.heappop(schedule)[1])
+
+                if due:
+                    results = await asyncio.gather(
+                        *(self._poll_league(league_id, league_state[league_id], semaphore) for league_id in due),
+                        return_exceptions=True
+                    )
+                    now = loop.time()
+                    for league_id, next_interval in zip(due, results):
+                        if isinstance(next_interval, Exception):
+                            logger.error(f"Error polling live league {league_id}: {next_interval}")
+                            next_interval = LIVE_POLL_BREAK_INTERVAL
+                        if next_interval is None:
+                            logger.debug(f"No live games left in league {league_id}; dropping from poll schedule.")
+                            league_state.pop(league_id, None)
+                            continue
+                        league_state[league_id]['interval'] = next_interval
+                        heapq.heappush(schedule, (now + next_interval, league_id))
+
+                next_wake = min(schedule[0][0], next_discovery) if schedule else next_discovery
+                await asyncio.sleep(max(1.0, next_wake - loop.time()))
             except asyncio.CancelledError:
                 logger.info("Game polling loop cancelled.")
                 break
@@ -211,21 +299,80 @@ class GameService:
                 logger.exception(f"Error in game polling loop: {e}")
                 await asyncio.sleep(120)
 
-    async def _process_live_game_updates(self, league_id: int, api_games: List[Dict], sport: str):
-        """Process updates for live games."""
+    async def _discover_live_leagues(
+        self, schedule: List[Tuple[float, str]], league_state: Dict[str, Dict[str, Any]], now: float
+    ) -> None:
+        """Add leagues that have games in progress but are not yet on the poll schedule."""
+        placeholders = ", ".join(["%s"] * len(self._IN_PLAY_STATUSES))
+        live_game_leagues = await self.db.fetch_all(
+            f"""
+            SELECT DISTINCT g.league_id, g.sport
+            FROM api_games g
+            WHERE g.status IN ({placeholders})
+            """,
+            *self._IN_PLAY_STATUSES
+        )
+        for league in live_game_leagues:
+            league_id = str(league['league_id'])
+            if league_id in league_state:
+                continue
+            league_state[league_id] = {'sport': league['sport'], 'interval': LIVE_POLL_ACTIVE_INTERVAL}
+            heapq.heappush(schedule, (now, league_id))
+            logger.debug(f"Scheduling live polling for league {league_id} (Sport: {league['sport']})")
+
+    async def _poll_league(
+        self, league_id: str, state: Dict[str, Any], semaphore: asyncio.Semaphore
+    ) -> Optional[float]:
+        """Poll one league and return the delay until its next poll, or None to drop it."""
+        async with semaphore:
+            games = await self._get_in_play_games(league_id, 25)
+            logger.debug(f"Polled {len(games)} in-play games for league {league_id} (Sport: {state['sport']})")
+            if not games:
+                self._forget_live_games(league_id)
+                return None
+            changed = await self._process_live_game_updates(league_id, games, state['sport'])
+
+        if all(str(game.get('status', '')).upper() in self._BREAK_STATUSES for game in games):
+            return LIVE_POLL_BREAK_INTERVAL
+        if changed:
+            return LIVE_POLL_ACTIVE_INTERVAL
+        # Nothing moved: back off gradually towards the relaxed interval
+        return min(LIVE_POLL_BREAK_INTERVAL, state['interval'] * 1.5)
+
+    async def _get_in_play_games(self, league_id: str, limit: int = 25) -> List[Dict]:
+        """Get a league's games that are live or in a break in play (see _IN_PLAY_STATUSES)."""
+        placeholders = ", ".join(["%s"] * len(self._IN_PLAY_STATUSES))
+        query = f"""
+            SELECT g.*, l.name as league_name
+            FROM api_games g
+            LEFT JOIN leagues l ON g.league_id = l.id
+            WHERE g.league_id = %s AND g.status IN ({placeholders})
+            ORDER BY CASE WHEN g.start_time IS NULL THEN 1 ELSE 0 END, g.start_time DESC LIMIT %s
+        """
+        params: List[Any] = [league_id, *self._IN_PLAY_STATUSES, limit]
+        return await self._coalesced_read(
+            f"in_play_games:{league_id}:{limit}", lambda: self.db.fetch_all(query, *params)
+        )
+
+    async def _process_live_game_updates(self, league_id: int, api_games: List[Dict], sport: str) -> int:
+        """Process updates for live games. Returns the number of games written."""
         logger.debug(f"Processing {len(api_games)} live updates for league {league_id}...")
         if not api_games:
-            return
+            return 0
         try:
+            placeholders = ", ".join(["%s"] * len(self._IN_PLAY_STATUSES))
             db_games_list = await self.db.fetch_all(
-                """
-                SELECT id, status, score, updated_at
+                f"""
+                SELECT id, status, score, score_fingerprint
                 FROM api_games
-                WHERE league_id = %s AND status = %s
+                WHERE league_id = %s AND status IN ({placeholders})
                 """,
-                league_id, 'live'
+                league_id, *self._IN_PLAY_STATUSES
             )
             db_games_map = {game['id']: game for game in db_games_list}
+            # Games of this league that are no longer in play keep no fingerprint
+            self._forget_live_games(league_id, keep_ids=db_games_map.keys())
+            self._live_league_games[str(league_id)] = set(db_games_map)
             games_to_update = []
 
             for api_game in api_games:
@@ -234,51 +381,150 @@ class GameService:
                     continue
                 api_status = api_game.get('status', 'scheduled')
                 api_score_obj = api_game.get('score', {})
-                api_score_str = json.dumps(api_score_obj) if api_score_obj else None
-                api_updated_at = datetime.now(timezone.utc)
                 db_game = db_games_map.get(api_game_id)
 
                 if db_game:
-                    db_score_str = json.dumps(db_game.get('score', {}))
-                    if db_game.get('status') != api_status or db_score_str != api_score_str:
-                        logger.info(
-                            f"Change detected for live game {api_game_id}: "
-                            f"Status '{db_game.get('status')}'->'{api_status}', "
-                            f"Score '{db_score_str}'->'{api_score_str}'"
-                        )
-                        games_to_update.append({
-                            'id': api_game_id,
-                            'status': api_status,
-                            'score': api_score_str,
-                            'updated_at': api_updated_at
-                        })
+                    fingerprint = _game_fingerprint(api_status, api_score_obj)
+                    known = (
+                        self._live_fingerprints.get(api_game_id)
+                        or db_game.get('score_fingerprint')
+                        or _game_fingerprint(db_game.get('status'), db_game.get('score'))
+                    )
+                    if fingerprint == known:
+                        self._live_fingerprints[api_game_id] = fingerprint
+                        continue
+                    if isinstance(api_score_obj, (str, bytes)):
+                        api_score_str = api_score_obj or None
+                    else:
+                        api_score_str = json.dumps(api_score_obj) if api_score_obj else None
+                    logger.info(
+                        f"Change detected for live game {api_game_id}: "
+                        f"Status '{db_game.get('status')}'->'{api_status}', "
+                        f"Score '{db_game.get('score')}'->'{api_score_str}'"
+                    )
+                    games_to_update.append({
+                        'id': api_game_id,
+                        'status': api_status,
+                        'score': api_score_str,
+                        'fingerprint': fingerprint,
+                        'game': api_game
+                    })
                 else:
-                    logger.warning(f"Live game {api_game_id} from api_games not found in DB as 'live'. Status: {api_status}")
+                    logger.warning(f"Live game {api_game_id} from api_games not found in DB as in play. Status: {api_status}")
 
-            if games_to_update:
-                update_query = """
-                    UPDATE api_games
-                    SET status = %s, score = %s, updated_at = %s
-                    WHERE id = %s
-                """
-                updated_count = 0
+            if not games_to_update:
+                return 0
+            updated_count = await self._write_live_updates(games_to_update)
+            logger.info(f"Updated {updated_count}/{len(games_to_update)} live games in DB for league {league_id}.")
+            if updated_count:
                 for game_upd in games_to_update:
-                    rows_affected = await self.db.execute(
-                        update_query,
-                        game_upd['status'], game_upd['score'], game_upd['updated_at'], game_upd['id']
-                    )
-                    if rows_affected is not None and rows_affected > 0:
-                        updated_count += 1
-                    else:
-                        logger.warning(f"Failed to update game {game_upd['id']} during live update processing.")
-                logger.info(f"Updated {updated_count}/{len(games_to_update)} live games in DB for league {league_id}.")
+                    await self._notify_game_updates({
+                        **game_upd['game'],
+                        'status': game_upd['status'],
+                        'score': game_upd['score'],
+                        'event': 'score_update'
+                    })
+            return len(games_to_update)
         except Exception as e:
             logger.exception(f"Error processing live game updates for league {league_id}: {e}")
+            return 0
+
+    def _forget_live_games(self, league_id: Any, keep_ids=()) -> None:
+        """Drop the cached fingerprints of a league's games, except `keep_ids`."""
+        keep = set(keep_ids)
+        for game_id in self._live_league_games.pop(str(league_id), set()) - keep:
+            self._live_fingerprints.pop(game_id, None)
+
+    async def _write_live_updates(self, games_to_update: List[Dict]) -> int:
+        """Write changed status/score for many games in one UPDATE ... CASE statement."""
+        cases = " ".join(["WHEN %s THEN %s"] * len(games_to_update))
+        placeholders = ", ".join(["%s"] * len(games_to_update))
+        update_query = f"""
+            UPDATE api_games
+            SET status = CASE id {cases} END,
+                score = CASE id {cases} END,
+                score_fingerprint = CASE id {cases} END,
+                updated_at = %s
+            WHERE id IN ({placeholders})
+        """
+        params: List[Any] = []
+        for column in ('status', 'score', 'fingerprint'):
+            for game_upd in games_to_update:
+                params.extend((game_upd['id'], game_upd[column]))
+        params.append(datetime.now(timezone.utc))
+        params.extend(game_upd['id'] for game_upd in games_to_update)
+
+        rows_affected, _ = await self.db.execute(update_query, *params)
+        await self._invalidate_game_reads()
+        if rows_affected is None:
+            logger.warning(f"Batched live update failed for games {[g['id'] for g in games_to_update]}.")
+            return 0
+        for game_upd in games_to_update:
+            if self._is_in_play(game_upd['status']):
+                self._live_fingerprints[game_upd['id']] = game_upd['fingerprint']
+            else:
+                self._live_fingerprints.pop(game_upd['id'], None)
+        return rows_affected
 
     async def _notify_game_updates(self, game_data: Dict) -> None:
-        """Notify about game updates (placeholder)."""
-        logger.debug(f"Placeholder: Notifying about update for game {game_data.get('id')}")
-        pass
+        """Publish a game change to the update bus (debounced per game, fanned out per channel)."""
+        self.update_bus.publish(game_data)
+
+    async def _deliver_game_updates(self, channel_id: int, updates: List[Dict]) -> None:
+        """Send one batch of game updates to a channel, up to 10 embeds per message."""
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            logger.warning(f"Game update channel {channel_id} not found; skipping {len(updates)} updates.")
+            return
+        embeds = []
+        for update in updates:
+            try:
+                embeds.append(self._create_game_embed(update))
+            except Exception as e:
+                logger.error(f"Could not build update embed for game {update.get('id')}: {e}")
+        for i in range(0, len(embeds), 10):
+            await channel.send(embeds=embeds[i:i + 10])
+
+    def subscribe_to_updates(self, guild_id: int, channel_id: int, league_ids: Optional[List[Any]] = None) -> None:
+        """Post live updates for `league_ids` (or all leagues) to a guild channel."""
+        self.update_bus.subscribe(guild_id, channel_id, league_ids)
+
+    def unsubscribe_from_updates(self, guild_id: int, channel_id: Optional[int] = None) -> None:
+        """Stop live updates for one channel, or for the whole guild."""
+        self.update_bus.unsubscribe(guild_id, channel_id)
+
+    def sync_guild_subscriptions(self, guild_id: int, settings: Optional[Dict[str, Any]]) -> None:
+        """
+        Apply a guild's opt-in live update settings from its guild_settings row:
+        updates go to `live_updates_channel_id`, limited to the comma-separated league
+        ids in `live_updates_leagues` (all leagues if empty). Without a channel (or
+        without a row) the guild has no subscription.
+        """
+        self.update_bus.unsubscribe(guild_id)
+        settings = settings or {}
+        channel_id = settings.get('live_updates_channel_id')
+        if not channel_id:
+            return
+        leagues = [league.strip() for league in str(settings.get('live_updates_leagues') or '').split(',') if league.strip()]
+        self.update_bus.subscribe(guild_id, int(channel_id), leagues or None)
+
+    async def load_update_subscriptions(self) -> int:
+        """Subscribe every guild that opted into live updates with one query; returns the guild count."""
+        try:
+            rows = await self.db.fetch_all(
+                """
+                SELECT guild_id, live_updates_channel_id, live_updates_leagues
+                FROM guild_settings
+                WHERE live_updates_channel_id IS NOT NULL
+                """
+            )
+        except Exception as e:
+            logger.warning(f"Could not load live update subscriptions: {e}")
+            return 0
+        for row in rows:
+            self.sync_guild_subscriptions(int(row['guild_id']), row)
+        logger.info(f"Live game updates subscribed for {len(rows)} guilds.")
+        return len(rows)
 
     def _create_game_embed(self, game: Dict) -> discord.Embed:
         """Create a Discord embed for a game."""
@@ -286,13 +532,15 @@ class GameService:
         home_team = f"Team ID: {game.get('home_team_id', 'N/A')}"
         away_team = f"Team ID: {game.get('away_team_id', 'N/A')}"
         league = game.get('league_name', game.get('league_id', 'N/A'))
-        status = game.get('status', 'N/A')
-        score_data = game.get('score', {})
-        if isinstance(score_data, str):
+        status = str(game.get('status') or 'N/A')
+        score_data = game.get('score') or {}
+        if isinstance(score_data, (str, bytes)):
             try:
                 score_data = json.loads(score_data)
             except json.JSONDecodeError:
                 score_data = {}
+        if not isinstance(score_data, dict):
+            score_data = {}
         home_score = score_data.get('home', '?')
         away_score = score_data.get('away', '?')
         game_time_info = None  # Not available in api_games
@@ -309,6 +557,32 @@ class GameService:
         embed.timestamp = datetime.now(timezone.utc)
         return embed
 
+    async def _coalesced_read(self, key: str, loader) -> List[Dict]:
+        """
+        Serve a read through the short TTL cache, and make concurrent identical
+        reads share a single in-flight `loader()` call.
+        """
+        cached = await self._read_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        generation = self._read_generation
+
+        async def load_and_cache():
+            result = await loader()
+            # Don't cache a result that raced with a write
+            if generation == self._read_generation:
+                await self._read_cache.set(key, result, ttl=GAME_READ_COALESCE_TTL)
+            return result
+
+        return list(await self._read_flights.do(key, load_and_cache))
+
+    async def _invalidate_game_reads(self) -> None:
+        """Drop coalesced read results after api_games has been written."""
+        self._read_generation += 1
+        self._read_flights.forget_all()
+        await self._read_cache.clear()
+
     async def get_game(self, game_id: int) -> Optional[Dict[str, Any]]:
         """Get a single game by its ID."""
         try:
@@ -357,7 +631,8 @@ class GameService:
             query += " ORDER BY CASE WHEN g.start_time IS NULL THEN 1 ELSE 0 END, g.start_time DESC LIMIT %s"
             params.append(limit)
 
-            return await self.db.fetch_all(query, *params)
+            cache_key = f"league_games:{league}:{status}:{limit}"
+            return await self._coalesced_read(cache_key, lambda: self.db.fetch_all(query, *params))
         except Exception as e:
             logger.exception(f"Error getting league games for league '{league}': {e}")
             return []
@@ -382,7 +657,9 @@ class GameService:
             query += " ORDER BY start_time ASC LIMIT %s"
             params.append(limit)
 
-            return await self.db.fetch_all(query, *params)
+            # Bucket the window start to the minute so concurrent calls share a key
+            cache_key = f"upcoming_games:{now_utc.strftime('%Y%m%d%H%M')}:{hours}:{limit}"
+            return await self._coalesced_read(cache_key, lambda: self.db.fetch_all(query, *params))
         except Exception as e:
             logger.exception(f"Error getting upcoming games: {e}")
             return []
@@ -396,7 +673,7 @@ class GameService:
             query += " ORDER BY start_time DESC LIMIT %s"
             params.append(limit)
 
-            return await self.db.fetch_all(query, *params)
+            return await self._coalesced_read(f"live_games:{limit}", lambda: self.db.fetch_all(query, *params))
         except Exception as e:
             logger.exception(f"Error getting live games: {e}")
             return []
@@ -406,22 +683,33 @@ class GameService:
         guild_id: Optional[int],
         game_id: int,
         status: str,
-        score: Optional[str] = None
+        score: Optional[str] = None,
+        fetch_updated: bool = True
     ) -> Optional[Dict]:
-        """Update the status and score of a game."""
+        """
+        Update the status and score of a game.
+        Returns the re-read game row, or {'id': game_id} without a re-read if
+        `fetch_updated` is False.
+        """
         try:
+            fingerprint = _game_fingerprint(status, score)
             update_query = """
                 UPDATE api_games
-                SET status = %s, score = %s, updated_at = %s
+                SET status = %s, score = %s, score_fingerprint = %s, updated_at = %s
                 WHERE id = %s
             """
-            params: List[Any] = [status, score, datetime.now(timezone.utc), game_id]
+            params: List[Any] = [status, score, fingerprint, datetime.now(timezone.utc), game_id]
 
-            update_status = await self.db.execute(update_query, *params)
+            update_status, _ = await self.db.execute(update_query, *params)
+            await self._invalidate_game_reads()
 
             if update_status is not None and update_status > 0:
+                if self._is_in_play(status):
+                    self._live_fingerprints[game_id] = fingerprint
+                else:
+                    self._live_fingerprints.pop(game_id, None)
                 logger.info(f"Updated status for game {game_id} to {status}")
-                return await self.get_game(game_id)
+                return await self.get_game(game_id) if fetch_updated else {'id': game_id}
             else:
                 logger.warning(f"Game {game_id} status update failed (rows affected: {update_status}).")
                 return None
@@ -429,25 +717,123 @@ class GameService:
             logger.exception(f"Error updating game status for game {game_id}: {e}")
             raise GameServiceError(f"Failed to update game status: {str(e)}")
 
+    # Bound the size of "id IN (...)" lists in set-based updates
+    _BULK_ID_CHUNK = 500
+
+    async def bulk_update_game_status(
+        self,
+        game_ids: List[int],
+        status: str,
+        fetch_updated: bool = False
+    ) -> Union[int, List[Dict]]:
+        """
+        Set `status` on many games with one `UPDATE ... WHERE id IN (...)` per chunk.
+        Their stored fingerprints are cleared, so the live poller recomputes them
+        from the new status and score.
+        Returns the number of rows updated, or the updated game rows if
+        `fetch_updated` is True.
+        """
+        if not game_ids:
+            return [] if fetch_updated else 0
+        try:
+            updated_at = datetime.now(timezone.utc)
+            total = 0
+            for offset in range(0, len(game_ids), self._BULK_ID_CHUNK):
+                chunk = game_ids[offset:offset + self._BULK_ID_CHUNK]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                rowcount, _ = await self.db.execute(
+                    f"UPDATE api_games SET status = %s, score_fingerprint = NULL, updated_at = %s "
+                    f"WHERE id IN ({placeholders})",
+                    status, updated_at, *chunk
+                )
+                for game_id in chunk:
+                    self._live_fingerprints.pop(game_id, None)
+                if rowcount is None:
+                    logger.warning(f"Bulk status update to '{status}' failed for games {chunk}.")
+                else:
+                    total += rowcount
+            await self._invalidate_game_reads()
+            logger.info(f"Updated status to '{status}' for {total}/{len(game_ids)} games")
+
+            if not fetch_updated:
+                return total
+            rows = []
+            for offset in range(0, len(game_ids), self._BULK_ID_CHUNK):
+                chunk = game_ids[offset:offset + self._BULK_ID_CHUNK]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                rows.extend(await self.db.fetch_all(f"SELECT * FROM api_games WHERE id IN ({placeholders})", *chunk))
+            return rows
+        except Exception as e:
+            logger.exception(f"Error bulk updating game status to '{status}': {e}")
+            raise GameServiceError(f"Failed to bulk update game status: {str(e)}")
+
+    async def add_game_events(
+        self,
+        events: List[Tuple[Optional[int], int, str, str]],
+        fetch_inserted: bool = False
+    ) -> Union[int, List[Dict]]:
+        """
+        Insert many (guild_id, game_id, event_type, details) rows into game_events
+        with multi-row INSERTs. Returns the number of rows inserted, or the new rows
+        if `fetch_inserted` is True.
+        """
+        if not events:
+            return [] if fetch_inserted else 0
+        try:
+            # Second precision so the batch can be re-selected by created_at (TIMESTAMP column)
+            created_at = datetime.now(timezone.utc).replace(microsecond=0)
+            rows = [(guild_id, game_id, event_type, details, created_at) for guild_id, game_id, event_type, details in events]
+            chunk_rowcounts = await self.db.execute_many(
+                """
+                INSERT INTO game_events (guild_id, game_id, event_type, details, created_at)
+                VALUES (%s, %s, %s, %s, %s)
+                """,
+                rows
+            )
+            inserted = sum(rc for rc in chunk_rowcounts if rc)
+            if inserted < len(rows):
+                logger.warning(f"Inserted {inserted}/{len(rows)} game events.")
+            else:
+                logger.info(f"Added {inserted} game events")
+
+            if not fetch_inserted:
+                return inserted
+            game_ids = list({game_id for _, game_id, _, _ in events})
+            placeholders = ", ".join(["%s"] * len(game_ids))
+            return await self.db.fetch_all(
+                f"SELECT * FROM game_events WHERE game_id IN ({placeholders}) AND created_at = %s",
+                *game_ids, created_at
+            )
+        except Exception as e:
+            logger.exception(f"Error adding game events: {e}")
+            raise GameServiceError(f"Failed to add game events: {str(e)}")
+
     async def add_game_event(
         self,
         guild_id: Optional[int],
         game_id: int,
         event_type: str,
-        details: str
+        details: str,
+        fetch_inserted: bool = True
     ) -> Optional[Dict]:
-        """Add an event for a game."""
+        """
+        Add an event for a game.
+        Returns the re-read event row, or {'event_id': id} without a re-read if
+        `fetch_inserted` is False.
+        """
         try:
             insert_query = """
                 INSERT INTO game_events (guild_id, game_id, event_type, details, created_at)
                 VALUES (%s, %s, %s, %s, %s)
             """
-            last_id = await self.db.execute(
+            _, last_id = await self.db.execute(
                 insert_query,
                 guild_id, game_id, event_type, details, datetime.now(timezone.utc)
             )
             if last_id:
                 logger.info(f"Added event '{event_type}' for game {game_id}")
+                if not fetch_inserted:
+                    return {'event_id': last_id}
                 return await self.db.fetch_one("SELECT * FROM game_events WHERE event_id = %s", last_id)
             else:
                 logger.error(f"Failed to add event '{event_type}' for game {game_id} (no last ID returned).")
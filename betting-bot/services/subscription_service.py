@@ -5,8 +5,10 @@ from datetime import datetime, timedelta
 logger = logging.getLogger(__name__)
 
 class SubscriptionService:
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, admin_service):
         self.db_manager = db_manager
+        # guild_settings is cached by AdminService, so is_paid is written through it
+        self.admin_service = admin_service
 
     async def create_subscription(self, guild_id: int, user_id: int, plan_type: str = 'premium') -> bool:
         """Create a new subscription for a guild."""
@@ -24,12 +26,7 @@ class SubscriptionService:
             )
 
             # Update guild settings to mark as paid
-            await self.db_manager.execute(
-                "UPDATE guild_settings SET is_paid = TRUE WHERE guild_id = %s",
-                guild_id
-            )
-
-            return True
+            return await self.admin_service.update_guild_settings(guild_id, {'is_paid': True})
         except Exception as e:
             logger.error(f"Error creating subscription for guild {guild_id}: {e}")
             return False
@@ -63,12 +60,7 @@ class SubscriptionService:
             )
 
             # Update guild settings to mark as unpaid
-            await self.db_manager.execute(
-                "UPDATE guild_settings SET is_paid = FALSE WHERE guild_id = %s",
-                guild_id
-            )
-
-            return True
+            return await self.admin_service.update_guild_settings(guild_id, {'is_paid': False})
         except Exception as e:
             logger.error(f"Error canceling subscription for guild {guild_id}: {e}")
             return False
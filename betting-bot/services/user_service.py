@@ -36,13 +36,14 @@ class UserService:
     async def stop(self):
         """Clean up resources."""
         logger.info("Stopping UserService...")
+        await self.cache.close()
         logger.info("User service stopped.")
 
     async def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user data by ID (from cache or DB)."""
         cache_key = f"user:{user_id}"
         try:
-            cached_user = self.cache.get(cache_key)
+            cached_user = await self.cache.get(cache_key)
             if cached_user:
                 logger.debug(f"Cache hit for user {user_id}")
                 if 'balance' in cached_user and cached_user['balance'] is not None:
@@ -62,7 +63,7 @@ class UserService:
             if user_data:
                 if 'balance' in user_data and user_data['balance'] is not None:
                     user_data['balance'] = float(user_data['balance'])
-                self.cache.set(cache_key, user_data, ttl=USER_CACHE_TTL)
+                await self.cache.set(cache_key, user_data, ttl=USER_CACHE_TTL)
                 return user_data
             else:
                 return None
@@ -84,7 +85,7 @@ class UserService:
                     username, user_id
                 )
                 user['username'] = username
-                self.cache.delete(f"user:{user_id}")
+                await self.cache.delete(f"user:{user_id}")
             return user
         else:
             logger.info(f"User {user_id} not found, attempting to create.")
@@ -153,7 +154,7 @@ class UserService:
 
             user['balance'] = new_balance
             cache_key = f"user:{user_id}"
-            self.cache.set(cache_key, user, ttl=USER_CACHE_TTL)
+            await self.cache.set(cache_key, user, ttl=USER_CACHE_TTL)
 
             return user
 
@@ -4,7 +4,7 @@
 
 import discord
 import logging
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, Tuple
 from datetime import datetime, timedelta, timezone
 import asyncio
 from discord import VoiceChannel
@@ -12,9 +12,11 @@ from discord import VoiceChannel
 try:
     from ..data.cache_manager import CacheManager
     from ..utils.errors import VoiceError, ServiceError
+    from ..utils.channel_rename_scheduler import ChannelRenameScheduler
 except ImportError:
     from data.cache_manager import CacheManager
     from utils.errors import VoiceError, ServiceError
+    from utils.channel_rename_scheduler import ChannelRenameScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,8 @@ class VoiceService:
         self.cache = CacheManager()
         self.running = False
         self._update_task: Optional[asyncio.Task] = None
+        # Renames go through the scheduler, which skips unchanged names and paces edits per channel
+        self.renamer = ChannelRenameScheduler(self._update_channel_name)
 
     async def start(self) -> None:
         """Start the voice service background tasks."""
@@ -58,6 +62,7 @@ class VoiceService:
             except Exception as e:
                 logger.error(f"Error awaiting voice service task cancellation: {e}")
 
+        await self.renamer.close()
         logger.info("Voice service stopped successfully")
 
     async def _update_unit_channels_loop(self):
@@ -78,20 +83,12 @@ class VoiceService:
                     continue
 
                 logger.debug(f"Found {len(guilds_to_update)} guilds with voice channels configured")
-                for guild in guilds_to_update:
-                    logger.debug(f"Guild {guild['guild_id']} settings: active={guild['is_active']}, paid={guild['is_paid']}, "
-                               f"monthly_ch={guild['voice_channel_id']}, yearly_ch={guild['yearly_channel_id']}")
-
-                update_tasks = [self._update_guild_unit_channels(guild_info) for guild_info in guilds_to_update]
-
-                results = await asyncio.gather(*update_tasks, return_exceptions=True)
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        guild_id = guilds_to_update[i].get('guild_id', 'N/A')
-                        logger.error(
-                            f"Error updating unit channels for guild {guild_id}: {result}",
-                            exc_info=isinstance(result, Exception)
-                        )
+                totals = await self._get_unit_totals()
+                if totals is None:
+                    await asyncio.sleep(300)
+                    continue
+                for guild_info in guilds_to_update:
+                    self._schedule_guild_unit_channels(guild_info, totals.get(int(guild_info['guild_id']), (0.0, 0.0)))
 
                 await asyncio.sleep(300)
 
@@ -102,30 +99,16 @@ class VoiceService:
                 logger.exception(f"Error in unit channel update loop: {e}")
                 await asyncio.sleep(300)
 
-    async def _update_guild_unit_channels(self, guild_info: Dict):
-        """Update the unit channels for a single specified guild."""
-        guild_id = guild_info['guild_id']
+    def _schedule_guild_unit_channels(self, guild_info: Dict, totals: Tuple[float, float]):
+        """Request the unit channel names for one guild; unchanged names are not renamed."""
+        monthly_total, yearly_total = totals
         monthly_ch_id = guild_info.get('voice_channel_id')
         yearly_ch_id = guild_info.get('yearly_channel_id')
-
-        try:
-            logger.debug(f"Updating channels for guild {guild_id}")
-            monthly_total = await self._get_monthly_total_units(guild_id)
-            yearly_total = await self._get_yearly_total_units(guild_id)
-            logger.debug(f"Guild {guild_id} totals - Monthly: {monthly_total}, Yearly: {yearly_total}")
-
-            update_tasks = []
-            if monthly_ch_id:
-                update_tasks.append(self._update_channel_name(monthly_ch_id, f"Monthly Units: {monthly_total:+.2f}"))
-            if yearly_ch_id:
-                update_tasks.append(self._update_channel_name(yearly_ch_id, f"Yearly Units: {yearly_total:+.2f}"))
-
-            if update_tasks:
-                await asyncio.gather(*update_tasks, return_exceptions=True)
-                logger.debug(f"Channel updates completed for guild {guild_id}")
-
-        except Exception as e:
-            logger.error(f"Failed to fetch unit totals for guild {guild_id} during channel update: {e}")
+        logger.debug(f"Guild {guild_info['guild_id']} totals - Monthly: {monthly_total}, Yearly: {yearly_total}")
+        if monthly_ch_id:
+            self.renamer.request(int(monthly_ch_id), f"Monthly Units: {monthly_total:+.2f}")
+        if yearly_ch_id:
+            self.renamer.request(int(yearly_ch_id), f"Yearly Units: {yearly_total:+.2f}")
 
     async def update_on_bet_resolve(self, guild_id: int):
         """Force update unit channels for a guild immediately after a bet resolves."""
@@ -138,7 +121,9 @@ class VoiceService:
             """, guild_id)
 
             if guild_settings and guild_settings.get('is_paid'):
-                await self._update_guild_unit_channels(guild_settings)
+                totals = await self._get_unit_totals([guild_id])
+                if totals is not None:
+                    self._schedule_guild_unit_channels(guild_settings, totals.get(int(guild_id), (0.0, 0.0)))
             else:
                 logger.debug(
                     f"Skipping immediate update for guild {guild_id}: "
@@ -148,48 +133,42 @@ class VoiceService:
         except Exception as e:
             logger.exception(f"Error updating voice channels on bet resolve for guild {guild_id}: {e}")
 
-    async def _get_monthly_total_units(self, guild_id: int) -> float:
-        """Get the total net units for the current month using shared db_manager."""
+    async def _get_unit_totals(self, guild_ids: Optional[List[int]] = None) -> Optional[Dict[int, Tuple[float, float]]]:
+        """
+        (monthly, yearly) net units of the current UTC month and year per guild,
+        for every guild (or just `guild_ids`) in one grouped query. None on error.
+        """
         try:
             now = datetime.now(timezone.utc)
-            logger.debug(f"Fetching monthly total for guild {guild_id} - Year: {now.year}, Month: {now.month}")
-            result = await self.db.fetchval("""
-                SELECT COALESCE(SUM(monthly_result_value), 0.0)
+            query = """
+                SELECT guild_id,
+                       COALESCE(SUM(CASE WHEN month = %s THEN monthly_result_value ELSE 0 END), 0.0) AS monthly_total,
+                       COALESCE(SUM(monthly_result_value), 0.0) AS yearly_total
                 FROM unit_records
-                WHERE guild_id = %s AND year = %s AND month = %s
-                """,
-                guild_id, now.year, now.month
-            )
-            total = float(result) if result is not None else 0.0
-            logger.debug(f"Monthly total for guild {guild_id}: {total}")
-            return total
+                WHERE year = %s
+            """
+            params: List[Any] = [now.month, now.year]
+            if guild_ids:
+                query += f" AND guild_id IN ({', '.join(['%s'] * len(guild_ids))})"
+                params.extend(guild_ids)
+            query += " GROUP BY guild_id"
+            rows = await self.db.fetch_all(query, *params)
+            return {
+                int(row['guild_id']): (float(row['monthly_total'] or 0.0), float(row['yearly_total'] or 0.0))
+                for row in rows or []
+            }
         except Exception as e:
-            logger.exception(f"Error getting monthly total units for guild {guild_id}: {e}")
-            return 0.0
-
-    async def _get_yearly_total_units(self, guild_id: int) -> float:
-        """Get the total net units for the current year using shared db_manager."""
-        try:
-            now = datetime.now(timezone.utc)
-            logger.debug(f"Fetching yearly total for guild {guild_id} - Year: {now.year}")
-            result = await self.db.fetchval("""
-                SELECT COALESCE(SUM(total_result_value), 0.0)
-                FROM unit_records
-                WHERE guild_id = %s AND year = %s
-                """,
-                guild_id, now.year
-            )
-            total = float(result) if result is not None else 0.0
-            logger.debug(f"Yearly total for guild {guild_id}: {total}")
-            return total
-        except Exception as e:
-            logger.exception(f"Error getting yearly total units for guild {guild_id}: {e}")
-            return 0.0
-
-    async def _update_channel_name(self, channel_id: Optional[int], new_name: str):
-        """Safely update a voice channel's name, handling rate limits and errors."""
+            logger.exception(f"Error getting unit totals for {'all guilds' if not guild_ids else guild_ids}: {e}")
+            return None
+
+    async def _update_channel_name(self, channel_id: Optional[int], new_name: str) -> Optional[bool]:
+        """
+        Safely update a voice channel's name, handling errors. Returns True if an
+        edit was sent to Discord, False if the channel already had the name and
+        None if it could not be renamed. Rate limits are re-raised for the rename scheduler.
+        """
         if not channel_id:
-            return
+            return None
 
         try:
             channel = self.bot.get_channel(channel_id)
@@ -199,30 +178,32 @@ class VoiceService:
                     channel = await self.bot.fetch_channel(channel_id)
                 except discord.NotFound:
                     logger.warning(f"Channel ID {channel_id} not found via fetch. Cannot update name.")
-                    return
+                    return None
                 except discord.Forbidden:
                     logger.error(f"Permission error fetching channel {channel_id}. Bot needs 'View Channel'.")
-                    return
+                    return None
                 except Exception as fetch_err:
                     logger.error(f"Error fetching channel {channel_id}: {fetch_err}")
-                    return
+                    return None
 
             if isinstance(channel, discord.VoiceChannel):
                 trimmed_name = new_name[:100]
                 if channel.name != trimmed_name:
                     await channel.edit(name=trimmed_name, reason="Updating unit stats")
                     logger.info(f"Updated channel {channel_id} name to '{trimmed_name}'")
-                else:
-                    logger.debug(f"Channel {channel_id} name already up-to-date ('{channel.name}'). Skipping edit.")
+                    return True
+                logger.debug(f"Channel {channel_id} name already up-to-date ('{channel.name}'). Skipping edit.")
+                return False
             elif channel:
                 logger.warning(f"Channel ID {channel_id} is not a voice channel (type: {channel.type}). Cannot update name.")
 
         except discord.RateLimited as rl:
-            retry_after = getattr(rl, 'retry_after', 5.0)
-            logger.warning(f"Rate limited updating channel {channel_id}. Discord asks to retry after {retry_after:.2f}s")
+            logger.warning(f"Rate limited updating channel {channel_id}. Discord asks to retry after {rl.retry_after:.2f}s")
+            raise
         except discord.errors.NotFound:
             logger.warning(f"Channel {channel_id} not found during edit attempt (possibly deleted just now).")
         except discord.errors.Forbidden:
             logger.error(f"Permission error updating channel {channel_id} name. Bot needs 'Manage Channels' permission.")
         except Exception as e:
             logger.exception(f"Unexpected error updating channel name for {channel_id}: {e}")
+        return None
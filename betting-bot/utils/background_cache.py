@@ -0,0 +1,140 @@
+# betting-bot/utils/background_cache.py
+
+"""Cache of guild bet slip backgrounds, prepared once per size."""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from PIL import Image
+
+from config.settings import SLIP_BACKGROUND_CACHE_SIZE, SLIP_BACKGROUND_HEIGHT_BUCKET, SLIP_GUILD_STATE_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Returned by lookup_path() when a guild's background path has not been resolved yet
+UNKNOWN_PATH = object()
+
+# (guild_id, absolute path, width, bucketed height, source mtime_ns)
+BackgroundKey = Tuple[Any, str, int, int, int]
+
+
+class BackgroundCache:
+    """
+    LRU of guild backgrounds that are already faded to 50% alpha and
+    cover-fit (LANCZOS resize + centre crop) to the slip size.
+
+    Entries are keyed by (guild_id, path, width, height, mtime), so a
+    re-uploaded background is rebuilt on its next use. Heights are rounded up
+    to `height_bucket` before preparing, and the exact slip height is cropped
+    from the centre of the bucketed image, which keeps parlays of any leg
+    count down to a handful of variants per guild.
+
+    It also remembers each guild's resolved background path so renders skip
+    the guild_settings query. That map is an LRU of at most `max_guilds`
+    guilds, so idle guilds are evicted and simply looked up again on their
+    next slip; call invalidate() whenever guild_background changes. Returned
+    images are shared and must be treated as read-only.
+    """
+
+    def __init__(
+        self, max_entries: int = SLIP_BACKGROUND_CACHE_SIZE, height_bucket: int = SLIP_BACKGROUND_HEIGHT_BUCKET,
+        max_guilds: int = SLIP_GUILD_STATE_CACHE_SIZE
+    ):
+        self.max_entries = max(1, max_entries)
+        self.height_bucket = max(1, height_bucket)
+        self.max_guilds = max(1, max_guilds)
+        self._images: "OrderedDict[BackgroundKey, Image.Image]" = OrderedDict()
+        self._paths: "OrderedDict[Any, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bucket_height(self, height: int) -> int:
+        return -(-height // self.height_bucket) * self.height_bucket
+
+    def lookup_path(self, guild_id: Any):
+        """The remembered background path for a guild (None = no background), or UNKNOWN_PATH."""
+        with self._lock:
+            if guild_id not in self._paths:
+                return UNKNOWN_PATH
+            self._paths.move_to_end(guild_id)
+            return self._paths[guild_id]
+
+    def remember_path(self, guild_id: Any, path: Optional[str]):
+        with self._lock:
+            self._paths[guild_id] = path
+            self._paths.move_to_end(guild_id)
+            while len(self._paths) > self.max_guilds:
+                self._paths.popitem(last=False)
+
+    def invalidate(self, guild_id: Any):
+        """Forget a guild's background path and every prepared variant of it."""
+        with self._lock:
+            self._paths.pop(guild_id, None)
+            for key in [key for key in self._images if key[0] == guild_id]:
+                del self._images[key]
+        logger.debug(f"Invalidated cached slip backgrounds for guild {guild_id}.")
+
+    def get(self, guild_id: Any, path: Optional[str], width: int, height: int) -> Optional[Image.Image]:
+        """Prepared background of exactly (width, height), or None if there is none / it is unreadable."""
+        if not path:
+            return None
+        abs_path = os.path.abspath(path)
+        try:
+            mtime_ns = os.stat(abs_path).st_mtime_ns
+        except OSError:
+            return None
+        bucket_h = self.bucket_height(height)
+        key = (guild_id, abs_path, width, bucket_h, mtime_ns)
+
+        with self._lock:
+            prepared = self._images.get(key)
+            if prepared is not None:
+                self._images.move_to_end(key)
+
+        if prepared is None:
+            prepared = self._prepare(abs_path, width, bucket_h)
+            if prepared is None:
+                return None
+            with self._lock:
+                self._images[key] = prepared
+                self._images.move_to_end(key)
+                while len(self._images) > self.max_entries:
+                    self._images.popitem(last=False)
+
+        if bucket_h == height:
+            return prepared
+        top = (bucket_h - height) // 2
+        return prepared.crop((0, top, width, top + height))
+
+    def _prepare(self, path: str, width: int, height: int) -> Optional[Image.Image]:
+        """Decode, fade to 50% alpha and cover-fit a background to (width, height)."""
+        try:
+            logger.info(f"Preparing guild background {path} at {width}x{height}")
+            with Image.open(path) as source:
+                background = source.convert("RGBA")
+            alpha_channel = background.getchannel('A')
+            background.putalpha(alpha_channel.point(lambda p: int(p * 0.5)))
+
+            bg_w, bg_h = background.size
+            ratio_w = width / bg_w
+            ratio_h = height / bg_h
+            if ratio_w > ratio_h:
+                new_w = width
+                new_h = int(bg_h * ratio_w)
+                resized_bg = background.resize((new_w, new_h), Image.Resampling.LANCZOS)
+                crop_y = (new_h - height) // 2
+                return resized_bg.crop((0, crop_y, width, crop_y + height))
+            new_h = height
+            new_w = int(bg_w * ratio_h)
+            resized_bg = background.resize((new_w, new_h), Image.Resampling.LANCZOS)
+            crop_x = (new_w - width) // 2
+            return resized_bg.crop((crop_x, 0, crop_x + width, height))
+        except Exception as e:
+            logger.error(f"Error preparing guild background {path}: {e}", exc_info=True)
+            return None
+
+
+# Shared by every BetSlipGenerator in this process
+BACKGROUND_CACHE = BackgroundCache()
@@ -0,0 +1,120 @@
+# betting-bot/utils/channel_rename_scheduler.py
+
+"""Per-channel rename scheduling within Discord's channel rename rate limit."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional
+
+try:
+    from ..config.settings import VOICE_RENAME_LIMIT, VOICE_RENAME_WINDOW
+except ImportError:
+    from config.settings import VOICE_RENAME_LIMIT, VOICE_RENAME_WINDOW
+
+logger = logging.getLogger(__name__)
+
+# rename(channel_id, name) -> True if an edit was sent to Discord, False if the channel already
+# had the name, None if the rename failed (the name is not recorded, so a later request retries it).
+# A rate-limit error should carry the delay in a `retry_after` attribute (as discord.RateLimited does).
+Rename = Callable[[int, str], Awaitable[Optional[bool]]]
+
+
+class ChannelRenameScheduler:
+    """
+    Applies channel renames without exceeding `limit` edits per `window` seconds per channel.
+
+    Only the latest requested name per channel is kept: a request made while
+    the channel is waiting for its budget replaces the pending name instead of
+    queueing another edit, and a request for the name last applied is dropped.
+    Each channel has at most one worker task, which sleeps until the oldest
+    edit leaves the window (or for the `retry_after` of a rate-limit error)
+    before sending the newest pending name.
+    """
+
+    def __init__(self, rename: Rename, limit: int = VOICE_RENAME_LIMIT, window: float = VOICE_RENAME_WINDOW):
+        self._rename = rename
+        self.limit = max(1, limit)
+        self.window = window
+        self._pending: Dict[int, str] = {}
+        self._applied: Dict[int, str] = {}
+        self._history: Dict[int, Deque[float]] = {}
+        self._blocked_until: Dict[int, float] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+
+    def request(self, channel_id: int, name: str):
+        """Ask for `channel_id` to be named `name`; returns immediately."""
+        if self._applied.get(channel_id) == name:
+            # Back to the current name: any older pending rename is obsolete
+            self._pending.pop(channel_id, None)
+            return
+        self._pending[channel_id] = name
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = asyncio.create_task(self._run(channel_id))
+
+    def forget(self, channel_id: int):
+        """Drop what is known about a channel (e.g. it was deleted or unconfigured)."""
+        self._pending.pop(channel_id, None)
+        self._applied.pop(channel_id, None)
+        worker = self._workers.pop(channel_id, None)
+        if worker and not worker.done():
+            worker.cancel()
+
+    async def close(self):
+        """Cancel every waiting rename."""
+        workers = [worker for worker in self._workers.values() if not worker.done()]
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        self._pending.clear()
+
+    def _delay(self, channel_id: int) -> float:
+        """Seconds until the channel may be renamed again."""
+        now = time.monotonic()
+        history = self._history.setdefault(channel_id, deque())
+        while history and now - history[0] >= self.window:
+            history.popleft()
+        delay = max(0.0, self._blocked_until.get(channel_id, 0.0) - now)
+        if len(history) >= self.limit:
+            delay = max(delay, history[0] + self.window - now)
+        return delay
+
+    async def _run(self, channel_id: int):
+        try:
+            while channel_id in self._pending:
+                delay = self._delay(channel_id)
+                if delay > 0:
+                    logger.debug(f"Rename of channel {channel_id} waits {delay:.0f}s for the rate limit.")
+                    await asyncio.sleep(delay)
+                    continue
+
+                name = self._pending.pop(channel_id)
+                if self._applied.get(channel_id) == name:
+                    continue
+                try:
+                    edited = await self._rename(channel_id, name)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    retry_after = getattr(e, 'retry_after', None)
+                    if retry_after is None:
+                        logger.error(f"Renaming channel {channel_id} to '{name}' failed: {e}")
+                        continue
+                    logger.warning(f"Rate limited renaming channel {channel_id}; retrying in {retry_after:.0f}s.")
+                    self._blocked_until[channel_id] = time.monotonic() + float(retry_after)
+                    self._pending.setdefault(channel_id, name)
+                    continue
+
+                if edited is None:
+                    logger.debug(f"Channel {channel_id} was not renamed to '{name}'.")
+                    continue
+                self._applied[channel_id] = name
+                if edited:
+                    self._history.setdefault(channel_id, deque()).append(time.monotonic())
+        finally:
+            if self._workers.get(channel_id) is asyncio.current_task():
+                del self._workers[channel_id]
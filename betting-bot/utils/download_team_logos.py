@@ -119,7 +119,7 @@ def download_and_save_image(league_name: str, team_name: str, logo_url: str):
                 break
         
         sport_folder = get_sport_folder_name(current_league_sport)
-        sanitized_team_name = normalize_team_name(team_name)
+        sanitized_team_name = normalize_team_name(team_name, league_code_for_path)
 
         if not sanitized_team_name:
             message = f"ERROR: Could not generate a valid filename for team '{team_name}'. Skipping."
@@ -0,0 +1,164 @@
+# betting-bot/utils/game_update_bus.py
+
+"""In-process pub/sub for live game updates with debouncing and bounded delivery."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set, FrozenSet
+
+try:
+    from ..config.settings import (
+        GAME_UPDATE_DEBOUNCE, GAME_UPDATE_QUEUE_SIZE,
+        GAME_UPDATE_DELIVERY_WORKERS, GAME_UPDATE_DELIVERY_TIMEOUT
+    )
+except ImportError:
+    from config.settings import (
+        GAME_UPDATE_DEBOUNCE, GAME_UPDATE_QUEUE_SIZE,
+        GAME_UPDATE_DELIVERY_WORKERS, GAME_UPDATE_DELIVERY_TIMEOUT
+    )
+
+logger = logging.getLogger(__name__)
+
+# deliver(channel_id, updates) sends one batch of game updates to a channel
+Deliver = Callable[[int, List[Dict[str, Any]]], Awaitable[None]]
+
+
+class GameUpdateBus:
+    """
+    Fans game updates out to subscribed guild channels.
+
+    `publish()` never blocks: updates are merged per game id and held for a
+    debounce window, so several score changes to one game become a single
+    notification. When the window closes, updates are grouped per subscribed
+    channel and handed to a fixed pool of delivery workers through a bounded
+    queue. Each channel is delivered by at most one worker at a time; updates
+    arriving while it is backlogged are merged into its next batch, and when
+    the queue is full new batches are dropped rather than stalling the poller.
+    """
+
+    def __init__(
+        self,
+        deliver: Deliver,
+        debounce: float = GAME_UPDATE_DEBOUNCE,
+        max_queue: int = GAME_UPDATE_QUEUE_SIZE,
+        workers: int = GAME_UPDATE_DELIVERY_WORKERS,
+        delivery_timeout: float = GAME_UPDATE_DELIVERY_TIMEOUT
+    ):
+        self._deliver = deliver
+        self.debounce = debounce
+        self.max_queue = max(1, max_queue)
+        self.worker_count = max(1, workers)
+        self.delivery_timeout = delivery_timeout
+        # guild_id -> channel_id -> league ids to forward (None = all leagues)
+        self._subscriptions: Dict[int, Dict[int, Optional[FrozenSet[str]]]] = {}
+        # game_id -> merged update awaiting the debounce window
+        self._pending: Dict[Hashable, Dict[str, Any]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # channel_id -> {game_id: update} awaiting a delivery worker
+        self._outbox: Dict[int, Dict[Hashable, Dict[str, Any]]] = {}
+        self._delivering: Set[int] = set()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    def subscribe(self, guild_id: int, channel_id: int, league_ids: Optional[Iterable[Any]] = None) -> None:
+        """Send updates for `league_ids` (or every league) to a guild channel."""
+        leagues = frozenset(str(league_id) for league_id in league_ids) if league_ids else None
+        self._subscriptions.setdefault(guild_id, {})[channel_id] = leagues
+
+    def unsubscribe(self, guild_id: int, channel_id: Optional[int] = None) -> None:
+        """Remove one channel's subscription, or every subscription for the guild."""
+        channels = self._subscriptions.get(guild_id)
+        if channels is None:
+            return
+        if channel_id is None:
+            for cid in channels:
+                self._outbox.pop(cid, None)
+            del self._subscriptions[guild_id]
+            return
+        channels.pop(channel_id, None)
+        self._outbox.pop(channel_id, None)
+        if not channels:
+            del self._subscriptions[guild_id]
+
+    async def start(self) -> None:
+        """Start the delivery workers."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._workers = [asyncio.create_task(self._delivery_worker()) for _ in range(self.worker_count)]
+
+    async def close(self) -> None:
+        """Stop the workers; undelivered updates are discarded."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._pending.clear()
+        self._outbox.clear()
+        self._delivering.clear()
+
+    def publish(self, update: Dict[str, Any]) -> None:
+        """Queue an update (a game row dict with at least 'id') for the next debounced flush."""
+        game_id = update.get('id')
+        if game_id is None or not self._subscriptions:
+            return
+        previous = self._pending.get(game_id)
+        self._pending[game_id] = {**previous, **update} if previous else dict(update)
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.debounce, self._flush)
+
+    def _flush(self) -> None:
+        """Group pending updates per subscribed channel and hand them to the workers."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if self._queue is None:
+            return
+        for update in pending.values():
+            update_guild = update.get('guild_id')
+            league_id = str(update.get('league_id'))
+            for guild_id, channels in self._subscriptions.items():
+                if update_guild is not None and update_guild != guild_id:
+                    continue
+                for channel_id, leagues in channels.items():
+                    if leagues is None or league_id in leagues:
+                        self._outbox.setdefault(channel_id, {})[update['id']] = update
+
+        for channel_id in list(self._outbox):
+            if channel_id in self._delivering:
+                continue  # Picked up by its worker once the current send finishes
+            self._enqueue(channel_id)
+
+    def _enqueue(self, channel_id: int) -> None:
+        self._delivering.add(channel_id)
+        try:
+            self._queue.put_nowait(channel_id)
+        except asyncio.QueueFull:
+            dropped = self._outbox.pop(channel_id, {})
+            self._delivering.discard(channel_id)
+            logger.warning(f"Game update queue full; dropped {len(dropped)} updates for channel {channel_id}.")
+
+    async def _delivery_worker(self) -> None:
+        """Send each queued channel's batch, re-queueing it if more updates arrived meanwhile."""
+        while True:
+            channel_id = await self._queue.get()
+            try:
+                updates = self._outbox.pop(channel_id, None)
+                if updates:
+                    await asyncio.wait_for(self._deliver(channel_id, list(updates.values())), self.delivery_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Delivering game updates to channel {channel_id} timed out.")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error delivering game updates to channel {channel_id}: {e}")
+            finally:
+                self._queue.task_done()
+                self._delivering.discard(channel_id)
+                if channel_id in self._outbox and self._queue is not None:
+                    self._enqueue(channel_id)
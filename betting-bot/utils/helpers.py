@@ -6,6 +6,7 @@ from PIL import Image
 import io
 import requests
 import thesportsdb
+from api.thesportsdb_client import TheSportsDBClient
 from config.leagues import LEAGUE_IDS, CFL_TEAMS, AFL_TEAMS
 
 
@@ -165,18 +166,23 @@ def is_valid_darts_player(player_name: str) -> bool:
     return player_name in DARTS_PLAYERS
 
 
-def get_league_teams(league_key: str) -> List[str]:
+async def get_league_teams(league_key: str, client: Optional[TheSportsDBClient] = None) -> List[str]:
     """Get list of teams for a given league."""
     league = LEAGUE_IDS.get(league_key, {})
     league_id = league.get("id")
 
     if league_id:
+        owns_client = client is None
+        client = client or TheSportsDBClient()
         try:
-            teams_data = thesportsdb.teams.leagueTeams(league_id)
-            if teams_data and "teams" in teams_data:
+            teams_data = await client.league_teams(league_id)
+            if teams_data and teams_data.get("teams"):
                 return [team["strTeam"] for team in teams_data["teams"]]
         except Exception:
             pass
+        finally:
+            if owns_client:
+                await client.close()
     elif league_key == "CFL":
         return CFL_TEAMS
     elif league_key == "AFL":
@@ -4,6 +4,9 @@ import logging
 import os
 import time
 import io
+import asyncio
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 import traceback
@@ -14,7 +17,11 @@ from config.asset_paths import (
     BASE_DIR
 )
 from config.team_mappings import normalize_team_name
-from data.db_manager import DatabaseManager
+from config.settings import (
+    SLIP_STATIC_LAYER_CACHE_SIZE, SLIP_IMAGE_FORMAT, SLIP_PNG_COMPRESS_LEVEL, SLIP_IMAGE_QUALITY
+)
+from utils.logo_cache import LOGO_CACHE
+from utils.background_cache import BACKGROUND_CACHE, UNKNOWN_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -80,22 +87,85 @@ def load_fonts():
 
 FONTS = load_fonts()
 
+
+class SlipLayerCache:
+    """
+    Thread-safe LRU of rendered static slip layers.
+    Each entry also holds references to the logo images it was drawn from, so
+    their ids (part of the key) cannot be reused while the entry is alive.
+    """
+
+    def __init__(self, max_entries: int = SLIP_STATIC_LAYER_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._layers: "OrderedDict[tuple, tuple[Image.Image, tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Image.Image]:
+        with self._lock:
+            entry = self._layers.get(key)
+            if entry is None:
+                return None
+            self._layers.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: tuple, layer: Image.Image, refs: tuple = ()):
+        with self._lock:
+            self._layers[key] = (layer, refs)
+            self._layers.move_to_end(key)
+            while len(self._layers) > self.max_entries:
+                self._layers.popitem(last=False)
+
+
+STATIC_LAYER_CACHE = SlipLayerCache()
+
+SLIP_FILE_EXTENSIONS = {'PNG': 'png', 'WEBP': 'webp', 'JPEG': 'jpg'}
+
+
+def slip_filename(prefix: str, image_format: str = SLIP_IMAGE_FORMAT) -> str:
+    """Upload filename for an encoded slip, e.g. slip_filename('bet_slip_42') -> 'bet_slip_42.png'."""
+    return f"{prefix}.{SLIP_FILE_EXTENSIONS.get(image_format.upper(), 'png')}"
+
+
+def encode_slip_image(
+    img: Image.Image, image_format: str = SLIP_IMAGE_FORMAT,
+    compress_level: int = SLIP_PNG_COMPRESS_LEVEL, quality: int = SLIP_IMAGE_QUALITY
+) -> tuple[bytes, float]:
+    """Encode a rendered slip; returns (payload, seconds spent encoding)."""
+    image_format = image_format.upper()
+    started = time.perf_counter()
+    buffer = io.BytesIO()
+    if image_format == 'WEBP':
+        img.save(buffer, format='WEBP', quality=quality, method=4)
+    elif image_format == 'JPEG':
+        img.convert("RGB").save(buffer, format='JPEG', quality=quality, optimize=True)
+    else:
+        if image_format != 'PNG':
+            logger.warning(f"Unknown slip image format '{image_format}'; encoding as PNG.")
+        img.save(buffer, format='PNG', compress_level=compress_level)
+    return buffer.getvalue(), time.perf_counter() - started
+
 class BetSlipGenerator:
-    def __init__(self, guild_id: Optional[int] = None):
-        self.guild_id = guild_id
-        self.db_manager = DatabaseManager()
+    # Sizes logos are drawn at; the shared LOGO_CACHE stores them pre-resized
+    LEAGUE_LOGO_SIZE = (45, 45)
+    TEAM_LOGO_SIZE = (120, 120)
+    PARLAY_LOGO_SIZE = (50, 50)
+
+    def __init__(self, db_manager=None, renderer=None, guild_settings=None):
+        # One generator serves every guild: guild backgrounds are looked up through the
+        # bot's shared db_manager and remembered in the bounded BACKGROUND_CACHE.
+        self.db_manager = db_manager  # None: no guild backgrounds (e.g. inside render workers)
+        self.renderer = renderer  # Optional SlipRenderService used by generate_bet_slip_bytes()
+        self.guild_settings = guild_settings  # Optional async guild_id -> settings lookup (AdminService cache)
         self.padding = 20
         self.LEAGUE_TEAM_BASE_DIR = os.path.join(BASE_DIR, "static", "logos", "teams")
         self.LEAGUE_LOGO_BASE_DIR = os.path.join(BASE_DIR, "static", "logos", "leagues")
         self.DEFAULT_LOGO_PATH = os.path.join(BASE_DIR, "static", "logos", "default_logo.png")
         self.LOCK_ICON_PATH = "/home/container/betting-bot/static/lock_icon.png"
-        
-        self._logo_cache: Dict[str, tuple[Image.Image, float]] = {}
-        self._lock_icon_cache: Optional[Image.Image] = None
-        self._last_cache_cleanup = time.time()
-        self._cache_expiry = 300
-        self._max_cache_size = 100
-        
+        self.logo_cache = LOGO_CACHE
+        self.background_cache = BACKGROUND_CACHE
+        self.static_layers = STATIC_LAYER_CACHE
+        self._has_lock_icon = False
+
         logger.info("Initializing BetSlipGenerator instance...")
         self.fonts = FONTS
         if any(font == ImageFont.load_default() for key, font in self.fonts.items() if key != 'emoji_font_24'):
@@ -108,15 +178,11 @@ class BetSlipGenerator:
         else:
             logger.info("BetSlipGenerator: NotoColorEmoji font loaded successfully.")
 
-        try:
-            if os.path.exists(self.LOCK_ICON_PATH):
-                self._lock_icon_cache = Image.open(self.LOCK_ICON_PATH).convert("RGBA")
-                logger.info(f"Successfully loaded lock icon from {self.LOCK_ICON_PATH}")
-            else:
-                logger.warning(f"Lock icon image not found at {self.LOCK_ICON_PATH}. Will fallback to emoji.")
-        except Exception as e:
-            logger.error(f"Error loading lock icon from {self.LOCK_ICON_PATH}: {e}. Will fallback to emoji.")
-            self._lock_icon_cache = None
+        if self.logo_cache.get(self.LOCK_ICON_PATH) is not None:
+            self._has_lock_icon = True
+            logger.info(f"Successfully loaded lock icon from {self.LOCK_ICON_PATH}")
+        else:
+            logger.warning(f"Lock icon image not found or unreadable at {self.LOCK_ICON_PATH}. Will fallback to emoji.")
 
     def _get_text_dimensions(self, text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int]:
         bbox = font.getbbox(text)
@@ -127,7 +193,7 @@ class BetSlipGenerator:
     def _draw_header(self, img: Image.Image, draw: ImageDraw.Draw, image_width: int, league_logo: Optional[Image.Image], league: str, bet_type_str: str):
         y_offset = 25
         title_font = self.fonts['font_b_36']
-        logo_display_size = (45, 45)
+        logo_display_size = self.LEAGUE_LOGO_SIZE
         text_color = 'white'
 
         bet_type_display = bet_type_str.replace('_', ' ').title()
@@ -142,7 +208,7 @@ class BetSlipGenerator:
 
         if league_logo:
             try:
-                league_logo_resized = league_logo.resize(logo_display_size, Image.Resampling.LANCZOS)
+                league_logo_resized = league_logo if league_logo.size == logo_display_size else league_logo.resize(logo_display_size, Image.Resampling.LANCZOS)
                 logo_y = y_offset + (title_h - logo_display_size[1]) // 2
                 title_x_with_logo = logo_x + logo_display_size[0] + 15
                 total_width_with_logo = logo_display_size[0] + 15 + title_w
@@ -162,7 +228,7 @@ class BetSlipGenerator:
 
     def _draw_teams_section(self, img: Image.Image, draw: ImageDraw.Draw, image_width: int, home_team: str, away_team: str, home_logo: Optional[Image.Image], away_logo: Optional[Image.Image]):
         y_base = 85
-        logo_size = (120, 120)
+        logo_size = self.TEAM_LOGO_SIZE
         text_y_offset = logo_size[1] + 8
         team_name_font = self.fonts['font_b_24']
         text_color = 'white'
@@ -173,7 +239,7 @@ class BetSlipGenerator:
 
         if home_logo:
             try:
-                home_logo_resized = home_logo.resize(logo_size, Image.Resampling.LANCZOS)
+                home_logo_resized = home_logo if home_logo.size == logo_size else home_logo.resize(logo_size, Image.Resampling.LANCZOS)
                 home_logo_x = home_section_center_x - logo_size[0] // 2
                 if home_logo_resized.mode == 'RGBA':
                     img.paste(home_logo_resized, (int(home_logo_x), int(y_base)), home_logo_resized)
@@ -188,7 +254,7 @@ class BetSlipGenerator:
 
         if away_logo:
             try:
-                away_logo_resized = away_logo.resize(logo_size, Image.Resampling.LANCZOS)
+                away_logo_resized = away_logo if away_logo.size == logo_size else away_logo.resize(logo_size, Image.Resampling.LANCZOS)
                 away_logo_x = away_section_center_x - logo_size[0] // 2
                 if away_logo_resized.mode == 'RGBA':
                     img.paste(away_logo_resized, (int(away_logo_x), int(y_base)), away_logo_resized)
@@ -203,10 +269,10 @@ class BetSlipGenerator:
 
     def _draw_lock_element(self, img: Image.Image, draw: ImageDraw.Draw, x: int, y: int, size: tuple[int, int], emoji_font: ImageFont.FreeTypeFont, color: str, draw_it: bool = True) -> tuple[int, int, bool]:
         lock_icon_size_for_draw = size
-        if self._lock_icon_cache:
+        if self._has_lock_icon:
             if draw_it:
                 try:
-                    lock_img_resized = self._lock_icon_cache.resize(lock_icon_size_for_draw, Image.Resampling.LANCZOS)
+                    lock_img_resized = self.logo_cache.get(self.LOCK_ICON_PATH, lock_icon_size_for_draw)
                     img.paste(lock_img_resized, (int(x), int(y)), lock_img_resized)
                     return lock_icon_size_for_draw[0], lock_icon_size_for_draw[1], True
                 except Exception as e:
@@ -283,7 +349,7 @@ class BetSlipGenerator:
         leg_font = self.fonts['font_m_24']; odds_font = self.fonts['font_b_28']
         units_font = self.fonts['font_b_24']; emoji_font = self.fonts['emoji_font_24']
         team_name_font = self.fonts['font_b_24']
-        logo_size = (50, 50)
+        logo_size = self.PARLAY_LOGO_SIZE
         logo_spacing = 10
 
         for i, (leg_data, logo) in enumerate(zip(legs, team_logos)):
@@ -293,7 +359,7 @@ class BetSlipGenerator:
             # Draw team logo
             if logo:
                 try:
-                    logo_resized = logo.resize(logo_size, Image.Resampling.LANCZOS)
+                    logo_resized = logo if logo.size == logo_size else logo.resize(logo_size, Image.Resampling.LANCZOS)
                     logo_x = self.padding
                     logo_y = y + (leg_h - logo_size[1]) // 2
                     if logo_resized.mode == 'RGBA':
@@ -358,11 +424,18 @@ class BetSlipGenerator:
         ts_w, _ = self._get_text_dimensions(timestamp_text, footer_font)
         draw.text((image_width - self.padding, footer_y), timestamp_text, font=footer_font, fill=footer_color, anchor="rs")
 
-    async def get_guild_background(self) -> Optional[Image.Image]:
-        if not self.guild_id: return None
-        background_image = None; guild_bg_path_from_db = None; effective_path = None
+    async def _get_guild_background_path(self, guild_id: Optional[int]) -> Optional[str]:
+        """Resolve the guild's configured background to a local file path, or None."""
+        if not guild_id or (self.db_manager is None and self.guild_settings is None): return None
+        cached_path = self.background_cache.lookup_path(guild_id)
+        if cached_path is not UNKNOWN_PATH:
+            return cached_path
+        guild_bg_path_from_db = None; effective_path = None
         try:
-            settings = await self.db_manager.fetch_one("SELECT guild_background FROM guild_settings WHERE guild_id = %s",(self.guild_id,))
+            if self.guild_settings is not None:
+                settings = await self.guild_settings(guild_id)
+            else:
+                settings = await self.db_manager.fetch_one("SELECT guild_background FROM guild_settings WHERE guild_id = %s",(guild_id,))
             guild_bg_path_from_db = settings.get("guild_background") if settings else None
             if guild_bg_path_from_db:
                 normalized_db_path = guild_bg_path_from_db.replace('\\', '/')
@@ -372,22 +445,110 @@ class BetSlipGenerator:
                         effective_path = os.path.join(BASE_DIR, normalized_db_path)
                     else:
                         effective_path = os.path.join(BASE_DIR, "static", normalized_db_path)
-                
+
                 if os.path.exists(effective_path):
-                    logger.info(f"Loading guild background from local path: {effective_path}")
-                    background_image = Image.open(effective_path).convert("RGBA")
-                    logger.info(f"Successfully loaded guild background from local path.")
-                else: logger.warning(f"Guild background file NOT FOUND. DB path:'{guild_bg_path_from_db}', Resolved to:'{effective_path}'.")
-            else: logger.debug(f"No guild background path for guild {self.guild_id}.")
-        except Exception as e: logger.error(f"Error loading guild background (path:{guild_bg_path_from_db or 'N/A'}): {e}", exc_info=True)
-        return background_image
+                    self.background_cache.remember_path(guild_id, effective_path)
+                    return effective_path
+                logger.warning(f"Guild background file NOT FOUND. DB path:'{guild_bg_path_from_db}', Resolved to:'{effective_path}'.")
+            else: logger.debug(f"No guild background path for guild {guild_id}.")
+            self.background_cache.remember_path(guild_id, None)
+        except Exception as e: logger.error(f"Error resolving guild background (path:{guild_bg_path_from_db or 'N/A'}): {e}", exc_info=True)
+        return None
+
+    def _open_background(self, path: Optional[str]) -> Optional[Image.Image]:
+        if not path: return None
+        try:
+            logger.info(f"Loading guild background from local path: {path}")
+            return Image.open(path).convert("RGBA")
+        except Exception as e:
+            logger.error(f"Error loading guild background (path:{path}): {e}", exc_info=True)
+            return None
+
+    async def get_guild_background(self, guild_id: Optional[int]) -> Optional[Image.Image]:
+        path = await self._get_guild_background_path(guild_id)
+        return await asyncio.to_thread(self._open_background, path) if path else None
+
+    async def build_slip_spec(
+        self, home_team: str, away_team: str, league: str, odds: float, units: float,
+        bet_id: str, timestamp: datetime, bet_type: str = "straight", line: Optional[str] = None,
+        parlay_legs: Optional[List[Dict]] = None, is_same_game: bool = False,
+        team_logo_paths: Optional[List[str]] = None, guild_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Collect everything needed to draw a slip into a plain, picklable dict.
+        The guild background is resolved to a file path here so rendering needs no DB access.
+        """
+        return {
+            'home_team': home_team,
+            'away_team': away_team,
+            'league': league,
+            'odds': odds,
+            'units': units,
+            'bet_id': str(bet_id),
+            'timestamp': timestamp.isoformat(),
+            'bet_type': bet_type,
+            'line': line,
+            'parlay_legs': [dict(leg) for leg in parlay_legs] if parlay_legs else None,
+            'is_same_game': is_same_game,
+            'team_logo_paths': list(team_logo_paths) if team_logo_paths else None,
+            'guild_id': guild_id,
+            'guild_background_path': await self._get_guild_background_path(guild_id),
+        }
 
     async def generate_bet_slip(
         self, home_team: str, away_team: str, league: str, odds: float, units: float, 
         bet_id: str, timestamp: datetime, bet_type: str = "straight", line: Optional[str] = None, 
         parlay_legs: Optional[List[Dict]] = None, is_same_game: bool = False,
-        team_logo_paths: Optional[List[str]] = None
+        team_logo_paths: Optional[List[str]] = None, guild_id: Optional[int] = None
     ) -> Optional[Image.Image]:
+        spec = await self.build_slip_spec(
+            home_team, away_team, league, odds, units, bet_id, timestamp, bet_type=bet_type, line=line,
+            parlay_legs=parlay_legs, is_same_game=is_same_game, team_logo_paths=team_logo_paths,
+            guild_id=guild_id
+        )
+        return await asyncio.to_thread(self.render_bet_slip, spec)
+
+    async def generate_bet_slip_bytes(
+        self, home_team: str, away_team: str, league: str, odds: float, units: float,
+        bet_id: str, timestamp: datetime, bet_type: str = "straight", line: Optional[str] = None,
+        parlay_legs: Optional[List[Dict]] = None, is_same_game: bool = False,
+        team_logo_paths: Optional[List[str]] = None, guild_id: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Render a slip off the event loop and return it encoded as SLIP_IMAGE_FORMAT, or None on failure/timeout."""
+        spec = await self.build_slip_spec(
+            home_team, away_team, league, odds, units, bet_id, timestamp, bet_type=bet_type, line=line,
+            parlay_legs=parlay_legs, is_same_game=is_same_game, team_logo_paths=team_logo_paths,
+            guild_id=guild_id
+        )
+        if self.renderer:
+            return await self.renderer.render(spec)
+        return await asyncio.to_thread(self.render_bet_slip_bytes, spec)
+
+    def render_bet_slip_bytes(self, spec: Dict[str, Any]) -> Optional[bytes]:
+        """Synchronous render + encode (SLIP_IMAGE_FORMAT) of a slip spec."""
+        encoded = self.render_bet_slip_encoded(spec)
+        return encoded[0] if encoded else None
+
+    def render_bet_slip_encoded(self, spec: Dict[str, Any]) -> Optional[tuple[bytes, float]]:
+        """Render and encode a slip spec, returning (payload, encode seconds). Runs in a worker thread/process."""
+        img = self.render_bet_slip(spec)
+        if img is None:
+            return None
+        data, encode_seconds = encode_slip_image(img)
+        logger.debug(
+            f"Encoded slip for bet {spec.get('bet_id')} as {SLIP_IMAGE_FORMAT}: "
+            f"{len(data) / 1024:.1f} KB in {encode_seconds * 1000:.1f} ms"
+        )
+        return data, encode_seconds
+
+    def render_bet_slip(self, spec: Dict[str, Any]) -> Optional[Image.Image]:
+        """Draw a slip from a spec built by build_slip_spec(). CPU-bound; keep it off the event loop."""
+        home_team = spec['home_team']; away_team = spec['away_team']; league = spec['league']
+        odds = spec['odds']; units = spec['units']; bet_id = spec['bet_id']
+        timestamp = datetime.fromisoformat(spec['timestamp'])
+        bet_type = spec.get('bet_type') or "straight"; line = spec.get('line')
+        parlay_legs = spec.get('parlay_legs'); is_same_game = spec.get('is_same_game', False)
+        team_logo_paths = spec.get('team_logo_paths')
         try:
             logger.info(f"Generating bet slip - Home:'{home_team}', Away:'{away_team}', League:'{league}', Type:{bet_type}")
             width = 600
@@ -398,78 +559,22 @@ class BetSlipGenerator:
             else:
                 height = 400  # Fixed height for straight bets
             
-            guild_bg_image_pil = await self.get_guild_background()
-            img = Image.new('RGBA', (width, height), "#23232a")
-
-            if guild_bg_image_pil:
-                try:
-                    guild_bg_image_pil = guild_bg_image_pil.convert("RGBA")
-                    alpha_channel = guild_bg_image_pil.getchannel('A')
-                    semi_transparent_alpha = alpha_channel.point(lambda p: int(p * 0.5))
-                    guild_bg_image_pil.putalpha(semi_transparent_alpha)
-                    
-                    bg_w, bg_h = guild_bg_image_pil.size
-                    ratio_w = width / bg_w
-                    ratio_h = height / bg_h
-                    
-                    if ratio_w > ratio_h:
-                        new_w = width
-                        new_h = int(bg_h * ratio_w)
-                        resized_bg = guild_bg_image_pil.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                        crop_y = (new_h - height) // 2
-                        final_bg_to_paste = resized_bg.crop((0, crop_y, width, crop_y + height))
-                    else:
-                        new_h = height
-                        new_w = int(bg_w * ratio_h)
-                        resized_bg = guild_bg_image_pil.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                        crop_x = (new_w - width) // 2
-                        final_bg_to_paste = resized_bg.crop((crop_x, 0, crop_x + width, height))
-
-                    img.paste(final_bg_to_paste, (0,0), final_bg_to_paste)
-                    logger.info("Applied guild background with 50% transparency.")
-                except Exception as bg_err:
-                    logger.error(f"Error processing guild background: {bg_err}", exc_info=True)
-            
+            # Background, header and team section come from the cached static layer
+            img = self._get_static_layer(spec, width, height).copy()
             draw = ImageDraw.Draw(img)
-            
-            league_logo_pil = None if bet_type.lower() == "parlay" else self._load_league_logo(league)
-            home_logo_pil = None
-            away_logo_pil = None
-            team_logos = []
-
-            if bet_type.lower() == "parlay" and parlay_legs and team_logo_paths:
-                for logo_path in team_logo_paths:
-                    try:
-                        logo = Image.open(logo_path).convert("RGBA")
-                        team_logos.append(logo)
-                    except Exception as e:
-                        logger.warning(f"Failed to load team logo at {logo_path}: {e}")
-                        default_logo = Image.open(self.DEFAULT_LOGO_PATH).convert("RGBA") if os.path.exists(self.DEFAULT_LOGO_PATH) else None
-                        team_logos.append(default_logo)
-            else:
-                home_logo_pil = self._load_team_logo(home_team, league)
-                away_logo_pil = self._load_team_logo(away_team, league)
-            
-            default_pil_logo = None
-            if os.path.exists(self.DEFAULT_LOGO_PATH):
-                try: default_pil_logo = Image.open(self.DEFAULT_LOGO_PATH).convert("RGBA")
-                except Exception as e: logger.error(f"Failed to load default logo: {e}")
-            
-            if not league_logo_pil and default_pil_logo and bet_type.lower() != "parlay":
-                league_logo_pil = default_pil_logo.copy()
-            if not home_logo_pil and default_pil_logo:
-                home_logo_pil = default_pil_logo.copy()
-            if not away_logo_pil and default_pil_logo:
-                away_logo_pil = default_pil_logo.copy()
-
-            self._draw_header(img, draw, width, league_logo_pil, league, bet_type)
-            
+
             if bet_type.lower() == "parlay" and parlay_legs:
+                team_logos = []
+                for logo_path in team_logo_paths or []:
+                    logo = self.logo_cache.get(logo_path, self.PARLAY_LOGO_SIZE)
+                    if logo is None:
+                        logger.warning(f"Failed to load team logo at {logo_path}; using default logo.")
+                        logo = self._default_logo(self.PARLAY_LOGO_SIZE)
+                    team_logos.append(logo)
                 y_end = self._draw_parlay_details(draw, width, height, parlay_legs, odds, units, bet_id, timestamp, is_same_game, img, team_logos)
                 # Adjust footer to sit below all content
                 self._draw_footer(draw, width, y_end + self.padding, bet_id, timestamp)
             else:
-                self._draw_teams_section(img, draw, width, home_team, away_team, home_logo_pil, away_logo_pil)
                 y_end = self._draw_straight_details(draw, width, height, line, odds, units, bet_id, timestamp, img)
                 self._draw_footer(draw, width, y_end + self.padding, bet_id, timestamp)
 
@@ -487,85 +592,106 @@ class BetSlipGenerator:
                 logger.error(f"Fallback image failed: {final_err}")
             return None
 
+    def _get_static_layer(self, spec: Dict[str, Any], width: int, height: int) -> Image.Image:
+        """
+        Background, header and (for straight slips) team section for a spec, shared
+        between renders of the same matchup; callers must draw on a copy.
+        """
+        league = spec['league']; bet_type = spec.get('bet_type') or "straight"
+        draws_teams = not (bet_type.lower() == "parlay" and spec.get('parlay_legs'))
+        home_team = spec['home_team'] if draws_teams else None
+        away_team = spec['away_team'] if draws_teams else None
+
+        league_logo_pil = None
+        if bet_type.lower() != "parlay":
+            league_logo_pil = self._load_league_logo(league, self.LEAGUE_LOGO_SIZE) or self._default_logo(self.LEAGUE_LOGO_SIZE)
+        home_logo_pil = away_logo_pil = None
+        if draws_teams:
+            home_logo_pil = self._load_team_logo(home_team, league, self.TEAM_LOGO_SIZE) or self._default_logo(self.TEAM_LOGO_SIZE)
+            away_logo_pil = self._load_team_logo(away_team, league, self.TEAM_LOGO_SIZE) or self._default_logo(self.TEAM_LOGO_SIZE)
+
+        bg_path = spec.get('guild_background_path')
+        try:
+            bg_version = os.stat(bg_path).st_mtime_ns if bg_path else None
+        except OSError:
+            bg_version = None
+        logos = (league_logo_pil, home_logo_pil, away_logo_pil)
+        # Logo identities pick up replaced logo files (LOGO_CACHE reloads them on mtime change)
+        key = (
+            spec.get('guild_id'), bg_path, bg_version, league, home_team, away_team,
+            bet_type.lower(), width, height, tuple(id(logo) for logo in logos)
+        )
+        layer = self.static_layers.get(key)
+        if layer is not None:
+            return layer
+
+        layer = Image.new('RGBA', (width, height), "#23232a")
+        # Faded + cover-fit once per (guild, size, file version); see BackgroundCache
+        final_bg_to_paste = self.background_cache.get(spec.get('guild_id'), bg_path, width, height)
+        if final_bg_to_paste:
+            try:
+                layer.paste(final_bg_to_paste, (0,0), final_bg_to_paste)
+                logger.info("Applied guild background with 50% transparency.")
+            except Exception as bg_err:
+                logger.error(f"Error processing guild background: {bg_err}", exc_info=True)
+
+        draw = ImageDraw.Draw(layer)
+        self._draw_header(layer, draw, width, league_logo_pil, league, bet_type)
+        if draws_teams:
+            self._draw_teams_section(layer, draw, width, home_team, away_team, home_logo_pil, away_logo_pil)
+        self.static_layers.put(key, layer, logos)
+        return layer
+
     def _load_fonts(self): pass
 
-    def _cleanup_cache(self):
-        now = time.time()
-        if now - self._last_cache_cleanup > 300:
-            expired_keys = [k for k, (_, ts) in self._logo_cache.items() if now - ts > self._cache_expiry]
-            for k in expired_keys: self._logo_cache.pop(k, None)
-            self._last_cache_cleanup = now
-            logger.debug(f"Logo cache cleaned. Removed {len(expired_keys)} expired items.")
+    def _default_logo(self, size: Optional[tuple[int, int]] = None) -> Optional[Image.Image]:
+        return self.logo_cache.get(self.DEFAULT_LOGO_PATH, size)
 
-    def _load_league_logo(self, league: str) -> Optional[Image.Image]:
+    def _load_league_logo(self, league: str, size: Optional[tuple[int, int]] = None) -> Optional[Image.Image]:
+        """League logo (shared, read-only) resized to `size`, falling back to the default logo."""
         if not league: return None
         try:
-            cache_key = f"league_{league}"; now = time.time()
-            if cache_key in self._logo_cache:
-                logo, ts = self._logo_cache[cache_key]
-                if now - ts <= self._cache_expiry: return logo.copy()
-                else: del self._logo_cache[cache_key]
-            
             sport = get_sport_category_for_path(league.upper())
             if not sport:
                 logger.warning(f"Sport category not found for league '{league}'. Attempting to use default logo.")
-                return Image.open(self.DEFAULT_LOGO_PATH).convert("RGBA") if os.path.exists(self.DEFAULT_LOGO_PATH) else None
+                return self._default_logo(size)
             
             fname = f"{league.lower().replace(' ', '_')}.png"
             logo_dir = os.path.join(self.LEAGUE_LOGO_BASE_DIR, sport, league.upper())
-            logo_path = os.path.join(logo_dir, fname); absolute_logo_path = os.path.abspath(logo_path)
-            file_exists = os.path.exists(absolute_logo_path)
-            logger.info("Loading league logo - League:'%s', Resolved Sport Category: '%s', Path:'%s', Exists:%s", league, sport, absolute_logo_path, file_exists)
-            
-            logo = None
-            if file_exists:
-                try: logo = Image.open(absolute_logo_path).convert("RGBA")
-                except Exception as e: logger.error(f"Error opening league logo {absolute_logo_path}: {e}")
-            
+            absolute_logo_path = os.path.abspath(os.path.join(logo_dir, fname))
+            logo = self.logo_cache.get(absolute_logo_path, size)
             if logo:
-                self._cleanup_cache()
-                if len(self._logo_cache) >= self._max_cache_size:
-                    oldest_key = min(self._logo_cache, key=lambda k: self._logo_cache[k][1])
-                    del self._logo_cache[oldest_key]
-                self._logo_cache[cache_key] = (logo.copy(), now)
-                return logo.copy()
-                
+                return logo
+
             logger.warning(f"No logo found for league {league} (path: {absolute_logo_path}). Attempting to use default logo.")
-            return Image.open(self.DEFAULT_LOGO_PATH).convert("RGBA") if os.path.exists(self.DEFAULT_LOGO_PATH) else None
+            return self._default_logo(size)
         except Exception as e:
             logger.error(f"Error in _load_league_logo for {league}: {e}", exc_info=True)
-            try: return Image.open(self.DEFAULT_LOGO_PATH).convert("RGBA") if os.path.exists(self.DEFAULT_LOGO_PATH) else None
-            except Exception as def_err: logger.error(f"Error loading default logo during fallback: {def_err}")
+            return self._default_logo(size)
+
+    def _team_logo_path(self, team_name: str, league: str) -> Optional[str]:
+        """Expected on-disk path of a team's logo, or None if the league has no sport category."""
+        team_dir = self._ensure_team_dir_exists(league)
+        if not team_dir:
             return None
+        return os.path.abspath(os.path.join(team_dir, f"{normalize_team_name(team_name, league)}.png"))
 
-    def _load_team_logo(self, team_name: str, league: str) -> Optional[Image.Image]:
+    def _load_team_logo(self, team_name: str, league: str, size: Optional[tuple[int, int]] = None) -> Optional[Image.Image]:
+        """Team logo (shared, read-only) resized to `size`, falling back to the default logo."""
         try:
-            sport = get_sport_category_for_path(league.upper())
-            if not sport:
+            absolute_logo_path = self._team_logo_path(team_name, league)
+            if not absolute_logo_path:
                 logger.error(f"No sport category determined for league: {league} (when loading team: {team_name})")
-                return Image.open(self.DEFAULT_LOGO_PATH).convert("RGBA") if os.path.exists(self.DEFAULT_LOGO_PATH) else None
-            
-            team_dir = self._ensure_team_dir_exists(league)
-            if not team_dir:
-                return Image.open(self.DEFAULT_LOGO_PATH).convert("RGBA") if os.path.exists(self.DEFAULT_LOGO_PATH) else None
-            
-            normalized_team_name = normalize_team_name(team_name)
-            logo_path = os.path.join(team_dir, f"{normalized_team_name}.png")
-            absolute_logo_path = os.path.abspath(logo_path)
-            logger.info(f"Attempting to load team logo: Team='{team_name}', Normalized='{normalized_team_name}', League='{league}', Sport='{sport}', Path='{absolute_logo_path}'")
+                return self._default_logo(size)
 
-            if os.path.exists(absolute_logo_path):
-                return Image.open(absolute_logo_path).convert("RGBA")
-            else:
-                logger.warning(f"Team logo not found: {absolute_logo_path}. Using default logo.")
-                return Image.open(self.DEFAULT_LOGO_PATH).convert("RGBA") if os.path.exists(self.DEFAULT_LOGO_PATH) else None
+            logo = self.logo_cache.get(absolute_logo_path, size)
+            if logo:
+                return logo
+            logger.warning(f"Team logo not found: {absolute_logo_path}. Using default logo.")
+            return self._default_logo(size)
         except Exception as e:
             logger.error(f"Error in _load_team_logo for {team_name} (league {league}): {e}", exc_info=True)
-            try:
-                return Image.open(self.DEFAULT_LOGO_PATH).convert("RGBA") if os.path.exists(self.DEFAULT_LOGO_PATH) else None
-            except Exception as def_err:
-                logger.error(f"Error loading default team logo during fallback: {def_err}")
-            return None
+            return self._default_logo(size)
 
     def _ensure_team_dir_exists(self, league: str) -> Optional[str]:
         try:
@@ -0,0 +1,149 @@
+# betting-bot/utils/leaderboard.py
+
+"""Leaderboard windows summed from per-user daily result buckets, ranked with a heap."""
+
+import heapq
+import logging
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from ..config.settings import LEADERBOARD_CACHE_TTL
+except ImportError:
+    from config.settings import LEADERBOARD_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+TIMEFRAMES = ('daily', 'weekly', 'monthly', 'yearly', 'all_time')
+METRICS = ('net_units', 'roi', 'win_rate', 'wins')
+
+# user_id -> {'wins', 'losses', 'pushes', 'units_risked', 'net_units'}
+WindowTotals = Dict[int, Dict[str, float]]
+
+
+def window_start(timeframe: str, today: Optional[date] = None) -> Optional[date]:
+    """
+    First UTC day (inclusive) of a leaderboard window ending today, or None for all_time.
+    daily is today's bucket, weekly/monthly the last 7/30 days, yearly since 1 January.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    if timeframe == 'daily':
+        return today
+    if timeframe == 'weekly':
+        return today - timedelta(days=6)
+    if timeframe == 'monthly':
+        return today - timedelta(days=29)
+    if timeframe == 'yearly':
+        return date(today.year, 1, 1)
+    return None
+
+
+def sum_buckets(rows: Iterable[Dict[str, Any]]) -> WindowTotals:
+    """Add capper_daily_stats rows (raw buckets or per-user SUMs) up per user."""
+    totals: WindowTotals = {}
+    for row in rows:
+        user = totals.setdefault(int(row['user_id']), {
+            'wins': 0, 'losses': 0, 'pushes': 0, 'units_risked': 0.0, 'net_units': 0.0
+        })
+        user['wins'] += int(row.get('wins') or 0)
+        user['losses'] += int(row.get('losses') or 0)
+        user['pushes'] += int(row.get('pushes') or 0)
+        user['units_risked'] += float(row.get('units_risked') or 0)
+        user['net_units'] += float(row.get('net_units') or 0)
+    return totals
+
+
+def _ranking_key(metric: str) -> Callable[[Tuple[int, Dict[str, float]]], tuple]:
+    """Sort key (higher ranks first) matching the old ORDER BY clauses for each metric."""
+    if metric == 'roi':
+        return lambda item: (
+            item[1]['net_units'] / item[1]['units_risked'] if item[1]['units_risked'] > 0 else -999999,
+            item[1]['net_units']
+        )
+    if metric == 'win_rate':
+        return lambda item: (
+            item[1]['wins'] / (item[1]['wins'] + item[1]['losses']) if (item[1]['wins'] + item[1]['losses']) > 0 else -1,
+            item[1]['wins']
+        )
+    if metric == 'wins':
+        return lambda item: (item[1]['wins'],)
+    return lambda item: (item[1]['net_units'],)
+
+
+def top_n(totals: WindowTotals, metric: str = 'net_units', limit: int = 10) -> List[Dict[str, Any]]:
+    """The `limit` best users by `metric`, as leaderboard rows (without usernames)."""
+    if metric not in METRICS:
+        logger.warning("Invalid leaderboard metric '%s', defaulting to net_units.", metric)
+        metric = 'net_units'
+    candidates = ((user_id, stats) for user_id, stats in totals.items()
+                  if stats['wins'] + stats['losses'] + stats['pushes'] > 0)
+    ranked = heapq.nlargest(max(0, limit), candidates, key=_ranking_key(metric))
+
+    rows = []
+    for user_id, stats in ranked:
+        decided = stats['wins'] + stats['losses']
+        rows.append({
+            'user_id': user_id,
+            'total_resolved_bets': stats['wins'] + stats['losses'] + stats['pushes'],
+            'wins': stats['wins'],
+            'losses': stats['losses'],
+            'net_units': stats['net_units'],
+            'total_risked': stats['units_risked'],
+            'win_rate': (stats['wins'] * 100.0 / decided) if decided > 0 else 0.0,
+            'roi': (stats['net_units'] / stats['units_risked'] * 100.0) if stats['units_risked'] > 0 else 0.0,
+        })
+    return rows
+
+
+class LeaderboardWindowCache:
+    """
+    Per-guild cache of summed window totals, keyed by (guild_id, timeframe, start day).
+
+    Any metric or limit is ranked from the same cached totals. Entries expire
+    after `ttl` seconds and are dropped by invalidate() when a bet in the guild
+    resolves. Each guild has a generation counter: a load that started before
+    an invalidation must not be stored (see begin_load()/store()), otherwise a
+    resolution committed during the load could be missing until the TTL ends.
+    """
+
+    def __init__(self, ttl: float = LEADERBOARD_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[int, str, Optional[date]], Tuple[float, WindowTotals]] = {}
+        self._generations: Dict[int, int] = {}
+
+    def get(self, guild_id: int, timeframe: str, start: Optional[date]) -> Optional[WindowTotals]:
+        entry = self._entries.get((guild_id, timeframe, start))
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl:
+            del self._entries[(guild_id, timeframe, start)]
+            return None
+        return entry[1]
+
+    def begin_load(self, guild_id: int) -> int:
+        """Generation to hand back to store() once the buckets have been read."""
+        # Registered so clear() can bump it while the load is in flight
+        return self._generations.setdefault(guild_id, 0)
+
+    def store(self, guild_id: int, timeframe: str, start: Optional[date], totals: WindowTotals, generation: int):
+        if self._generations.get(guild_id, 0) != generation:
+            logger.debug(f"Not caching {timeframe} leaderboard for guild {guild_id}: a bet resolved during the load.")
+            return
+        now = time.monotonic()
+        # Windows slide daily, so keys for earlier start days are never asked for again
+        for key in [key for key, (stored_at, _) in self._entries.items() if now - stored_at > self.ttl]:
+            del self._entries[key]
+        self._entries[(guild_id, timeframe, start)] = (now, totals)
+
+    def invalidate(self, guild_id: int):
+        """Forget every window of a guild (call after a bet in it resolves or is deleted)."""
+        self._generations[guild_id] = self._generations.get(guild_id, 0) + 1
+        for key in [key for key in self._entries if key[0] == guild_id]:
+            del self._entries[key]
+
+    def clear(self):
+        """Forget every window (e.g. after a full rebuild); loads already in flight are not stored."""
+        for guild_id in self._generations:
+            self._generations[guild_id] += 1
+        self._entries.clear()
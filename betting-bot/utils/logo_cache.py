@@ -0,0 +1,123 @@
+# betting-bot/utils/logo_cache.py
+
+"""Process-wide cache of decoded, pre-resized logo images."""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from config.settings import LOGO_CACHE_MAX_ENTRIES, LOGO_VARIANT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# (absolute path, target size or None, source mtime_ns)
+LogoKey = Tuple[str, Optional[Tuple[int, int]], int]
+
+
+class LogoCache:
+    """
+    LRU of RGBA logo images keyed by (path, target size, mtime).
+
+    Images are stored already resized, so a render only pastes them. Keying on
+    the source file's mtime means a replaced logo is picked up on the next
+    lookup. When `variant_dir` is set, each resized variant is also written
+    there as a PNG and reused after restarts, skipping the decode + LANCZOS
+    resample of the original.
+
+    Returned images are shared between callers and must be treated as
+    read-only (paste them, do not draw on or close them). Lookups are
+    thread-safe, as slips are rendered from a worker pool.
+    """
+
+    def __init__(self, max_entries: int = LOGO_CACHE_MAX_ENTRIES, variant_dir: Optional[str] = LOGO_VARIANT_CACHE_DIR):
+        self.max_entries = max(1, max_entries)
+        self.variant_dir = variant_dir
+        self._images: "OrderedDict[LogoKey, Image.Image]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.variant_dir:
+            try:
+                os.makedirs(self.variant_dir, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Cannot create logo variant directory {self.variant_dir}: {e}. Disk tier disabled.")
+                self.variant_dir = None
+
+    def get(self, path: Optional[str], size: Optional[Tuple[int, int]] = None) -> Optional[Image.Image]:
+        """Return the logo at `path` as RGBA, resized to `size` if given, or None if unreadable."""
+        if not path:
+            return None
+        abs_path = os.path.abspath(path)
+        try:
+            mtime_ns = os.stat(abs_path).st_mtime_ns
+        except OSError:
+            return None
+        size = tuple(size) if size else None
+        key = (abs_path, size, mtime_ns)
+
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+
+        image = self._load_variant(key)
+        if image is None:
+            return None
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+        return image
+
+    def clear(self):
+        """Drop all in-memory entries (disk variants are left in place)."""
+        with self._lock:
+            self._images.clear()
+
+    def _variant_path(self, key: LogoKey) -> str:
+        abs_path, size, mtime_ns = key
+        digest = hashlib.blake2b(abs_path.encode("utf-8"), digest_size=10).hexdigest()
+        size_part = f"{size[0]}x{size[1]}" if size else "orig"
+        return os.path.join(self.variant_dir, f"{digest}_{size_part}_{mtime_ns}.png")
+
+    def _load_variant(self, key: LogoKey) -> Optional[Image.Image]:
+        """Load a resized variant from the disk tier, or build it from the source file."""
+        abs_path, size, _ = key
+        variant_path = self._variant_path(key) if self.variant_dir and size else None
+        if variant_path and os.path.exists(variant_path):
+            try:
+                with Image.open(variant_path) as stored:
+                    return stored.convert("RGBA")
+            except Exception as e:
+                logger.warning(f"Discarding unreadable logo variant {variant_path}: {e}")
+
+        try:
+            with Image.open(abs_path) as source:
+                image = source.convert("RGBA")
+            if size and image.size != size:
+                image = image.resize(size, Image.Resampling.LANCZOS)
+        except Exception as e:
+            logger.error(f"Error opening logo {abs_path}: {e}")
+            return None
+
+        if variant_path:
+            tmp_path = f"{variant_path}.{threading.get_ident()}.tmp"
+            try:
+                image.save(tmp_path, format="PNG")
+                os.replace(tmp_path, variant_path)
+            except Exception as e:
+                logger.warning(f"Could not store logo variant {variant_path}: {e}")
+        return image
+
+
+# Shared by every BetSlipGenerator in this process
+LOGO_CACHE = LogoCache()
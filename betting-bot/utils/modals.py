@@ -180,16 +180,15 @@ class StraightBetDetailsModal(Modal):
                 display_home = self.view_ref.bet_details.get("home_team_name", team_input)
                 display_away = self.view_ref.bet_details.get("away_team_name", "N/A")
 
-            bet_slip_image = await bet_slip_generator.generate_bet_slip(
+            slip_bytes = await bet_slip_generator.generate_bet_slip_bytes(
                 home_team=display_home, away_team=display_away,
                 league=self.view_ref.league, line=line_value, odds=odds_val, units=current_units,
                 bet_id=self.view_ref.bet_id, timestamp=datetime.now(timezone.utc),
-                bet_type=self.view_ref.bet_details.get("line_type", "straight")
+                bet_type=self.view_ref.bet_details.get("line_type", "straight"),
+                guild_id=self.view_ref.original_interaction.guild_id
             )
-            if bet_slip_image:
-                self.view_ref.preview_image_bytes = io.BytesIO()
-                bet_slip_image.save(self.view_ref.preview_image_bytes, format='PNG')
-                self.view_ref.preview_image_bytes.seek(0)
+            if slip_bytes:
+                self.view_ref.preview_image_bytes = io.BytesIO(slip_bytes)
             else: self.view_ref.preview_image_bytes = None
 
             # The parent view (self.view_ref) will handle editing the message.
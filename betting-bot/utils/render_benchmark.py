@@ -0,0 +1,281 @@
+# render_benchmark.py
+"""
+Rendering benchmark for bet slips and stats images.
+
+Renders straight slips, parlays with 2-12 legs (with and without a guild
+background) and the StatsImageGenerator images using the bundled fonts and
+logos. No Discord connection or MySQL server is needed: the generator is
+given a stub db_manager that only answers the guild_background lookup.
+
+Each scenario runs in its own child process, so every first render is
+cold and the reported peak RSS belongs to that scenario alone. For every
+scenario it reports the first (cold-cache) render, p50/p95/mean latency of
+the following renders, encoded payload size and the child's peak RSS, and
+writes everything to JSON so runs can be compared across commits:
+
+    python utils/render_benchmark.py --iterations 30
+    python utils/render_benchmark.py --compare data/benchmarks/render_<old>.json
+"""
+import sys
+import os
+
+# --- Path Setup ---
+# SCRIPT_DIR is betting-bot/utils/, BASE_DIR is the betting-bot root
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(SCRIPT_DIR)
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import PIL
+from PIL import Image
+
+from config.settings import SLIP_IMAGE_FORMAT
+from utils.image_generator import BetSlipGenerator, encode_slip_image
+from utils.stats_image_generator import StatsImageGenerator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, "data", "benchmarks")
+PARLAY_LEG_COUNTS = (2, 4, 6, 8, 10, 12)
+NO_BACKGROUND_GUILD = 1
+BACKGROUND_GUILD = 2
+
+# (team, opponent) pairs with bundled NFL logos
+NFL_MATCHUPS = [
+    ("Buffalo Bills", "Baltimore Ravens"),
+    ("Arizona Cardinals", "Atlanta Falcons"),
+    ("Carolina Panthers", "Buffalo Bills"),
+    ("Baltimore Ravens", "Arizona Cardinals"),
+]
+
+
+class StubDatabaseManager:
+    """Stands in for DatabaseManager; only answers `SELECT guild_background ...` lookups."""
+
+    def __init__(self, guild_backgrounds: Dict[int, Optional[str]]):
+        self.guild_backgrounds = guild_backgrounds
+
+    async def fetch_one(self, query: str, *args) -> Optional[Dict[str, Any]]:
+        params = args[0] if len(args) == 1 and isinstance(args[0], (tuple, list)) else args
+        guild_id = params[0] if params else None
+        if "guild_background" in query:
+            return {"guild_background": self.guild_backgrounds.get(guild_id)}
+        return None
+
+    async def fetch_all(self, query: str, *args) -> List[Dict[str, Any]]:
+        return []
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def _peak_rss_kb() -> int:
+    """Peak RSS of the whole (child) process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=BASE_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def _make_background(directory: str) -> str:
+    """A large, noisy RGBA image so the background pass costs what a real photo would."""
+    path = os.path.join(directory, "bench_background.png")
+    noise = Image.effect_noise((1600, 900), 64)
+    Image.merge("RGBA", (noise, noise.rotate(180), noise.transpose(Image.Transpose.FLIP_LEFT_RIGHT), Image.new("L", noise.size, 255))).save(path)
+    return path
+
+
+def _time_scenario(render: Callable[[int], bytes], iterations: int) -> Dict[str, Any]:
+    """Run `render(i)` once cold and `iterations` more times; return latency/size figures in ms/bytes."""
+    started = time.perf_counter()
+    payload = render(0)
+    cold_ms = (time.perf_counter() - started) * 1000
+
+    timings = []
+    for i in range(1, iterations + 1):
+        started = time.perf_counter()
+        payload = render(i)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "cold_ms": round(cold_ms, 3),
+        "p50_ms": round(_percentile(timings, 50), 3),
+        "p95_ms": round(_percentile(timings, 95), 3),
+        "mean_ms": round(sum(timings) / len(timings), 3) if timings else 0.0,
+        "bytes": len(payload or b""),
+    }
+
+
+def _scenario_names() -> List[str]:
+    names = []
+    for suffix in ("plain", "background"):
+        names.append(f"straight_{suffix}")
+        names.extend(f"parlay_{legs_count}_legs_{suffix}" for legs_count in PARLAY_LEG_COUNTS)
+    return names + ["stats_capper", "stats_guild", "stats_top_cappers"]
+
+
+def _slip_scenarios(generator: BetSlipGenerator, wanted: List[str]) -> Dict[str, Callable[[int], bytes]]:
+    """Build the slip scenarios named in `wanted` (specs are only prepared for those)."""
+    scenarios: Dict[str, Callable[[int], bytes]] = {}
+    timestamp = datetime(2024, 1, 1, 18, 30, tzinfo=timezone.utc)
+
+    for guild_id, suffix in ((NO_BACKGROUND_GUILD, "plain"), (BACKGROUND_GUILD, "background")):
+        home, away = NFL_MATCHUPS[0]
+        if f"straight_{suffix}" in wanted:
+            straight_spec = asyncio.run(generator.build_slip_spec(
+                home_team=home, away_team=away, league="NFL", odds=-110, units=1.0,
+                bet_id="1000", timestamp=timestamp, bet_type="game_line", line=f"{home} -3.5", guild_id=guild_id
+            ))
+
+            def render_straight(i: int, generator=generator, spec=straight_spec) -> bytes:
+                return generator.render_bet_slip_bytes({**spec, "bet_id": str(1000 + i), "units": 1.0 + (i % 3)})
+
+            scenarios[f"straight_{suffix}"] = render_straight
+
+        for legs_count in PARLAY_LEG_COUNTS:
+            if f"parlay_{legs_count}_legs_{suffix}" not in wanted:
+                continue
+            legs, logo_paths = [], []
+            for n in range(legs_count):
+                team, opponent = NFL_MATCHUPS[n % len(NFL_MATCHUPS)]
+                legs.append({"team": team, "opponent": opponent, "line": f"ML {n}", "league": "NFL"})
+                logo_paths.append(generator._team_logo_path(team, "NFL") or generator.DEFAULT_LOGO_PATH)
+            parlay_spec = asyncio.run(generator.build_slip_spec(
+                home_team="Multi-Game", away_team="Parlay", league="Parlay", odds=450, units=1.0,
+                bet_id="2000", timestamp=timestamp, bet_type="parlay", parlay_legs=legs,
+                team_logo_paths=logo_paths, guild_id=guild_id
+            ))
+
+            def render_parlay(i: int, generator=generator, spec=parlay_spec) -> bytes:
+                return generator.render_bet_slip_bytes({**spec, "bet_id": str(2000 + i), "units": 1.0 + (i % 3)})
+
+            scenarios[f"parlay_{legs_count}_legs_{suffix}"] = render_parlay
+    return scenarios
+
+
+def _stats_scenarios() -> Dict[str, Callable[[int], bytes]]:
+    stats_generator = StatsImageGenerator()
+    capper_stats = {"total_bets": 120, "won_bets": 66, "lost_bets": 50, "win_percentage": 56.9, "total_units": 140.5, "net_units": 12.25}
+    guild_stats = {"total_bets": 4800, "total_cappers": 35, "total_units": 6200.0, "net_units": -48.5}
+    top_cappers = [{"user_id": 100000000000000000 + n, "net_units": round(25 - n * 2.5, 2)} for n in range(8)]
+    return {
+        "stats_capper": lambda i: encode_slip_image(stats_generator.generate_capper_stats_image(capper_stats, f"capper{i}"))[0],
+        "stats_guild": lambda i: encode_slip_image(stats_generator.generate_guild_stats_image(guild_stats))[0],
+        "stats_top_cappers": lambda i: encode_slip_image(stats_generator.generate_top_cappers_image(top_cappers))[0],
+    }
+
+
+def _run_scenario(name: str, iterations: int) -> Dict[str, Any]:
+    """Child-process entry point: build and time one scenario, then report this process's peak RSS."""
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - BENCH - %(levelname)s - %(message)s')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if name.startswith("stats_"):
+            render = _stats_scenarios()[name]
+        else:
+            background = _make_background(tmp_dir) if name.endswith("_background") else None
+            stub_db = StubDatabaseManager({NO_BACKGROUND_GUILD: None, BACKGROUND_GUILD: background})
+            render = _slip_scenarios(BetSlipGenerator(db_manager=stub_db), [name])[name]
+        result = _time_scenario(render, iterations)
+    result["peak_rss_kb"] = _peak_rss_kb()
+    return result
+
+
+def run_benchmarks(iterations: int, only: Optional[str] = None) -> Dict[str, Any]:
+    # A fresh spawned process per scenario: ru_maxrss only ever grows within a process
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name in _scenario_names():
+        if only and only not in name:
+            continue
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[name] = executor.submit(_run_scenario, name, iterations).result()
+        print(
+            f"{name:<32} cold {results[name]['cold_ms']:>8.1f} ms  p50 {results[name]['p50_ms']:>7.1f} ms  "
+            f"p95 {results[name]['p95_ms']:>7.1f} ms  {results[name]['bytes'] / 1024:>7.1f} KB  "
+            f"rss {results[name]['peak_rss_kb'] / 1024:>6.1f} MB"
+        )
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "pillow": PIL.__version__,
+            "image_format": SLIP_IMAGE_FORMAT,
+            "iterations": iterations,
+        },
+        "scenarios": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print p50/p95/size changes of `current` relative to `baseline`."""
+    print(f"\nCompared with {baseline['meta'].get('git_commit') or 'baseline'}:")
+    for name, now in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        deltas = []
+        for metric in ("p50_ms", "p95_ms", "bytes"):
+            if before.get(metric):
+                deltas.append(f"{metric} {(now[metric] - before[metric]) / before[metric] * 100:+.1f}%")
+        print(f"{name:<32} " + "  ".join(deltas))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark bet slip and stats image rendering.")
+    parser.add_argument("--iterations", type=int, default=20, help="warm renders per scenario (after one cold render)")
+    parser.add_argument("--only", help="run only scenarios whose name contains this text")
+    parser.add_argument("--output", help="JSON results path (default: data/benchmarks/render_<commit>.json)")
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - BENCH - %(levelname)s - %(message)s')
+    results = run_benchmarks(max(1, args.iterations), args.only)
+
+    output = args.output
+    if not output:
+        commit = (results["meta"]["git_commit"] or "local")[:10]
+        output = os.path.join(DEFAULT_OUTPUT_DIR, f"render_{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+# betting-bot/utils/single_flight.py
+
+"""Request coalescing for concurrent identical async reads."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Ensures only one call per key is in flight at a time.
+
+    Concurrent callers of `do()` with the same key await the same task and share
+    its result (or exception). The shared task is shielded, so a caller being
+    cancelled does not cancel the work for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `loader()` for `key`, or join the call already running for it."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._release(k, t))
+        else:
+            logger.debug(f"Joining in-flight call for {key}")
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved if every waiter went away
+            task.exception()
+
+    def forget_all(self):
+        """Detach in-flight calls so later callers start fresh ones (e.g. after a write)."""
+        self._inflight.clear()
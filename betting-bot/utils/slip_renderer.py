@@ -0,0 +1,136 @@
+# betting-bot/utils/slip_renderer.py
+
+"""Bet slip rendering off the event loop in a bounded worker pool."""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from config.settings import (
+    SLIP_RENDER_WORKERS, SLIP_RENDER_USE_PROCESSES,
+    SLIP_RENDER_MAX_PENDING, SLIP_RENDER_TIMEOUT, SLIP_IMAGE_FORMAT
+)
+from utils.image_generator import BetSlipGenerator
+
+logger = logging.getLogger(__name__)
+
+# One generator per worker process (or shared by the worker threads), so fonts
+# and logo caches are loaded once per worker rather than per slip.
+_worker_generator: Optional[BetSlipGenerator] = None
+
+
+def _render_in_worker(spec: Dict[str, Any]) -> Optional[Tuple[bytes, float]]:
+    """Executor entry point: draw and encode one slip spec, returning (payload, encode seconds)."""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = BetSlipGenerator()
+    return _worker_generator.render_bet_slip_encoded(spec)
+
+
+class SlipRenderService:
+    """
+    Renders slip specs (see BetSlipGenerator.build_slip_spec) to encoded bytes
+    in a ThreadPoolExecutor or ProcessPoolExecutor.
+
+    At most `max_pending` renders are queued or running at once; further
+    requests are rejected immediately instead of piling up behind a burst of
+    parlays. A caller stops waiting after `timeout` seconds, but a render that
+    is already running keeps its slot until the worker actually finishes it.
+
+    Totals for completed renders (count, wall time, encode time and payload
+    bytes) are kept in `stats` for logging and benchmarks.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = SLIP_RENDER_WORKERS,
+        use_processes: bool = SLIP_RENDER_USE_PROCESSES,
+        max_pending: int = SLIP_RENDER_MAX_PENDING,
+        timeout: float = SLIP_RENDER_TIMEOUT
+    ):
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self.max_pending = max(1, max_pending)
+        self.timeout = timeout
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self.stats: Dict[str, Any] = {
+            'format': SLIP_IMAGE_FORMAT, 'renders': 0, 'failures': 0, 'rejected': 0,
+            'render_seconds': 0.0, 'encode_seconds': 0.0, 'bytes': 0, 'last_bytes': 0
+        }
+
+    async def start(self):
+        """Create the worker pool."""
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="slip-render")
+            logger.info(
+                f"SlipRenderService started with {self.max_workers} "
+                f"{'processes' if self.use_processes else 'threads'}."
+            )
+
+    async def stop(self):
+        """Shut the worker pool down, dropping renders that have not started."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+            logger.info("SlipRenderService stopped.")
+
+    async def render(self, spec: Dict[str, Any]) -> Optional[bytes]:
+        """Render a slip spec to encoded bytes, or None if rejected, timed out or failed."""
+        if self._pending >= self.max_pending:
+            logger.warning(f"Slip render queue full ({self._pending} pending); rejecting bet {spec.get('bet_id')}.")
+            self.stats['rejected'] += 1
+            return None
+        if self._executor is None:
+            await self.start()
+        loop = asyncio.get_running_loop()
+        try:
+            work = self._executor.submit(_render_in_worker, spec)
+        except Exception as e:
+            logger.error(f"Could not queue slip render for bet {spec.get('bet_id')}: {e}")
+            self.stats['failures'] += 1
+            return None
+        # Free the slot when the worker is done with it, not when the caller gives up
+        self._pending += 1
+        work.add_done_callback(lambda _: self._release_from_worker(loop))
+        started = time.perf_counter()
+        try:
+            encoded = await asyncio.wait_for(asyncio.wrap_future(work), self.timeout)
+            if encoded is None:
+                self.stats['failures'] += 1
+                return None
+            data, encode_seconds = encoded
+            self._record(data, encode_seconds, time.perf_counter() - started, spec.get('bet_id'))
+            return data
+        except asyncio.TimeoutError:
+            logger.error(f"Rendering slip for bet {spec.get('bet_id')} timed out after {self.timeout}s.")
+        except Exception as e:
+            logger.error(f"Error rendering slip for bet {spec.get('bet_id')}: {e}", exc_info=True)
+        self.stats['failures'] += 1
+        return None
+
+    def _release_from_worker(self, loop: asyncio.AbstractEventLoop):
+        """Done callback of a render future (runs in the worker or executor thread)."""
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            pass  # Event loop already closed during shutdown
+
+    def _release(self):
+        self._pending -= 1
+
+    def _record(self, data: bytes, encode_seconds: float, render_seconds: float, bet_id: Any):
+        self.stats['renders'] += 1
+        self.stats['render_seconds'] += render_seconds
+        self.stats['encode_seconds'] += encode_seconds
+        self.stats['bytes'] += len(data)
+        self.stats['last_bytes'] = len(data)
+        logger.info(
+            f"Rendered slip for bet {bet_id}: {len(data) / 1024:.1f} KB {self.stats['format']}, "
+            f"encode {encode_seconds * 1000:.1f} ms, total {render_seconds * 1000:.1f} ms"
+        )
@@ -0,0 +1,7 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# The bot's modules import each other as top-level packages (config, api, utils, ...)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "betting-bot"))
@@ -0,0 +1,56 @@
+# tests/test_json_stream.py
+
+import io
+import json
+
+import pytest
+
+from api.json_stream import iter_array_items, iter_batches
+
+
+class ChunkedReader(io.StringIO):
+    """StringIO that never returns more than `limit` characters per read."""
+
+    def __init__(self, text: str, limit: int):
+        super().__init__(text)
+        self.limit = limit
+
+    def read(self, size: int = -1) -> str:
+        return super().read(self.limit if size < 0 else min(size, self.limit))
+
+
+DOCUMENT = '{"events": [4500.25, -1.5e10, 7]}'
+
+
+@pytest.mark.parametrize("pad", range(12))
+@pytest.mark.parametrize("chunk_size", range(1, 11))
+def test_numbers_split_at_chunk_boundaries(pad, chunk_size):
+    text = " " * pad + DOCUMENT
+    items = list(iter_array_items(io.StringIO(text), "events", chunk_size=chunk_size))
+    assert items == [4500.25, -1.5e10, 7]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 13, 64])
+def test_mixed_elements_survive_any_chunking(chunk_size):
+    events = [
+        {"idEvent": "1", "intHomeScore": None, "strEvent": "A, B ]"},
+        -0.5, 1e-3, 12345678901234, True, False, None, "x", [], {},
+        {"nested": [1, 2.5, {"k": "v"}]},
+    ]
+    text = json.dumps({"meta": {"events": 1}, "events": events}, indent=1)
+    reader = ChunkedReader(text, chunk_size)
+    assert list(iter_array_items(reader, "events", chunk_size=chunk_size)) == events
+
+
+def test_null_or_missing_array_yields_nothing():
+    assert list(iter_array_items(io.StringIO('{"events": null}'), "events")) == []
+    assert list(iter_array_items(io.StringIO('{"other": [1]}'), "events")) == []
+
+
+def test_truncated_array_raises():
+    with pytest.raises(ValueError):
+        list(iter_array_items(io.StringIO('{"events": [1, 2'), "events", chunk_size=4))
+
+
+def test_iter_batches():
+    assert list(iter_batches(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
@@ -0,0 +1,36 @@
+# tests/test_team_mappings.py
+
+import pytest
+
+from config.team_mappings import TEAM_MAPPINGS, normalize_team_name, resolve_team
+
+
+@pytest.mark.parametrize("name, league, expected", [
+    ("Spurs", "NBA", "san_antonio_spurs"),
+    ("Memphis", "NBA", "memphis_grizzlies"),
+    ("Colorado", "NHL", "colorado_avalanche"),
+    ("Bears", "NFL", "chicago_bears"),
+    ("Bears", "NCAAF", "baylor_bears"),
+    ("Cardinals", "NFL", "arizona_cardinals"),
+    ("Cardinals", "MLB", "st_louis_cardinals"),
+])
+def test_exact_league_label_picks_the_team(name, league, expected):
+    resolution = resolve_team(name, league)
+    assert resolution.identifier == expected
+    assert resolution.league == league
+    assert normalize_team_name(name, league) == expected
+
+
+def test_without_league_the_mapping_entry_wins():
+    assert normalize_team_name("Cardinals") == TEAM_MAPPINGS["Cardinals"]
+    assert resolve_team("Tigers").identifier == TEAM_MAPPINGS["Tigers"]
+
+
+@pytest.mark.parametrize("league", ["NFL", "NBA", "MLB", "NHL", "NCAAF", "NCAAB"])
+def test_mapped_names_always_resolve_to_a_known_team(league):
+    unresolved = []
+    for name in TEAM_MAPPINGS:
+        resolution = resolve_team(name, league)
+        if resolution.identifier not in dict(resolution.candidates):
+            unresolved.append((name, resolution.identifier))
+    assert unresolved == []